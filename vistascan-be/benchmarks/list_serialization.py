@@ -0,0 +1,131 @@
+"""
+Consultation list serialization benchmark.
+
+Serves the same list of consultations through two in-process routes: one building each nested DTO with its
+own constructor and returning them through response_model, as list endpoints used to, and one mapping with
+to_consultation_dto and returning a DTOResponse. Reports rows per second for each and checks both payloads
+are identical.
+
+    cd vistascan-be
+    python benchmarks/list_serialization.py --rows 1000 --rounds 20
+"""
+import argparse
+import asyncio
+import os
+import sys
+import time
+from datetime import date, datetime, timedelta
+from pathlib import Path
+from typing import List
+from uuid import uuid4
+
+import httpx
+import orjson
+from fastapi import FastAPI
+
+SRC_DIR = Path(__file__).resolve().parent.parent / "src"
+sys.path.insert(0, str(SRC_DIR))
+os.environ.setdefault("JWT_SECRET", "benchmark-secret")
+
+from domain.entities.consultation import Consultation
+from domain.entities.report import Report
+from domain.entities.study import ImagingStudy, StudyMetadata
+from application.dto.consultation_dto import ConsultationDTO, ImagingStudyDTO, ReportDTO, to_consultation_dto
+from api.rest.responses import DTOResponse
+
+
+def make_consultations(rows: int) -> List[Consultation]:
+    now = datetime.now()
+    consultations = []
+    for index in range(rows):
+        consultation = Consultation(
+            patient_id=uuid4(),
+            imaging_study=ImagingStudy(
+                file_path=f"patients/{index}/study.dcm", file_name="study.dcm", content_type="application/dicom",
+                size=2_000_000 + index, upload_date=now - timedelta(minutes=index),
+                metadata=StudyMetadata(modality="CR", body_part="CHEST", rows=2048, columns=2048,
+                                       study_date=date(2025, 1, 1) + timedelta(days=index % 365)),
+            ),
+            created_at=now - timedelta(minutes=index),
+        )
+        if index % 2:
+            consultation.assign_to_expert(uuid4())
+        if index % 4 == 3:
+            consultation.annotate(Report(content="No acute cardiopulmonary findings. " * 8, created_at=now,
+                                         expert_id=consultation.expert_id, consultation_id=consultation.id))
+        consultations.append(consultation)
+    return consultations
+
+
+def legacy_dto(consultation: Consultation) -> ConsultationDTO:
+    """The per-row mapping list endpoints did before to_consultation_dto."""
+    report_dto = None
+    if consultation.report:
+        report_dto = ReportDTO(
+            content=consultation.report.content,
+            created_at=consultation.report.created_at,
+            expert_id=consultation.report.expert_id,
+            consultation_id=consultation.report.consultation_id
+        )
+
+    return ConsultationDTO(
+        id=consultation.id,
+        patient_id=consultation.patient_id,
+        imaging_study=ImagingStudyDTO(
+            file_path=consultation.imaging_study.file_path,
+            file_name=consultation.imaging_study.file_name,
+            content_type=consultation.imaging_study.content_type,
+            size=consultation.imaging_study.size,
+            upload_date=consultation.imaging_study.upload_date,
+            metadata=consultation.imaging_study.metadata,
+        ),
+        status=consultation.status,
+        created_at=consultation.created_at,
+        report=report_dto,
+        expert_id=str(consultation.expert_id) if consultation.expert_id else None,
+        completed_at=consultation.completed_at,
+        download_url=f"http://minio/{consultation.imaging_study.file_path}",
+    )
+
+
+def create_app(consultations: List[Consultation]) -> FastAPI:
+    app = FastAPI()
+
+    @app.get("/legacy", response_model=List[ConsultationDTO])
+    async def legacy():
+        return [legacy_dto(consultation) for consultation in consultations]
+
+    @app.get("/mapped", response_model=List[ConsultationDTO])
+    async def mapped():
+        return DTOResponse([
+            to_consultation_dto(consultation, f"http://minio/{consultation.imaging_study.file_path}")
+            for consultation in consultations
+        ])
+
+    return app
+
+
+async def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--rows", type=int, default=1000)
+    parser.add_argument("--rounds", type=int, default=20)
+    args = parser.parse_args()
+
+    app = create_app(make_consultations(args.rows))
+    async with httpx.AsyncClient(transport=httpx.ASGITransport(app=app), base_url="http://bench") as client:
+        payloads = {}
+        for path in ("/legacy", "/mapped"):
+            payloads[path] = (await client.get(path)).content
+            started = time.perf_counter()
+            for _ in range(args.rounds):
+                (await client.get(path)).raise_for_status()
+            elapsed = time.perf_counter() - started
+            print(f"{path:<14} {args.rows * args.rounds / elapsed:10.0f} rows/s  "
+                  f"{elapsed / args.rounds * 1000:7.1f} ms per {args.rows}-row list")
+
+    identical = orjson.loads(payloads["/legacy"]) == orjson.loads(payloads["/mapped"])
+    print(f"payloads identical: {identical}")
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
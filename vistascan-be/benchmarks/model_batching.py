@@ -0,0 +1,91 @@
+"""
+Model service micro-batching benchmark.
+
+Starts the stub model server in-process and sends bursts of concurrent generate_report calls through
+the plain ModelServiceClient and through BatchingModelClient, reporting throughput, latency and how
+many model calls each needed.
+
+    cd vistascan-be
+    python benchmarks/model_batching.py --requests 64 --concurrency 32
+"""
+import argparse
+import asyncio
+import io
+import os
+import sys
+import time
+from pathlib import Path
+
+import uvicorn
+
+SRC_DIR = Path(__file__).resolve().parent.parent / "src"
+sys.path.insert(0, str(SRC_DIR))
+sys.path.insert(0, str(Path(__file__).resolve().parent))
+os.environ.setdefault("JWT_SECRET", "benchmark-secret")
+
+from stub_model_server import create_app
+from infrastructure.model.model_service import ModelServiceClient
+from infrastructure.model.batching import BatchingModelClient
+
+
+def percentile(values, pct):
+    ordered = sorted(values)
+    return ordered[min(len(ordered) - 1, max(0, round(pct / 100 * len(ordered)) - 1))]
+
+
+async def run_load(client, requests, concurrency):
+    semaphore = asyncio.Semaphore(concurrency)
+    latencies = []
+    failures = 0
+
+    async def one(index):
+        nonlocal failures
+        async with semaphore:
+            started = time.perf_counter()
+            result = await client.generate_report(io.BytesIO(os.urandom(64 * 1024)), f"study-{index}.jpg")
+            latencies.append(time.perf_counter() - started)
+            failures += not result.success
+
+    started = time.perf_counter()
+    await asyncio.gather(*(one(index) for index in range(requests)))
+    return time.perf_counter() - started, latencies, failures
+
+
+async def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--requests", type=int, default=64)
+    parser.add_argument("--concurrency", type=int, default=32)
+    parser.add_argument("--batch-size", type=int, default=8)
+    parser.add_argument("--max-wait", type=float, default=0.02)
+    parser.add_argument("--overhead", type=float, default=0.2)
+    parser.add_argument("--per-image", type=float, default=0.02)
+    parser.add_argument("--port", type=int, default=8931)
+    args = parser.parse_args()
+
+    stub = create_app(args.overhead, args.per_image)
+    server = uvicorn.Server(uvicorn.Config(stub, host="127.0.0.1", port=args.port, log_level="warning"))
+    server_task = asyncio.create_task(server.serve())
+    while not server.started:
+        await asyncio.sleep(0.05)
+
+    base = ModelServiceClient(f"http://127.0.0.1:{args.port}", max_connections=args.concurrency,
+                              max_keepalive_connections=args.concurrency)
+    clients = [
+        ("single", base),
+        (f"batched x{args.batch_size}", BatchingModelClient(base, max_batch_size=args.batch_size, max_wait=args.max_wait)),
+    ]
+
+    for name, client in clients:
+        calls_before = stub.state.calls
+        elapsed, latencies, failures = await run_load(client, args.requests, args.concurrency)
+        print(f"{name:<14} {args.requests / elapsed:7.1f} req/s  "
+              f"p50 {percentile(latencies, 50) * 1000:7.1f} ms  p99 {percentile(latencies, 99) * 1000:7.1f} ms  "
+              f"{stub.state.calls - calls_before} model calls  {failures} failures")
+
+    await base.aclose()
+    server.should_exit = True
+    await server_task
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
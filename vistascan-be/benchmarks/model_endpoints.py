@@ -0,0 +1,69 @@
+"""
+Model service load-balancing benchmark.
+
+Starts several stub model servers in-process, the last one slower than the rest, and sends the same
+burst of generate_report calls through a client pointed at one endpoint and at the whole pool with
+each balancing strategy, reporting throughput, latency and how requests were spread.
+
+    cd vistascan-be
+    python benchmarks/model_endpoints.py --endpoints 3 --requests 96 --concurrency 24
+"""
+import argparse
+import asyncio
+import os
+import sys
+from pathlib import Path
+
+import uvicorn
+
+SRC_DIR = Path(__file__).resolve().parent.parent / "src"
+sys.path.insert(0, str(SRC_DIR))
+sys.path.insert(0, str(Path(__file__).resolve().parent))
+os.environ.setdefault("JWT_SECRET", "benchmark-secret")
+
+from stub_model_server import create_app
+from model_batching import percentile, run_load
+from infrastructure.model.endpoints import BalancingStrategy
+from infrastructure.model.model_service import ModelServiceClient
+
+
+async def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--endpoints", type=int, default=3)
+    parser.add_argument("--requests", type=int, default=96)
+    parser.add_argument("--concurrency", type=int, default=24)
+    parser.add_argument("--overhead", type=float, default=0.05)
+    parser.add_argument("--slowdown", type=float, default=3.0, help="How much slower the last endpoint is")
+    parser.add_argument("--port", type=int, default=8941)
+    args = parser.parse_args()
+
+    servers = []
+    for index in range(args.endpoints):
+        overhead = args.overhead * (args.slowdown if index == args.endpoints - 1 else 1)
+        server = uvicorn.Server(uvicorn.Config(create_app(overhead, 0), host="127.0.0.1",
+                                               port=args.port + index, log_level="warning"))
+        servers.append((server, asyncio.create_task(server.serve())))
+    while not all(server.started for server, _ in servers):
+        await asyncio.sleep(0.05)
+
+    urls = [f"http://127.0.0.1:{args.port + index}" for index in range(args.endpoints)]
+    runs = [("single", [urls[0]], BalancingStrategy.LEAST_OUTSTANDING)]
+    runs += [(strategy.value, urls, strategy) for strategy in BalancingStrategy]
+
+    for name, endpoints, strategy in runs:
+        client = ModelServiceClient(endpoints[0], endpoints=endpoints, balancing=strategy,
+                                    max_connections=args.concurrency, max_keepalive_connections=args.concurrency)
+        elapsed, latencies, failures = await run_load(client, args.requests, args.concurrency)
+        spread = "/".join(str(endpoint["requests_total"]) for endpoint in client.pool_stats()["endpoints"])
+        print(f"{name:<18} {args.requests / elapsed:7.1f} req/s  "
+              f"p50 {percentile(latencies, 50) * 1000:7.1f} ms  p99 {percentile(latencies, 99) * 1000:7.1f} ms  "
+              f"spread {spread}  {failures} failures")
+        await client.aclose()
+
+    for server, task in servers:
+        server.should_exit = True
+        await task
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
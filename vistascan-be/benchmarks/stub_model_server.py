@@ -0,0 +1,83 @@
+"""
+Stub of the AI model service for local runs and benchmarks.
+
+Simulates a single GPU: requests are served one at a time, and a call costs a fixed overhead plus a
+per-image cost, so batching several images into one call amortizes the overhead as a real model would.
+The streaming endpoint pays the same overhead before its first token, then emits a word every token_delay.
+
+    cd vistascan-be
+    python benchmarks/stub_model_server.py --port 8001 --overhead 0.2 --per-image 0.02
+"""
+import argparse
+import asyncio
+import json
+from typing import List
+
+import uvicorn
+from fastapi import FastAPI, File, UploadFile
+from fastapi.responses import StreamingResponse
+
+
+def create_app(overhead: float, per_image: float, token_delay: float = 0.02) -> FastAPI:
+    app = FastAPI(title="Stub model service")
+    gpu = asyncio.Lock()
+    app.state.calls = 0
+    app.state.images = 0
+
+    async def infer(files: List[UploadFile]):
+        contents = [await file.read() for file in files]
+        async with gpu:
+            await asyncio.sleep(overhead + per_image * len(contents))
+        app.state.calls += 1
+        app.state.images += len(contents)
+        return [
+            {"report": f"No acute cardiopulmonary findings ({len(content)} bytes).", "success": True, "message": ""}
+            for content in contents
+        ]
+
+    @app.get("/health")
+    async def health():
+        return {"status": "ok"}
+
+    @app.get("/stats")
+    async def stats():
+        return {"calls": app.state.calls, "images": app.state.images}
+
+    @app.post("/generate-report")
+    async def generate_report(file: UploadFile = File(...)):
+        return (await infer([file]))[0]
+
+    @app.post("/generate-report/batch")
+    async def generate_report_batch(files: List[UploadFile] = File(...)):
+        return {"results": await infer(files)}
+
+    @app.post("/generate-report/stream")
+    async def generate_report_stream(file: UploadFile = File(...)):
+        report = (await infer([file]))[0]["report"]
+
+        async def tokens():
+            for index, word in enumerate(report.split(" ")):
+                yield f"data: {json.dumps({'token': word if index == 0 else f' {word}'})}\n\n"
+                await asyncio.sleep(token_delay)
+            yield "data: [DONE]\n\n"
+
+        return StreamingResponse(tokens(), media_type="text/event-stream")
+
+    return app
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=8001)
+    parser.add_argument("--overhead", type=float, default=0.2, help="Seconds of fixed cost per model call")
+    parser.add_argument("--per-image", type=float, default=0.02, help="Seconds of extra cost per image in a call")
+    parser.add_argument("--token-delay", type=float, default=0.02, help="Seconds between streamed report tokens")
+    args = parser.parse_args()
+
+    uvicorn.run(create_app(args.overhead, args.per_image, args.token_delay), host=args.host, port=args.port,
+                log_level="warning")
+
+
+if __name__ == "__main__":
+    main()
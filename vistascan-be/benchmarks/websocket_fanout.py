@@ -0,0 +1,341 @@
+"""
+WebSocket notification fan-out benchmark.
+
+Runs the API in-process on in-memory repositories, opens simulated WebSocket clients for patients,
+experts and admins from separate worker processes, and fires consultation lifecycle notifications
+at a fixed rate. Reports delivery latency, server memory per connection and event-loop lag.
+
+    cd vistascan-be
+    python benchmarks/websocket_fanout.py --clients 2000 --rate 50 --duration 20
+"""
+import argparse
+import asyncio
+import json
+import multiprocessing
+import os
+import random
+import sys
+import time
+import tracemalloc
+from datetime import date, datetime
+from pathlib import Path
+from uuid import uuid4
+
+SRC_DIR = Path(__file__).resolve().parent.parent / "src"
+sys.path.insert(0, str(SRC_DIR))
+os.environ.setdefault("JWT_SECRET", "benchmark-secret")
+os.environ.setdefault("NOTIFICATION_BACKPLANE", "memory")
+
+CONNECT_BATCH_SIZE = 100
+LOOP_LAG_INTERVAL = 0.05
+
+
+def parse_args():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--clients", type=int, default=1000, help="Number of simulated WebSocket clients")
+    parser.add_argument("--experts", type=float, default=0.1, help="Fraction of clients connected as experts")
+    parser.add_argument("--admins", type=float, default=0.01, help="Fraction of clients connected as admins")
+    parser.add_argument("--rate", type=float, default=20, help="Notifications fired per second")
+    parser.add_argument("--duration", type=float, default=10, help="Seconds to keep firing notifications")
+    parser.add_argument("--drain", type=float, default=3, help="Seconds to wait for in-flight deliveries")
+    parser.add_argument("--workers", type=int, default=2, help="Client processes")
+    parser.add_argument("--encoding", choices=["json", "msgpack"], default="json")
+    parser.add_argument("--version", type=int, default=2, help="Notification protocol version")
+    parser.add_argument("--summaries", action="store_true", help="Embed consultation summaries in events")
+    parser.add_argument("--no-deflate", action="store_true", help="Disable permessage-deflate")
+    parser.add_argument("--no-tracemalloc", action="store_true", help="Skip measuring memory per connection")
+    parser.add_argument("--port", type=int, default=0)
+    parser.add_argument("--json-out", help="Write the report to this file as JSON")
+    return parser.parse_args()
+
+
+def percentile(values, pct):
+    if not values:
+        return None
+    ordered = sorted(values)
+    index = min(len(ordered) - 1, max(0, round(pct / 100 * len(ordered)) - 1))
+    return ordered[index]
+
+
+def raise_fd_limit():
+    try:
+        import resource
+        soft, hard = resource.getrlimit(resource.RLIMIT_NOFILE)
+        resource.setrlimit(resource.RLIMIT_NOFILE, (hard, hard))
+    except (ImportError, ValueError, OSError):
+        pass
+
+
+def client_worker(urls, deflate, ready_queue, result_queue, stop_event):
+    """Entry point of a client process: holds its share of the connections and records latencies."""
+    raise_fd_limit()
+    asyncio.run(run_clients(urls, deflate, ready_queue, result_queue, stop_event))
+
+
+async def run_clients(urls, deflate, ready_queue, result_queue, stop_event):
+    import msgpack
+    from websockets.asyncio.client import connect
+
+    latencies = []
+    errors = 0
+    connections = []
+
+    async def receive(websocket):
+        nonlocal errors
+        try:
+            async for frame in websocket:
+                received_at = time.time()
+                message = msgpack.unpackb(frame) if isinstance(frame, bytes) else json.loads(frame)
+                if "type" in message:
+                    if message["type"] == "ping":
+                        await websocket.send("pong")
+                    continue
+                sent_at = datetime.fromisoformat(message["timestamp"]).timestamp()
+                latencies.append(received_at - sent_at)
+        except Exception:
+            errors += 1
+
+    for start in range(0, len(urls), CONNECT_BATCH_SIZE):
+        batch = urls[start:start + CONNECT_BATCH_SIZE]
+        results = await asyncio.gather(*(
+            connect(url, compression="deflate" if deflate else None, max_queue=None, open_timeout=30)
+            for url in batch
+        ), return_exceptions=True)
+        for result in results:
+            if isinstance(result, Exception):
+                errors += 1
+            else:
+                connections.append(result)
+
+    tasks = [asyncio.create_task(receive(websocket)) for websocket in connections]
+    ready_queue.put(len(connections))
+
+    await asyncio.to_thread(stop_event.wait)
+    await asyncio.gather(*(websocket.close() for websocket in connections), return_exceptions=True)
+    await asyncio.gather(*tasks, return_exceptions=True)
+    result_queue.put({"latencies": latencies, "errors": errors})
+
+
+def create_users(args):
+    from domain.entities.user import User, UserRole, Gender
+
+    admins = max(1, int(args.clients * args.admins))
+    experts = max(1, int(args.clients * args.experts))
+    patients = max(1, args.clients - admins - experts)
+    roles = [UserRole.ADMIN] * admins + [UserRole.EXPERT] * experts + [UserRole.PATIENT] * patients
+
+    users = []
+    for index, role in enumerate(roles):
+        users.append(User(
+            username=f"bench-{role.value.lower()}-{index}",
+            email=f"bench-{index}@vistascan.local",
+            password="",
+            full_name=f"Benchmark User {index}",
+            birthdate=date(1980, 1, 1),
+            gender=Gender.FEMALE,
+            role=role,
+        ))
+    return users
+
+
+def build_summary(consultation_id, patient_id, expert_id, status):
+    from application.dto.consultation_dto import ConsultationSummaryDTO, ImagingStudyDTO
+
+    return ConsultationSummaryDTO(
+        id=consultation_id,
+        patient_id=patient_id,
+        imaging_study=ImagingStudyDTO(
+            file_name="chest-pa.dcm",
+            content_type="application/dicom",
+            size=8 * 1024 * 1024,
+            upload_date=datetime.now(),
+        ),
+        status=status,
+        created_at=datetime.now(),
+        expert_id=str(expert_id) if expert_id else None,
+    )
+
+
+async def monitor_loop_lag(samples):
+    while True:
+        started = time.perf_counter()
+        await asyncio.sleep(LOOP_LAG_INTERVAL)
+        samples.append(time.perf_counter() - started - LOOP_LAG_INTERVAL)
+
+
+async def fire_notifications(args, manager, patients, experts, admins):
+    """Fire created, assigned and completed events in turn, returning how many events and deliveries were sent."""
+    from domain.entities.consultation import ConsultationStatus
+
+    total = int(args.rate * args.duration)
+    expected = 0
+    in_flight = set()
+    consultation = None
+    started = time.perf_counter()
+
+    for index in range(total):
+        delay = started + index / args.rate - time.perf_counter()
+        if delay > 0:
+            await asyncio.sleep(delay)
+
+        step = index % 3
+        if step == 0:
+            consultation = (uuid4(), random.choice(patients).id, random.choice(experts).id)
+        consultation_id, patient_id, expert_id = consultation
+
+        if step == 0:
+            summary = build_summary(consultation_id, patient_id, None, ConsultationStatus.PENDING) if args.summaries else None
+            call = manager.notify_consultation_created(str(consultation_id), str(patient_id), summary)
+            expected += 1 + len(admins) + len(experts)
+        elif step == 1:
+            summary = build_summary(consultation_id, patient_id, expert_id, ConsultationStatus.IN_REVIEW) if args.summaries else None
+            call = manager.notify_consultation_assigned(str(consultation_id), str(patient_id), str(expert_id), summary)
+            expected += 1 + len(admins) + len(experts)
+        else:
+            summary = build_summary(consultation_id, patient_id, expert_id, ConsultationStatus.COMPLETED) if args.summaries else None
+            call = manager.notify_consultation_completed(str(consultation_id), str(patient_id), str(expert_id), summary)
+            expected += 2 + len(admins)
+
+        task = asyncio.create_task(call)
+        in_flight.add(task)
+        task.add_done_callback(in_flight.discard)
+
+    await asyncio.gather(*in_flight)
+    return total, expected, time.perf_counter() - started
+
+
+async def run_benchmark(args):
+    import uvicorn
+    import api.rest.dependencies as dependencies
+    from domain.entities.user import UserRole
+    from infrastructure.persistence.memory.user_repository import InMemoryUserRepository
+    from infrastructure.persistence.memory.notification_repository import InMemoryNotificationRepository
+
+    dependencies._user_repository = InMemoryUserRepository()
+    dependencies._notification_repository = InMemoryNotificationRepository()
+    from main import app
+
+    users = create_users(args)
+    for user in users:
+        dependencies._user_repository.save(user)
+    admins = [user for user in users if user.role == UserRole.ADMIN]
+    experts = [user for user in users if user.role == UserRole.EXPERT]
+    patients = [user for user in users if user.role == UserRole.PATIENT]
+
+    server = uvicorn.Server(uvicorn.Config(
+        app,
+        host="127.0.0.1",
+        port=args.port,
+        log_level="warning",
+        ws_per_message_deflate=not args.no_deflate,
+        backlog=4096,
+    ))
+    server_task = asyncio.create_task(server.serve())
+    while not server.started:
+        await asyncio.sleep(0.05)
+    port = server.servers[0].sockets[0].getsockname()[1]
+    manager = dependencies.get_websocket_manager()
+
+    token_generator = dependencies._token_generator
+    urls = [
+        f"ws://127.0.0.1:{port}/ws/{token_generator.generate(user.id, user.role.value)}"
+        f"?version={args.version}&encoding={args.encoding}"
+        for user in users
+    ]
+
+    if not args.no_tracemalloc:
+        tracemalloc.start()
+    memory_before = tracemalloc.get_traced_memory()[0] if tracemalloc.is_tracing() else 0
+
+    context = multiprocessing.get_context("spawn")
+    ready_queue, result_queue, stop_event = context.Queue(), context.Queue(), context.Event()
+    workers = [
+        context.Process(
+            target=client_worker,
+            args=(urls[index::args.workers], not args.no_deflate, ready_queue, result_queue, stop_event),
+        )
+        for index in range(args.workers)
+    ]
+    for worker in workers:
+        worker.start()
+
+    connected = 0
+    for _ in workers:
+        connected += await asyncio.to_thread(ready_queue.get)
+    while manager.metrics()["live_connections"] < connected:
+        await asyncio.sleep(0.05)
+
+    memory_per_connection = None
+    if tracemalloc.is_tracing():
+        memory_per_connection = (tracemalloc.get_traced_memory()[0] - memory_before) / max(connected, 1)
+        tracemalloc.stop()
+
+    lag_samples = []
+    lag_task = asyncio.create_task(monitor_loop_lag(lag_samples))
+    events, expected, elapsed = await fire_notifications(args, manager, patients, experts, admins)
+    await asyncio.sleep(args.drain)
+    lag_task.cancel()
+
+    stop_event.set()
+    latencies, client_errors = [], 0
+    for _ in workers:
+        result = await asyncio.to_thread(result_queue.get)
+        latencies.extend(result["latencies"])
+        client_errors += result["errors"]
+    for worker in workers:
+        await asyncio.to_thread(worker.join)
+
+    metrics = manager.metrics()
+    server.should_exit = True
+    await server_task
+
+    return {
+        "clients": {"requested": len(users), "connected": connected, "admins": len(admins),
+                    "experts": len(experts), "patients": len(patients), "errors": client_errors},
+        "config": {"encoding": args.encoding, "version": args.version, "summaries": args.summaries,
+                   "deflate": not args.no_deflate, "workers": args.workers},
+        "events": {"fired": events, "achieved_rate": events / elapsed if elapsed else None,
+                   "deliveries_expected": expected, "deliveries_received": len(latencies)},
+        "latency_ms": {name: value * 1000 if value is not None else None for name, value in (
+            ("p50", percentile(latencies, 50)), ("p99", percentile(latencies, 99)),
+            ("max", max(latencies) if latencies else None))},
+        "memory_per_connection_kib": memory_per_connection / 1024 if memory_per_connection is not None else None,
+        "loop_lag_ms": {name: value * 1000 if value is not None else None for name, value in (
+            ("p50", percentile(lag_samples, 50)), ("p99", percentile(lag_samples, 99)),
+            ("max", max(lag_samples) if lag_samples else None))},
+        "server": metrics,
+    }
+
+
+def format_ms(values):
+    return "  ".join(f"{name} {value:.2f}" if value is not None else f"{name} n/a" for name, value in values.items())
+
+
+def print_report(report):
+    clients, events = report["clients"], report["events"]
+    print(f"clients     {clients['connected']}/{clients['requested']} connected "
+          f"({clients['patients']} patients, {clients['experts']} experts, {clients['admins']} admins), "
+          f"{clients['errors']} errors")
+    print(f"config      {json.dumps(report['config'])}")
+    print(f"events      {events['fired']} fired at {events['achieved_rate']:.1f}/s, "
+          f"{events['deliveries_received']}/{events['deliveries_expected']} deliveries received")
+    print(f"latency     {format_ms(report['latency_ms'])} ms")
+    memory = report["memory_per_connection_kib"]
+    print(f"memory      {memory:.1f} KiB per connection" if memory is not None else "memory      not measured")
+    print(f"loop lag    {format_ms(report['loop_lag_ms'])} ms")
+    print(f"server      {json.dumps(report['server'])}")
+
+
+def main():
+    args = parse_args()
+    raise_fd_limit()
+    report = asyncio.run(run_benchmark(args))
+    print_report(report)
+
+    if args.json_out:
+        with open(args.json_out, "w") as f:
+            json.dump(report, f, indent=2)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,28 @@
+from datetime import datetime, timezone
+from email.utils import format_datetime
+from typing import Dict, FrozenSet, Optional
+
+from fastapi import Request, Response, status
+
+
+def if_none_match(request: Request) -> FrozenSet[str]:
+    """
+    The entity tags listed in the request's If-None-Match header. The W/ prefix is dropped, since
+    If-None-Match uses weak comparison; "*" is kept as is.
+    """
+    header = request.headers.get("if-none-match")
+    if not header:
+        return frozenset()
+    return frozenset(tag.strip().removeprefix("W/") for tag in header.split(",") if tag.strip())
+
+
+def validator_headers(etag: str, last_modified: Optional[datetime]) -> Dict[str, str]:
+    # no-cache keeps browsers revalidating every time, which with the ETag costs a 304 when nothing changed.
+    headers = {"ETag": etag, "Cache-Control": "private, no-cache"}
+    if last_modified is not None:
+        headers["Last-Modified"] = format_datetime(last_modified.astimezone(timezone.utc), usegmt=True)
+    return headers
+
+
+def not_modified(etag: str, last_modified: Optional[datetime]) -> Response:
+    return Response(status_code=status.HTTP_304_NOT_MODIFIED, headers=validator_headers(etag, last_modified))
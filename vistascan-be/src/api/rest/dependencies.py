@@ -9,31 +9,63 @@ from config import settings
 from domain.entities.user import User
 
 from application.interfaces.services import UserAuthenticationUseCase, ManageConsultationsUseCase, \
-    AdminManagementUseCase
+    AdminManagementUseCase, ManageNotificationsUseCase
 from application.interfaces.storage import FileStorageService
-from application.interfaces.repositories import UserRepository, ConsultationRepository
+from application.interfaces.draft_report_cache import DraftReportCache
+from application.interfaces.model_client import ModelClient
+from application.interfaces.repositories import UserRepository, ConsultationRepository, NotificationRepository, \
+    DraftReportJobRepository, ConsultationViewRepository
 from application.services.auth_service import AuthService
 from application.services.consultation_service import ConsultationService
+from application.services.notification_service import NotificationService
+from application.services.consultation_view_projector import ConsultationViewProjector
 
 from infrastructure.persistence.mongo.consultation_repository import MongoConsultationRepository
 from infrastructure.storage.minio_storage import MinioStorageService
 from infrastructure.security.jwt_token_generator import JWTTokenGenerator
 from infrastructure.security.bcrypt_password_hasher import BcryptPasswordHasher
 from infrastructure.persistence.mongo.user_repository import MongoUserRepository
+from infrastructure.persistence.mongo.notification_repository import MongoNotificationRepository
+from infrastructure.persistence.mongo.draft_report_job_repository import MongoDraftReportJobRepository
+from infrastructure.persistence.mongo.consultation_view_repository import MongoConsultationViewRepository
+from infrastructure.persistence.request_scoped import RequestScopedUserRepository, RequestScopedConsultationRepository
 from infrastructure.model.model_service import ModelServiceClient
+from infrastructure.model.batching import BatchingModelClient
+from infrastructure.model.endpoints import BalancingStrategy
+from infrastructure.model.preprocessing import PillowImagePreprocessor
+from infrastructure.imaging.dicom import DicomMetadataReader
+from infrastructure.model.resilience import CircuitBreaker, ResilientCaller, RetryPolicy
 from infrastructure.events.websocket_manager import WebSocketConnectionManager
+from infrastructure.events.backplane import (
+    NotificationBackplane,
+    InMemoryNotificationBackplane,
+    MongoNotificationBackplane,
+)
+from infrastructure.events.inbox import NotificationInboxWriter
+from infrastructure.jobs.worker_pool import AsyncWorkerPool
+from infrastructure.cache.draft_report_cache import LRUDraftReportCache, MongoDraftReportCache
 
 
 oauth2_scheme = OAuth2PasswordBearer(tokenUrl="/auth/login")
 
 _user_repository: Optional[UserRepository] = None
 _consultation_repository: Optional[ConsultationRepository] = None
+_consultation_view_repository: Optional[ConsultationViewRepository] = None
+_consultation_view_projector: Optional[ConsultationViewProjector] = None
 _auth_service: Optional[UserAuthenticationUseCase] = None
 _consultation_service: Optional[ManageConsultationsUseCase] = None
 _admin_service: Optional[AdminManagementUseCase] = None
+_notification_repository: Optional[NotificationRepository] = None
+_notification_service: Optional[ManageNotificationsUseCase] = None
 _file_storage_service: Optional[FileStorageService] = None
 _model_service_client: Optional[ModelServiceClient] = None
+_model_client: Optional[ModelClient] = None
 _websocket_manager: Optional[WebSocketConnectionManager] = None
+_draft_report_job_repository: Optional[DraftReportJobRepository] = None
+_draft_report_queue: Optional[AsyncWorkerPool] = None
+_draft_pregeneration_queue: Optional[AsyncWorkerPool] = None
+_draft_report_cache: Optional[DraftReportCache] = None
+_image_preprocessor: Optional[PillowImagePreprocessor] = None
 
 _password_hasher = BcryptPasswordHasher()
 _token_generator = JWTTokenGenerator(
@@ -41,20 +73,116 @@ _token_generator = JWTTokenGenerator(
     expires_in=settings.jwt_expiration,
 )
 
+def get_notification_backplane() -> NotificationBackplane:
+    if settings.notification_backplane == "mongo":
+        return MongoNotificationBackplane(
+            db_uri=settings.db_uri,
+            db_name=settings.db_name,
+            collection_name=settings.notification_backplane_collection,
+            size=settings.notification_backplane_size,
+        )
+
+    return InMemoryNotificationBackplane()
+
+
+def get_notification_repository() -> NotificationRepository:
+    global _notification_repository
+    if _notification_repository is None:
+        _notification_repository = MongoNotificationRepository(
+            db_name=settings.db_name,
+            db_uri=settings.db_uri,
+            ttl_seconds=settings.notification_inbox_ttl,
+        )
+
+    return _notification_repository
+
+
 def get_websocket_manager() -> WebSocketConnectionManager:
     global _websocket_manager
     if _websocket_manager is None:
-        _websocket_manager = WebSocketConnectionManager()
+        inbox = None
+        if settings.notification_inbox_enabled:
+            inbox = NotificationInboxWriter(
+                repository=get_notification_repository(),
+                flush_interval=settings.notification_inbox_flush_interval,
+                batch_size=settings.notification_inbox_batch_size,
+                user_repository=get_user_repository(),
+            )
+
+        _websocket_manager = WebSocketConnectionManager(
+            backplane=get_notification_backplane(),
+            replay_buffer_size=settings.notification_replay_buffer_size,
+            replay_max_users=settings.notification_replay_max_users,
+            inbox=inbox,
+            ping_interval=settings.websocket_ping_interval,
+            ping_timeout=settings.websocket_ping_timeout,
+            send_timeout=settings.websocket_send_timeout,
+        )
     return _websocket_manager
 
 
+def get_draft_report_job_repository() -> DraftReportJobRepository:
+    global _draft_report_job_repository
+    if _draft_report_job_repository is None:
+        _draft_report_job_repository = MongoDraftReportJobRepository(
+            db_name=settings.db_name,
+            db_uri=settings.db_uri,
+            ttl_seconds=settings.draft_report_job_ttl,
+        )
+
+    return _draft_report_job_repository
+
+
+def get_draft_report_queue() -> AsyncWorkerPool:
+    global _draft_report_queue
+    if _draft_report_queue is None:
+        _draft_report_queue = AsyncWorkerPool(
+            concurrency=settings.draft_report_concurrency,
+            max_queue_size=settings.draft_report_queue_size,
+            name="draft-reports",
+        )
+
+    return _draft_report_queue
+
+
+def get_draft_pregeneration_queue() -> AsyncWorkerPool:
+    global _draft_pregeneration_queue
+    if _draft_pregeneration_queue is None:
+        _draft_pregeneration_queue = AsyncWorkerPool(
+            concurrency=settings.draft_pregeneration_concurrency,
+            max_queue_size=settings.draft_pregeneration_queue_size,
+            name="draft-pregeneration",
+        )
+
+    return _draft_pregeneration_queue
+
+
+def get_draft_report_cache() -> DraftReportCache:
+    global _draft_report_cache
+    if _draft_report_cache is None:
+        backing = None
+        if settings.draft_report_cache_persistent:
+            backing = MongoDraftReportCache(
+                db_name=settings.db_name,
+                db_uri=settings.db_uri,
+                ttl_seconds=settings.draft_report_cache_ttl,
+            )
+
+        _draft_report_cache = LRUDraftReportCache(
+            max_entries=settings.draft_report_cache_size,
+            backing=backing,
+        )
+
+    return _draft_report_cache
+
+
 def get_user_repository() -> UserRepository:
     global _user_repository
     if _user_repository is None:
-        _user_repository = MongoUserRepository(
+        _user_repository = RequestScopedUserRepository(MongoUserRepository(
             db_name=settings.db_name,
             db_uri=settings.db_uri,
-        )
+        ))
 
     return _user_repository
 
@@ -62,14 +190,36 @@ def get_user_repository() -> UserRepository:
 def get_consultation_repository() -> ConsultationRepository:
     global _consultation_repository
     if _consultation_repository is None:
-        _consultation_repository = MongoConsultationRepository(
+        _consultation_repository = RequestScopedConsultationRepository(MongoConsultationRepository(
             db_name=settings.db_name,
             db_uri=settings.db_uri,
-        )
+        ))
 
     return _consultation_repository
 
 
+def get_consultation_view_repository() -> ConsultationViewRepository:
+    global _consultation_view_repository
+    if _consultation_view_repository is None:
+        _consultation_view_repository = MongoConsultationViewRepository(
+            db_name=settings.db_name,
+            db_uri=settings.db_uri,
+        )
+
+    return _consultation_view_repository
+
+
+def get_consultation_view_projector() -> ConsultationViewProjector:
+    global _consultation_view_projector
+    if _consultation_view_projector is None:
+        _consultation_view_projector = ConsultationViewProjector(
+            view_repository=get_consultation_view_repository(),
+            user_repository=get_user_repository(),
+        )
+
+    return _consultation_view_projector
+
+
 def get_auth_service() -> AuthService:
     global _auth_service
     if _auth_service is None:
@@ -103,19 +253,68 @@ def get_model_service_client() -> ModelServiceClient:
         model_service_url = settings.model_service_url
         _model_service_client = ModelServiceClient(
             base_url=model_service_url,
-            timeout=30
+            timeout=settings.model_service_timeout,
+            max_connections=settings.model_service_max_connections,
+            max_keepalive_connections=settings.model_service_max_keepalive_connections,
+            keepalive_expiry=settings.model_service_keepalive_expiry,
+            http2=settings.model_service_http2,
+            caller=ResilientCaller(
+                breaker=CircuitBreaker(
+                    failure_rate=settings.model_service_breaker_failure_rate,
+                    window=settings.model_service_breaker_window,
+                    min_calls=settings.model_service_breaker_min_calls,
+                    open_seconds=settings.model_service_breaker_open_seconds,
+                ),
+                retry=RetryPolicy(
+                    max_retries=settings.model_service_max_retries,
+                    base_delay=settings.model_service_retry_backoff,
+                ),
+                deadline=settings.model_service_deadline,
+                hedging=settings.model_service_hedging,
+            ),
+            health_check_interval=settings.model_service_health_check_interval,
+            chunk_size=settings.model_service_chunk_size,
+            endpoints=settings.model_service_urls,
+            balancing=BalancingStrategy(settings.model_service_balancing),
         )
 
     return _model_service_client
 
 
+def get_model_client() -> ModelClient:
+    global _model_client
+    if _model_client is None:
+        _model_client = get_model_service_client()
+        if settings.model_batch_enabled:
+            _model_client = BatchingModelClient(
+                client=_model_client,
+                max_batch_size=settings.model_batch_max_size,
+                max_wait=settings.model_batch_max_wait,
+                chunk_size=settings.model_service_chunk_size,
+            )
+
+    return _model_client
+
+
+def get_image_preprocessor() -> PillowImagePreprocessor:
+    global _image_preprocessor
+    if _image_preprocessor is None:
+        _image_preprocessor = PillowImagePreprocessor(
+            input_size=settings.model_input_size,
+            output_format=settings.model_input_format,
+            max_workers=settings.model_preprocessing_workers,
+        )
+
+    return _image_preprocessor
+
+
 def get_consultation_service() -> ConsultationService:
     global _consultation_service
     if _consultation_service is None:
         _user_repo = get_user_repository()
         _consultation_repo = get_consultation_repository()
         _storage_service = get_file_storage_service()
-        _model_client = get_model_service_client()
+        _model_client = get_model_client()
         _websocket_manager = get_websocket_manager()
 
         _consultation_service = ConsultationService(
@@ -124,6 +323,20 @@ def get_consultation_service() -> ConsultationService:
             file_storage_service=_storage_service,
             websocket_manager=_websocket_manager,
             model_client=_model_client,
+            draft_report_job_repository=get_draft_report_job_repository(),
+            draft_report_queue=get_draft_report_queue(),
+            draft_report_job_timeout=settings.draft_report_job_timeout,
+            draft_report_cache=get_draft_report_cache(),
+            model_version=settings.model_version,
+            study_chunk_size=settings.model_service_chunk_size,
+            draft_pregeneration_queue=(
+                get_draft_pregeneration_queue() if settings.draft_pregeneration_enabled else None
+            ),
+            image_preprocessor=get_image_preprocessor(),
+            preprocess_model_input=settings.model_preprocessing_enabled,
+            metadata_reader=DicomMetadataReader(),
+            consultation_view_repository=get_consultation_view_repository(),
+            view_projector=get_consultation_view_projector(),
         )
 
     return _consultation_service
@@ -141,10 +354,20 @@ def get_admin_service() -> AdminService:
             password_hasher=_password_hasher,
             file_storage_service=get_file_storage_service(),
             websocket_manager=websocket_manager,
+            view_projector=get_consultation_view_projector(),
         )
 
     return _admin_service
 
+def get_notification_service() -> NotificationService:
+    global _notification_service
+    if _notification_service is None:
+        _notification_service = NotificationService(
+            notification_repository=get_notification_repository(),
+        )
+
+    return _notification_service
+
 async def get_current_user(token: str = Depends(oauth2_scheme)) -> User:
     credentials_exception = HTTPException(
         status_code=status.HTTP_401_UNAUTHORIZED,
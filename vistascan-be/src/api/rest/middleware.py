@@ -0,0 +1,27 @@
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+from infrastructure.persistence.loader import request_scope
+
+
+class RequestScopeMiddleware:
+    """
+    Opens a request scope for the DataLoaders of each HTTP request. The scope closes as soon as the response
+    starts: by then the handler's reads are done, and streamed bodies such as server-sent events can run for
+    minutes, so they must read fresh data rather than what the request memoized.
+    """
+
+    def __init__(self, app: ASGIApp):
+        self.app = app
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send):
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        with request_scope() as request:
+            async def send_closing_scope(message: Message):
+                if message["type"] == "http.response.start":
+                    request.closed = True
+                await send(message)
+
+            await self.app(scope, receive, send_closing_scope)
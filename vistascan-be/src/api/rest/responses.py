@@ -0,0 +1,22 @@
+from typing import Any
+
+import orjson
+from fastapi.responses import JSONResponse
+from pydantic import BaseModel
+
+
+def _dump_model(value: Any) -> Any:
+    if isinstance(value, BaseModel):
+        return value.model_dump()
+    raise TypeError(f"Type is not JSON serializable: {type(value).__name__}")
+
+
+class DTOResponse(JSONResponse):
+    """
+    JSON response encoded by orjson straight from DTOs. Returning it skips FastAPI's response_model
+    re-validation and jsonable_encoder pass, so it is only for DTOs the application layer built itself;
+    the route's response_model still documents the payload.
+    """
+
+    def render(self, content: Any) -> bytes:
+        return orjson.dumps(content, default=_dump_model, option=orjson.OPT_NON_STR_KEYS)
@@ -1,4 +1,4 @@
-from typing import List
+from typing import Any, List, Dict
 from uuid import UUID
 from fastapi import APIRouter, Depends, HTTPException, status
 
@@ -7,7 +7,12 @@ from application.dto.user_dto import UserDTO, UpdateUserRequest
 from application.dto.consultation_dto import ConsultationDTO
 from application.interfaces.services import AdminManagementUseCase
 
-from api.rest.dependencies import get_current_user, get_admin_service
+from infrastructure.events.websocket_manager import WebSocketConnectionManager
+from infrastructure.model.model_service import ModelServiceClient
+from infrastructure.jobs.worker_pool import AsyncWorkerPool
+from api.rest.responses import DTOResponse
+from api.rest.dependencies import get_current_user, get_admin_service, get_websocket_manager, get_model_service_client, \
+    get_draft_report_queue, get_draft_pregeneration_queue
 
 router = APIRouter(prefix="/admin", tags=["admin"])
 
@@ -39,7 +44,7 @@ async def get_all_consultations(
         )
 
     consultations = admin_service.get_all_consultations()
-    return consultations
+    return DTOResponse(consultations)
 
 
 @router.put("/users/{user_id}", response_model=UserDTO, status_code=status.HTTP_200_OK)
@@ -107,4 +112,61 @@ async def delete_consultation(
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
             detail="Consultation not found or deletion failed"
-        )
\ No newline at end of file
+        )
+
+
+@router.post("/consultation-views/rebuild", response_model=Dict[str, int], status_code=status.HTTP_200_OK)
+async def rebuild_consultation_views(
+        current_user: User = Depends(get_current_user),
+        admin_service: AdminManagementUseCase = Depends(get_admin_service)
+):
+    if current_user.role != UserRole.ADMIN:
+        raise HTTPException(
+            status_code=status.HTTP_403_FORBIDDEN,
+            detail="Only admins can rebuild consultation views"
+        )
+
+    return {"rebuilt": admin_service.rebuild_consultation_views()}
+
+
+@router.get("/metrics/websocket", response_model=Dict[str, int], status_code=status.HTTP_200_OK)
+async def get_websocket_metrics(
+        current_user: User = Depends(get_current_user),
+        websocket_manager: WebSocketConnectionManager = Depends(get_websocket_manager)
+):
+    if current_user.role != UserRole.ADMIN:
+        raise HTTPException(
+            status_code=status.HTTP_403_FORBIDDEN,
+            detail="Only admins can access this endpoint"
+        )
+
+    return websocket_manager.metrics()
+
+
+@router.get("/metrics/model-service", response_model=Dict[str, Any], status_code=status.HTTP_200_OK)
+async def get_model_service_metrics(
+        current_user: User = Depends(get_current_user),
+        model_client: ModelServiceClient = Depends(get_model_service_client)
+):
+    if current_user.role != UserRole.ADMIN:
+        raise HTTPException(
+            status_code=status.HTTP_403_FORBIDDEN,
+            detail="Only admins can access this endpoint"
+        )
+
+    return model_client.pool_stats()
+
+
+@router.get("/metrics/draft-reports", response_model=Dict[str, Any], status_code=status.HTTP_200_OK)
+async def get_draft_report_metrics(
+        current_user: User = Depends(get_current_user),
+        draft_report_queue: AsyncWorkerPool = Depends(get_draft_report_queue),
+        draft_pregeneration_queue: AsyncWorkerPool = Depends(get_draft_pregeneration_queue)
+):
+    if current_user.role != UserRole.ADMIN:
+        raise HTTPException(
+            status_code=status.HTTP_403_FORBIDDEN,
+            detail="Only admins can access this endpoint"
+        )
+
+    return {**draft_report_queue.stats(), "pregeneration": draft_pregeneration_queue.stats()}
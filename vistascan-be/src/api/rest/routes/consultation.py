@@ -1,6 +1,8 @@
+from datetime import date
 from typing import List, Optional
 from uuid import UUID
-from fastapi import APIRouter, Depends, File, HTTPException, UploadFile, status, Query
+from fastapi import APIRouter, Depends, File, HTTPException, UploadFile, status, Query, Request, Response
+from fastapi.responses import StreamingResponse
 
 from domain.entities.consultation import ConsultationStatus
 from domain.entities.user import User, UserRole
@@ -9,9 +11,16 @@ from application.dto.consultation_dto import (
     AssignConsultationRequest,
     SubmitReportRequest,
     ConsultationDTO,
+    DraftReportJobDTO,
+    StudyMetadataFilter,
+    ConsultationViewDTO,
 )
 from application.interfaces.services import ManageConsultationsUseCase
+from application.exceptions import ConsultationNotFound, ConsultationAccessDenied, JobNotFound, JobQueueFull
+from infrastructure.events.encoding import NotificationEncoding, encode_frame
 
+from api.rest.responses import DTOResponse
+from api.rest.conditional import if_none_match, not_modified, validator_headers
 from api.rest.dependencies import (
     get_consultation_service,
     get_current_user,
@@ -44,13 +53,49 @@ async def create_consultation(
     return result
 
 
+@router.get("/dashboard", response_model=List[ConsultationViewDTO], status_code=status.HTTP_200_OK)
+async def get_consultation_dashboard(
+        consultation_status: Optional[str] = Query(None, description="Filter by consultation status", alias="status"),
+        expert_id: Optional[UUID] = Query(None, description="Filter by assigned expert ID"),
+        patient_id: Optional[UUID] = Query(None, description="Filter by patient ID"),
+        limit: int = Query(100, ge=1, le=1000, description="Maximum number of rows, newest first"),
+        current_user: User = Depends(get_current_user),
+        use_case: ManageConsultationsUseCase = Depends(get_consultation_service)
+):
+    if consultation_status:
+        try:
+            consultation_status = ConsultationStatus(consultation_status.upper())
+        except ValueError:
+            raise HTTPException(
+                status_code=status.HTTP_400_BAD_REQUEST,
+                detail=f"Invalid status: {consultation_status}. Valid statuses are: PENDING, IN_REVIEW, COMPLETED"
+            )
+
+    if current_user.role == UserRole.PATIENT:
+        if (patient_id and patient_id != current_user.id) or expert_id:
+            raise HTTPException(
+                status_code=status.HTTP_403_FORBIDDEN,
+                detail="Patients can only view their own consultations"
+            )
+        patient_id = current_user.id
+
+    result = use_case.get_dashboard(
+        status=consultation_status or None,
+        expert_id=expert_id,
+        patient_id=patient_id,
+        limit=limit,
+    )
+    return DTOResponse(result)
+
+
 @router.get("/{consultation_id}", response_model=ConsultationDTO, status_code=status.HTTP_200_OK)
 async def get_consultation(
         consultation_id: UUID,
+        request: Request,
         current_user: User = Depends(get_current_user),
         use_case: ManageConsultationsUseCase = Depends(get_consultation_service)
 ):
-    result = use_case.get_by_id(consultation_id)
+    result = use_case.get_versioned(consultation_id, if_none_match(request))
     if not result:
         raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Consultation not found")
 
@@ -58,19 +103,32 @@ async def get_consultation(
         raise HTTPException(status_code=status.HTTP_403_FORBIDDEN,
                             detail="You do not have permission to access this consultation")
 
-    return result
+    if result.consultation is None:
+        return not_modified(result.etag, result.last_modified)
+    return DTOResponse(result.consultation, headers=validator_headers(result.etag, result.last_modified))
 
 @router.get("", response_model=List[ConsultationDTO], status_code=status.HTTP_200_OK)
 async def get_filtered_consultations(
+        request: Request,
         user_id: Optional[UUID] = Query(None, description="Filter by user ID"),
         consultation_status: Optional[str] = Query(None, description="Filter by consultation status", alias="status"),
+        modality: Optional[str] = Query(None, description="Filter by DICOM modality, e.g. CR or DX"),
+        body_part: Optional[str] = Query(None, description="Filter by DICOM body part examined"),
+        study_date_from: Optional[date] = Query(None, description="Filter by DICOM study date, inclusive"),
+        study_date_to: Optional[date] = Query(None, description="Filter by DICOM study date, inclusive"),
         current_user: User = Depends(get_current_user),
         use_case: ManageConsultationsUseCase = Depends(get_consultation_service)
 ):
-    if not user_id and not consultation_status:
+    metadata_filter = StudyMetadataFilter(
+        modality=modality,
+        body_part=body_part,
+        study_date_from=study_date_from,
+        study_date_to=study_date_to,
+    )
+    if not user_id and not consultation_status and metadata_filter.is_empty():
         raise HTTPException(
             status_code=status.HTTP_400_BAD_REQUEST,
-            detail="At least one filter (user_id or status) must be provided"
+            detail="At least one filter (user_id, status or study metadata) must be provided"
         )
 
     if consultation_status:
@@ -89,6 +147,13 @@ async def get_filtered_consultations(
                 detail="Only experts and admins can filter consultations by status"
             )
 
+    if not metadata_filter.is_empty() and not user_id:
+        if current_user.role not in [UserRole.EXPERT, UserRole.ADMIN]:
+            raise HTTPException(
+                status_code=status.HTTP_403_FORBIDDEN,
+                detail="Only experts and admins can filter consultations by study metadata"
+            )
+
     if user_id and current_user.role != UserRole.ADMIN:
         if current_user.id != user_id:
             raise HTTPException(
@@ -96,23 +161,16 @@ async def get_filtered_consultations(
                 detail="You do not have permission to access this user's consultations"
             )
 
-    result = []
-    if user_id:
-        if current_user.role == UserRole.ADMIN:
-            result += use_case.get_by_patient_id(user_id) or []
-            result += use_case.get_by_expert_id(user_id) or []
-        elif current_user.role == UserRole.PATIENT:
-            result = use_case.get_by_patient_id(user_id) or []
-        elif current_user.role == UserRole.EXPERT:
-            result = use_case.get_by_expert_id(user_id) or []
-
-    if consultation_status:
-        if not result:
-            result = use_case.get_by_status(consultation_status)
-        else:
-            result = [c for c in result if c.status == consultation_status]
-
-    return result
+    result = use_case.get_filtered(
+        role=current_user.role,
+        user_id=user_id,
+        status=consultation_status or None,
+        metadata_filter=metadata_filter,
+        known_etags=if_none_match(request),
+    )
+    if result.consultations is None:
+        return not_modified(result.etag, result.last_modified)
+    return DTOResponse(result.consultations, headers=validator_headers(result.etag, result.last_modified))
 
 
 @router.get("/{consultation_id}/download", status_code=status.HTTP_200_OK)
@@ -141,6 +199,40 @@ async def download_study(
     return {"download_url": result.download_url}
 
 
+@router.get("/{consultation_id}/preview", response_class=Response, status_code=status.HTTP_200_OK)
+async def preview_study(
+        consultation_id: UUID,
+        max_size: int = Query(1024, ge=64, le=4096, description="Longest rendered side is at most this many pixels"),
+        window_center: Optional[float] = Query(None, description="Intensity window center, in modality units"),
+        window_width: Optional[float] = Query(None, gt=0, description="Intensity window width, in modality units"),
+        current_user: User = Depends(get_current_user),
+        use_case: ManageConsultationsUseCase = Depends(get_consultation_service)
+):
+    result = use_case.get_by_id(consultation_id)
+    if not result:
+        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Consultation not found")
+
+    if (current_user.role not in [UserRole.ADMIN, UserRole.EXPERT] and
+            current_user.id != result.patient_id):
+        raise HTTPException(
+            status_code=status.HTTP_403_FORBIDDEN,
+            detail="Not authorized to view this study"
+        )
+
+    try:
+        preview = await use_case.render_study_preview(consultation_id, max_size, window_center, window_width)
+    except ConsultationNotFound as e:
+        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail=e.message)
+
+    if preview is None:
+        raise HTTPException(
+            status_code=status.HTTP_422_UNPROCESSABLE_ENTITY,
+            detail="The study could not be rendered"
+        )
+
+    return Response(content=preview, media_type="image/png", headers={"Cache-Control": "private, max-age=3600"})
+
+
 @router.post("/{consultation_id}/assign", response_model=ConsultationDTO, status_code=status.HTTP_200_OK)
 async def assign_consultation(
         consultation_id: UUID,
@@ -175,7 +267,8 @@ async def submit_report(
     return result
 
 
-@router.post("/{consultation_id}/generate-report", status_code=status.HTTP_200_OK)
+@router.post("/{consultation_id}/generate-report", response_model=DraftReportJobDTO,
+             status_code=status.HTTP_202_ACCEPTED)
 async def generate_draft_report(
         consultation_id: UUID,
         current_user: User = Depends(get_current_user),
@@ -185,19 +278,61 @@ async def generate_draft_report(
         raise HTTPException(status_code=status.HTTP_403_FORBIDDEN, detail="Only experts and admins can generate AI reports")
 
     try:
-        result = await use_case.generate_draft_report(consultation_id, current_user.id)
-        if not result:
-            raise HTTPException(
-                status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
-                detail="Failed to generate AI report"
-            )
-        return {
-            "success": True,
-            "content": result["report"],
-            "message": result["message"],
-        }
-    except Exception as e:
-        raise HTTPException(
-            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
-            detail=f"Error generating AI report: {str(e)}"
-        )
+        return await use_case.submit_draft_report(consultation_id, current_user.id)
+    except ConsultationNotFound as e:
+        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail=str(e))
+    except ConsultationAccessDenied as e:
+        raise HTTPException(status_code=status.HTTP_403_FORBIDDEN, detail=str(e))
+    except JobQueueFull as e:
+        raise HTTPException(status_code=status.HTTP_503_SERVICE_UNAVAILABLE, detail=str(e),
+                            headers={"Retry-After": "10"})
+    except ValueError as e:
+        raise HTTPException(status_code=status.HTTP_500_INTERNAL_SERVER_ERROR, detail=str(e))
+
+
+@router.post("/{consultation_id}/generate-report/stream", response_class=StreamingResponse)
+async def stream_draft_report(
+        consultation_id: UUID,
+        current_user: User = Depends(get_current_user),
+        use_case: ManageConsultationsUseCase = Depends(get_consultation_service)
+):
+    if current_user.role not in [UserRole.EXPERT, UserRole.ADMIN]:
+        raise HTTPException(status_code=status.HTTP_403_FORBIDDEN, detail="Only experts and admins can generate AI reports")
+
+    try:
+        events = await use_case.stream_draft_report(consultation_id, current_user.id)
+    except ConsultationNotFound as e:
+        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail=str(e))
+    except ConsultationAccessDenied as e:
+        raise HTTPException(status_code=status.HTTP_403_FORBIDDEN, detail=str(e))
+
+    async def event_stream():
+        async for event in events:
+            yield encode_frame(event, NotificationEncoding.SSE)
+
+    return StreamingResponse(
+        event_stream(),
+        media_type="text/event-stream",
+        headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"},
+    )
+
+
+@router.get("/{consultation_id}/generate-report/{job_id}", response_model=DraftReportJobDTO,
+            status_code=status.HTTP_200_OK)
+async def get_draft_report_job(
+        consultation_id: UUID,
+        job_id: UUID,
+        current_user: User = Depends(get_current_user),
+        use_case: ManageConsultationsUseCase = Depends(get_consultation_service)
+):
+    try:
+        job = use_case.get_draft_report_job(job_id, current_user.id)
+    except JobNotFound as e:
+        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail=str(e))
+    except ConsultationAccessDenied as e:
+        raise HTTPException(status_code=status.HTTP_403_FORBIDDEN, detail=str(e))
+
+    if job.consultation_id != consultation_id:
+        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Draft report job not found for this consultation")
+
+    return job
@@ -0,0 +1,75 @@
+from typing import Optional
+from fastapi import APIRouter, Depends, Header, Query, status
+from fastapi.responses import StreamingResponse
+
+from domain.entities.user import User, UserRole
+from application.dto.notification_dto import (
+    NotificationPageDTO,
+    AcknowledgeNotificationsRequest,
+    AcknowledgeNotificationsResponse,
+)
+from application.interfaces.services import ManageNotificationsUseCase
+from infrastructure.events.websocket_manager import WebSocketConnectionManager
+
+from api.rest.dependencies import get_current_user, get_notification_service, get_websocket_manager
+
+router = APIRouter(prefix="/notifications", tags=["notifications"])
+
+
+@router.get("", response_model=NotificationPageDTO, status_code=status.HTTP_200_OK)
+async def get_notifications(
+        before: Optional[int] = Query(None, description="Return notifications with a sequence number below this cursor"),
+        limit: int = Query(50, ge=1, le=200),
+        unacknowledged_only: bool = Query(False),
+        current_user: User = Depends(get_current_user),
+        notification_service: ManageNotificationsUseCase = Depends(get_notification_service)
+):
+    return notification_service.get_inbox(current_user.id, before, limit, unacknowledged_only)
+
+
+@router.post("/ack", response_model=AcknowledgeNotificationsResponse, status_code=status.HTTP_200_OK)
+async def acknowledge_notifications(
+        request: AcknowledgeNotificationsRequest,
+        current_user: User = Depends(get_current_user),
+        notification_service: ManageNotificationsUseCase = Depends(get_notification_service)
+):
+    return notification_service.acknowledge(current_user.id, request)
+
+
+@router.get("/stream", response_class=StreamingResponse)
+async def stream_notifications(
+        token: str = Query(..., description="Access token, passed in the query since EventSource cannot set headers"),
+        last_seq: Optional[int] = Query(None, description="Sequence number of the last event received"),
+        version: Optional[int] = Query(None, description="Notification protocol version spoken by the client"),
+        last_event_id: Optional[str] = Header(None, description="Sent by the browser when EventSource reconnects"),
+        websocket_manager: WebSocketConnectionManager = Depends(get_websocket_manager)
+):
+    current_user = await get_current_user(token)
+
+    if last_event_id is not None and last_event_id.isdigit():
+        last_seq = int(last_event_id)
+
+    session = websocket_manager.connect_stream(str(current_user.id), UserRole(current_user.role), version)
+    await websocket_manager.send_control(session, {
+        "type": "connected",
+        "seq": websocket_manager.current_seq,
+        "version": session.version,
+        "topics": sorted(session.topics),
+        "message": "Connected to notifications",
+    })
+    await websocket_manager.send_backlog(session, last_seq)
+
+    async def event_stream():
+        try:
+            async for chunk in session.stream():
+                yield chunk
+                # A completed write is the only liveness signal a one-way stream gives us.
+                websocket_manager.touch(session.id)
+        finally:
+            websocket_manager.disconnect(session.id)
+
+    return StreamingResponse(
+        event_stream(),
+        media_type="text/event-stream",
+        headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"},
+    )
@@ -1,11 +1,14 @@
+import json
 import logging
 from config import settings
 from uuid import UUID
+from typing import Optional
 from jose import JWTError, jwt
-from fastapi import APIRouter, WebSocket, WebSocketDisconnect, Depends
+from fastapi import APIRouter, WebSocket, WebSocketDisconnect, Depends, Query
 
 from domain.entities.user import UserRole
 from infrastructure.events.websocket_manager import WebSocketConnectionManager
+from infrastructure.events.session import WebSocketSession
 from api.rest.dependencies import get_websocket_manager, get_user_repository
 from application.interfaces.repositories import UserRepository
 
@@ -27,33 +30,80 @@ async def get_user_from_token(token: str, user_repo: UserRepository):
         raise JWTError("Could not validate credentials")
 
 
+async def handle_client_message(data: str, session: WebSocketSession, websocket_manager: WebSocketConnectionManager):
+    try:
+        message = json.loads(data)
+        action = message.get("action")
+        topics = message.get("topics", [])
+    except (ValueError, AttributeError):
+        logging.warning(f"Ignoring malformed WebSocket message from user {session.user_id}")
+        return
+
+    # A bare string would otherwise be subscribed one character at a time, and unhashable items would
+    # raise inside the manager and close the socket.
+    if not isinstance(topics, list) or not all(isinstance(topic, str) for topic in topics):
+        logging.warning(f"Ignoring malformed WebSocket message from user {session.user_id}")
+        return
+
+    if action == "subscribe":
+        if "version" in message:
+            websocket_manager.set_version(session.id, message["version"])
+        topics = websocket_manager.subscribe(session.id, topics)
+    elif action == "unsubscribe":
+        topics = websocket_manager.unsubscribe(session.id, topics)
+    else:
+        logging.warning(f"Ignoring unknown WebSocket action {action} from user {session.user_id}")
+        return
+
+    await websocket_manager.send_control(session, {"type": "subscriptions", "topics": topics, "version": session.version})
+
+
 @router.websocket("/ws/{token}")
 async def websocket_endpoint(
         websocket: WebSocket,
         token: str,
+        last_seq: Optional[int] = Query(None, description="Sequence number of the last event received"),
+        version: Optional[int] = Query(None, description="Notification protocol version spoken by the client"),
+        encoding: Optional[str] = Query(None, description="Frame encoding for server messages: json or msgpack"),
         websocket_manager: WebSocketConnectionManager = Depends(get_websocket_manager),
         user_repo: UserRepository = Depends(get_user_repository)
 ):
+    session = None
     try:
         user = await get_user_from_token(token, user_repo)
 
-        await websocket_manager.connect(websocket, str(user.id), UserRole(user.role))
+        session = await websocket_manager.connect(websocket, str(user.id), UserRole(user.role), version, encoding)
 
-        await websocket.send_text(f"Connected to notifications")
+        await websocket_manager.send_control(session, {
+            "type": "connected",
+            "seq": websocket_manager.current_seq,
+            "version": session.version,
+            "encoding": session.encoding.value,
+            "topics": sorted(session.topics),
+            "message": "Connected to notifications",
+        })
+        await websocket_manager.send_backlog(session, last_seq)
 
         while True:
             data = await websocket.receive_text()
 
+            if data == "pong":
+                continue
+
             if data == "ping":
                 await websocket.send_text("pong")
+                continue
+
+            await handle_client_message(data, session, websocket_manager)
 
     except JWTError as e:
         logging.error(f"WebSocket authentication failed: {e}")
         await websocket.close(code=1008, reason="Authentication failed")
     except WebSocketDisconnect:
-        websocket_manager.disconnect(str(user.id))
-        logging.info(f"WebSocket disconnected for user {user.id}")
+        logging.info(f"WebSocket disconnected for user {session.user_id if session else 'unknown'}")
     except Exception as e:
         logging.error(f"WebSocket error: {e}")
-        websocket_manager.disconnect(str(user.id))
-        await websocket.close(code=1011, reason="Internal error")
\ No newline at end of file
+        await websocket.close(code=1011, reason="Internal error")
+    finally:
+        if session is not None:
+            websocket_manager.disconnect(session.id)
@@ -1,10 +1,44 @@
-from datetime import datetime
-from typing import Optional, BinaryIO
-from pydantic import BaseModel
+from datetime import date, datetime
+from typing import Any, BinaryIO, Dict, List, Optional
+from pydantic import BaseModel, ConfigDict
 from uuid import UUID
 import io
 
-from domain.entities.consultation import ConsultationStatus
+from domain.entities.consultation import Consultation, ConsultationStatus
+from domain.entities.job import DraftReportJobStatus
+
+
+class StudyMetadataDTO(BaseModel):
+    model_config = ConfigDict(from_attributes=True)
+
+    modality: Optional[str] = None
+    body_part: Optional[str] = None
+    rows: Optional[int] = None
+    columns: Optional[int] = None
+    study_date: Optional[date] = None
+
+
+class StudyMetadataFilter(BaseModel):
+    modality: Optional[str] = None
+    body_part: Optional[str] = None
+    study_date_from: Optional[date] = None
+    study_date_to: Optional[date] = None
+
+    def is_empty(self) -> bool:
+        return not any((self.modality, self.body_part, self.study_date_from, self.study_date_to))
+
+    def matches(self, metadata: Optional[StudyMetadataDTO]) -> bool:
+        if metadata is None:
+            return self.is_empty()
+        if self.modality and (metadata.modality or "").upper() != self.modality.upper():
+            return False
+        if self.body_part and (metadata.body_part or "").upper() != self.body_part.upper():
+            return False
+        if self.study_date_from and (metadata.study_date is None or metadata.study_date < self.study_date_from):
+            return False
+        if self.study_date_to and (metadata.study_date is None or metadata.study_date > self.study_date_to):
+            return False
+        return True
 
 
 class ImagingStudyDTO(BaseModel):
@@ -13,6 +47,7 @@ class ImagingStudyDTO(BaseModel):
     size: int
     upload_date: datetime
     file_path: Optional[str] = None
+    metadata: Optional[StudyMetadataDTO] = None
 
 
 class ReportDTO(BaseModel):
@@ -53,3 +88,113 @@ class ConsultationDTO(BaseModel):
     expert_id: Optional[str] = None
     completed_at: Optional[datetime] = None
     download_url: Optional[str] = None
+
+
+class ConsultationSummaryDTO(BaseModel):
+    """Compact consultation state embedded in notifications so clients can patch cached lists."""
+    id: UUID
+    patient_id: UUID
+    imaging_study: ImagingStudyDTO
+    status: ConsultationStatus
+    created_at: datetime
+    report: Optional[ReportDTO] = None
+    expert_id: Optional[str] = None
+    completed_at: Optional[datetime] = None
+
+
+class VersionedConsultationDTO(BaseModel):
+    """
+    A consultation with its validators. consultation is None when the caller already holds the
+    representation with this etag, so no DTO was built. It carries no download_url: a presigned URL
+    expires while the etag stays valid, so it is served by the download endpoint instead.
+    """
+    patient_id: UUID
+    etag: str
+    last_modified: datetime
+    consultation: Optional[ConsultationDTO] = None
+
+
+class VersionedConsultationListDTO(BaseModel):
+    """
+    A filtered consultation list with its validators; consultations is None when the etag matched.
+    As with VersionedConsultationDTO, the consultations carry no download_url.
+    """
+    etag: str
+    last_modified: Optional[datetime] = None
+    consultations: Optional[List[ConsultationDTO]] = None
+
+
+class ConsultationViewDTO(BaseModel):
+    """Dashboard row of a consultation, read from the denormalized consultation_views collection."""
+    model_config = ConfigDict(from_attributes=True)
+
+    id: UUID
+    patient_id: UUID
+    patient_name: str
+    status: ConsultationStatus
+    file_name: str
+    created_at: datetime
+    updated_at: datetime
+    expert_id: Optional[UUID] = None
+    expert_name: Optional[str] = None
+    modality: Optional[str] = None
+    body_part: Optional[str] = None
+    completed_at: Optional[datetime] = None
+
+
+class DraftReportJobDTO(BaseModel):
+    id: UUID
+    consultation_id: UUID
+    status: DraftReportJobStatus
+    report: Optional[str] = None
+    message: str = ""
+    created_at: datetime
+    started_at: Optional[datetime] = None
+    finished_at: Optional[datetime] = None
+
+
+def to_consultation_dto(consultation: Consultation, download_url: Optional[str] = None) -> ConsultationDTO:
+    """
+    Map a consultation entity to its DTO. The whole tree is validated from one plain dict in a single call,
+    which pydantic runs in compiled code; that is cheaper than one constructor per nested model and, on
+    pydantic 2, cheaper than model_construct too. List endpoints map thousands of rows this way.
+    """
+    return ConsultationDTO.model_validate(_consultation_fields(consultation, consultation.imaging_study.file_path)
+                                          | {"download_url": download_url})
+
+
+def to_consultation_summary(consultation: Consultation) -> ConsultationSummaryDTO:
+    """Map a consultation entity to the summary embedded in notifications, without the storage path."""
+    return ConsultationSummaryDTO.model_validate(_consultation_fields(consultation, None))
+
+
+def _consultation_fields(consultation: Consultation, file_path: Optional[str]) -> Dict[str, Any]:
+    study, metadata, report = consultation.imaging_study, consultation.imaging_study.metadata, consultation.report
+    return {
+        "id": consultation.id,
+        "patient_id": consultation.patient_id,
+        "imaging_study": {
+            "file_name": study.file_name,
+            "content_type": study.content_type,
+            "size": study.size,
+            "upload_date": study.upload_date,
+            "file_path": file_path,
+            "metadata": None if metadata is None else {
+                "modality": metadata.modality,
+                "body_part": metadata.body_part,
+                "rows": metadata.rows,
+                "columns": metadata.columns,
+                "study_date": metadata.study_date,
+            },
+        },
+        "status": consultation.status,
+        "created_at": consultation.created_at,
+        "report": None if report is None else {
+            "content": report.content,
+            "created_at": report.created_at,
+            "expert_id": report.expert_id,
+            "consultation_id": report.consultation_id,
+        },
+        "expert_id": str(consultation.expert_id) if consultation.expert_id else None,
+        "completed_at": consultation.completed_at,
+    }
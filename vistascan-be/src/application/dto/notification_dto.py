@@ -0,0 +1,24 @@
+from datetime import datetime
+from typing import Optional, List, Dict, Any
+from pydantic import BaseModel
+
+
+class NotificationDTO(BaseModel):
+    seq: int
+    event: Dict[str, Any]
+    created_at: datetime
+    acknowledged_at: Optional[datetime] = None
+
+
+class NotificationPageDTO(BaseModel):
+    items: List[NotificationDTO]
+    next_cursor: Optional[int] = None
+
+
+class AcknowledgeNotificationsRequest(BaseModel):
+    seqs: List[int] = []
+    up_to_seq: Optional[int] = None
+
+
+class AcknowledgeNotificationsResponse(BaseModel):
+    acknowledged: int
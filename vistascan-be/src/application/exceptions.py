@@ -9,4 +9,34 @@ class InvalidCredentials(Exception):
     """Raised when the provided credentials are invalid."""
     def __init__(self, message="Invalid username or password."):
         self.message = message
-        super().__init__(self.message)
\ No newline at end of file
+        super().__init__(self.message)
+
+class ConsultationNotFound(Exception):
+    """Raised when a consultation referenced by a request does not exist."""
+    def __init__(self, message="Consultation not found."):
+        self.message = message
+        super().__init__(self.message)
+
+class ConsultationAccessDenied(Exception):
+    """Raised when a user acts on a consultation they are not assigned to."""
+    def __init__(self, message="User is not allowed to access this consultation."):
+        self.message = message
+        super().__init__(self.message)
+
+class JobNotFound(Exception):
+    """Raised when a background job referenced by a request does not exist."""
+    def __init__(self, message="Job not found."):
+        self.message = message
+        super().__init__(self.message)
+
+class JobQueueFull(Exception):
+    """Raised when a background job cannot be queued because the queue is at capacity."""
+    def __init__(self, message="Too many pending jobs, try again later."):
+        self.message = message
+        super().__init__(self.message)
+
+class ReportGenerationFailed(Exception):
+    """Raised when the AI model service fails to produce a report."""
+    def __init__(self, message="AI report generation failed."):
+        self.message = message
+        super().__init__(self.message)
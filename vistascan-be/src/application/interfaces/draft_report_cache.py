@@ -0,0 +1,15 @@
+from abc import ABC, abstractmethod
+from typing import Optional
+
+
+class DraftReportCache(ABC):
+    """Cache of AI draft reports keyed by study content hash and model version."""
+    @abstractmethod
+    def get(self, content_hash: str, model_version: str) -> Optional[str]:
+        """Return the cached report for an image and model version, if there is one."""
+        ...
+
+    @abstractmethod
+    def put(self, content_hash: str, model_version: str, report: str) -> None:
+        """Store the report generated for an image by a model version."""
+        ...
@@ -1,31 +1,43 @@
 from abc import ABC, abstractmethod
+from typing import Optional
+
+from application.dto.consultation_dto import ConsultationSummaryDTO, DraftReportJobDTO
 
 
 class EventHandler(ABC):
     """Interface for handling application events"""
 
     @abstractmethod
-    def notify_consultation_created(self, consultation_id: str, patient_id: str):
+    def notify_consultation_created(self, consultation_id: str, patient_id: str,
+                                    consultation: Optional[ConsultationSummaryDTO] = None):
         """Notify when a new consultation is created"""
         ...
 
     @abstractmethod
-    def notify_consultation_assigned(self, consultation_id: str, patient_id: str, expert_id: str):
+    def notify_consultation_assigned(self, consultation_id: str, patient_id: str, expert_id: str,
+                                     consultation: Optional[ConsultationSummaryDTO] = None):
         """Notify when a consultation is assigned to an expert"""
         ...
 
     @abstractmethod
     def notify_consultation_status_changed(self, consultation_id: str, patient_id: str,
-                                                expert_id: str, old_status: str, new_status: str):
+                                                expert_id: str, old_status: str, new_status: str,
+                                                consultation: Optional[ConsultationSummaryDTO] = None):
             """Notify when the status of a consultation changes"""
             ...
 
     @abstractmethod
-    def notify_consultation_completed(self, consultation_id: str, patient_id: str, expert_id: str):
+    def notify_consultation_completed(self, consultation_id: str, patient_id: str, expert_id: str,
+                                      consultation: Optional[ConsultationSummaryDTO] = None):
         """Notify when a consultation is completed"""
         ...
 
     @abstractmethod
-    def notify_consultation_deleted(self, consultation_id: str, patient_id: str):
+    def notify_consultation_deleted(self, consultation_id: str, patient_id: str, expert_id: Optional[str] = None):
         """Notify when a consultation is deleted"""
         ...
+
+    @abstractmethod
+    def notify_draft_report_ready(self, job: DraftReportJobDTO, patient_id: str, expert_id: str):
+        """Notify the requesting expert when an AI draft report job finishes"""
+        ...
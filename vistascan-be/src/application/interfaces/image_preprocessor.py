@@ -0,0 +1,28 @@
+from abc import ABC, abstractmethod
+from typing import Optional
+
+
+class ImagePreprocessor(ABC):
+    """Interface for turning an uploaded study into the image the AI model consumes."""
+    @property
+    @abstractmethod
+    def variant(self) -> str:
+        """Identify the preprocessing settings, so derived images made with other settings are not reused."""
+        ...
+
+    @property
+    @abstractmethod
+    def content_type(self) -> str:
+        """Content type of the preprocessed images."""
+        ...
+
+    @abstractmethod
+    async def preprocess(self, data: bytes) -> Optional[bytes]:
+        """Decode, normalize, resize and re-encode a study. Returns None when the study cannot be decoded."""
+        ...
+
+    @abstractmethod
+    async def render(self, data: bytes, max_size: int, window_center: Optional[float] = None,
+                     window_width: Optional[float] = None) -> Optional[bytes]:
+        """Render a study as a PNG for display, optionally with an explicit intensity window."""
+        ...
@@ -0,0 +1,32 @@
+from abc import ABC, abstractmethod
+from typing import Any, AsyncContextManager, Awaitable, Callable, Dict
+
+Job = Callable[[], Awaitable[None]]
+
+
+class JobQueue(ABC):
+    """Interface for running background jobs with bounded concurrency."""
+    @abstractmethod
+    def submit(self, job: Job) -> bool:
+        """Queue a job for execution. Returns False when the queue is full."""
+        ...
+
+    @abstractmethod
+    def is_busy(self) -> bool:
+        """Whether every worker is occupied or jobs are waiting."""
+        ...
+
+    @abstractmethod
+    def slot(self) -> AsyncContextManager[None]:
+        """Hold one of the queue's concurrency slots while running work inline rather than as a queued job."""
+        ...
+
+    @abstractmethod
+    def cancel_running(self) -> int:
+        """Cancel the jobs currently running, freeing their workers, and return how many were cancelled."""
+        ...
+
+    @abstractmethod
+    def stats(self) -> Dict[str, Any]:
+        """Return queue depth, concurrency and completion counters."""
+        ...
@@ -1,11 +1,32 @@
 from abc import ABC, abstractmethod
-from typing import BinaryIO
+from typing import AsyncIterator, BinaryIO, Callable, Iterator
 
 from domain.entities.report import ReportGenerationResult
 
+# Opens a fresh chunk iterator over a study each time it is called, so a request can be replayed.
+StudyStreamOpener = Callable[[], Iterator[bytes]]
+
 
 class ModelClient(ABC):
     @abstractmethod
-    async def generate_report(self, image_data: BinaryIO, filename: str) -> ReportGenerationResult:
+    async def generate_report(self, image_data: BinaryIO, filename: str,
+                              content_type: str = "image/jpeg") -> ReportGenerationResult:
         """Generate a medical report from an image using the AI model service"""
-        ...
\ No newline at end of file
+        ...
+
+    @abstractmethod
+    async def generate_report_stream(self, open_stream: StudyStreamOpener, filename: str,
+                                     content_type: str = "image/jpeg") -> ReportGenerationResult:
+        """Generate a medical report from an image streamed to the AI model service in chunks"""
+        ...
+
+    @abstractmethod
+    def stream_report(self, open_stream: StudyStreamOpener, filename: str,
+                      content_type: str = "image/jpeg") -> AsyncIterator[str]:
+        """Generate a medical report and yield its text piece by piece as the AI model service produces it"""
+        ...
+
+    @abstractmethod
+    def is_available(self) -> bool:
+        """Whether the AI model service is currently accepting requests"""
+        ...
@@ -1,9 +1,13 @@
 from abc import ABC, abstractmethod
+from datetime import date
 from typing import Optional, List
 from uuid import UUID
 
-from domain.entities.user import User
+from domain.entities.user import User, UserRole
 from domain.entities.consultation import Consultation, ConsultationStatus
+from domain.entities.consultation_view import ConsultationView
+from domain.entities.event import InboxNotification
+from domain.entities.job import DraftReportJob
 
 class UserRepository(ABC):
     """Repository interface for CRUD operations on User entities."""
@@ -17,6 +21,20 @@ class UserRepository(ABC):
         """Find a User by its ID."""
         ...
 
+    @abstractmethod
+    def find_by_ids(self, user_ids: List[UUID]) -> List[User]:
+        """Find the Users with the given IDs in a single query; missing IDs are left out."""
+        ...
+
+    async def load(self, user_id: UUID) -> Optional[User]:
+        """Find a User by its ID; lookups awaited in the same tick may be batched into one query."""
+        return self.find_by_id(user_id)
+
+    async def load_many(self, user_ids: List[UUID]) -> List[Optional[User]]:
+        """Find Users by ID in one query, in the order given, with None for missing IDs."""
+        by_id = {user.id: user for user in self.find_by_ids(user_ids)}
+        return [by_id.get(user_id) for user_id in user_ids]
+
     @abstractmethod
     def find_by_email(self, email: str) -> Optional[User]:
         """Find a User by its email."""
@@ -27,6 +45,11 @@ class UserRepository(ABC):
         """Find a User by its username."""
         ...
 
+    @abstractmethod
+    def find_by_role(self, role: UserRole) -> List[User]:
+        """Find all Users with the given role."""
+        ...
+
     @abstractmethod
     def find_all(self) -> List[User]:
         """Find all Users."""
@@ -60,6 +83,20 @@ class ConsultationRepository(ABC):
         """Find a consultation by its ID."""
         ...
 
+    @abstractmethod
+    def find_by_ids(self, consultation_ids: List[UUID]) -> List[Consultation]:
+        """Find the consultations with the given IDs in a single query; missing IDs are left out."""
+        ...
+
+    async def load(self, consultation_id: UUID) -> Optional[Consultation]:
+        """Find a consultation by its ID; lookups awaited in the same tick may be batched into one query."""
+        return self.find_by_id(consultation_id)
+
+    async def load_many(self, consultation_ids: List[UUID]) -> List[Optional[Consultation]]:
+        """Find consultations by ID in one query, in the order given, with None for missing IDs."""
+        by_id = {consultation.id: consultation for consultation in self.find_by_ids(consultation_ids)}
+        return [by_id.get(consultation_id) for consultation_id in consultation_ids]
+
     @abstractmethod
     def find_by_patient_id(self, patient_id: UUID) -> List[Consultation]:
         """Find  all consultations associated to a patient."""
@@ -75,7 +112,100 @@ class ConsultationRepository(ABC):
         """Find all consultations with a specific status."""
         ...
 
+    @abstractmethod
+    def find_by_study_metadata(self, modality: Optional[str] = None, body_part: Optional[str] = None,
+                               study_date_from: Optional[date] = None,
+                               study_date_to: Optional[date] = None) -> List[Consultation]:
+        """Find all consultations whose study metadata matches every given criterion."""
+        ...
+
     @abstractmethod
     def find_all(self) -> List[Consultation]:
         """Find all Consultations."""
         ...
+
+    @abstractmethod
+    def set_content_hash(self, consultation_id: UUID, content_hash: str) -> bool:
+        """Set the content hash of a consultation's study alone, leaving its version as it is."""
+        ...
+
+    @abstractmethod
+    def set_draft_report(self, consultation_id: UUID, draft_report: str, model_version: str) -> bool:
+        """Set a consultation's draft report and the model version that wrote it, leaving the rest as it is."""
+        ...
+
+    @abstractmethod
+    def set_preprocessed_study(self, consultation_id: UUID, preprocessed_path: str, preprocessed_variant: str) -> bool:
+        """Set where the preprocessed image of a consultation's study is stored, leaving the rest as it is."""
+        ...
+
+
+class ConsultationViewRepository(ABC):
+    """Repository interface for the denormalized consultation read model behind dashboards."""
+    @abstractmethod
+    def save(self, view: ConsultationView) -> Optional[ConsultationView]:
+        """Insert or replace the view of a consultation."""
+        ...
+
+    @abstractmethod
+    def save_many(self, views: List[ConsultationView]) -> int:
+        """Insert or replace many views at once and return how many were written."""
+        ...
+
+    @abstractmethod
+    def delete_by_id(self, consultation_id: UUID) -> bool:
+        """Delete the view of a consultation."""
+        ...
+
+    @abstractmethod
+    def rename_user(self, user_id: UUID, full_name: str) -> int:
+        """Update a user's name on every view where they are the patient or the expert."""
+        ...
+
+    @abstractmethod
+    def find(self, status: Optional[ConsultationStatus] = None, expert_id: Optional[UUID] = None,
+             patient_id: Optional[UUID] = None, limit: int = 100) -> List[ConsultationView]:
+        """Find the newest views matching every given criterion."""
+        ...
+
+
+class NotificationRepository(ABC):
+    """Repository interface for the persisted notification inbox."""
+    @abstractmethod
+    def save_many(self, notifications: List[InboxNotification]) -> int:
+        """Persist a batch of notifications and return how many were written."""
+        ...
+
+    @abstractmethod
+    def find_by_user_id(self, user_id: UUID, before_seq: Optional[int], limit: int,
+                        unacknowledged_only: bool = False) -> List[InboxNotification]:
+        """Find a page of a user's notifications, newest first, with a sequence number below before_seq."""
+        ...
+
+    @abstractmethod
+    def acknowledge(self, user_id: UUID, seqs: List[int]) -> int:
+        """Mark the given notifications of a user as acknowledged and return how many were updated."""
+        ...
+
+    @abstractmethod
+    def acknowledge_up_to(self, user_id: UUID, seq: int) -> int:
+        """Mark all notifications of a user up to a sequence number as acknowledged."""
+        ...
+
+
+class DraftReportJobRepository(ABC):
+    """Repository interface for asynchronous draft report jobs."""
+    @abstractmethod
+    def save(self, job: DraftReportJob) -> Optional[DraftReportJob]:
+        """Persist a DraftReportJob (new or updated)."""
+        ...
+
+    @abstractmethod
+    def find_by_id(self, job_id: UUID) -> Optional[DraftReportJob]:
+        """Find a job by its ID."""
+        ...
+
+    @abstractmethod
+    def find_active_by_consultation_id(self, consultation_id: UUID) -> Optional[DraftReportJob]:
+        """Find the queued or running job of a consultation, if there is one."""
+        ...
@@ -1,7 +1,10 @@
 from abc import ABC, abstractmethod
-from typing import Optional, List, Dict, Any
+from typing import Optional, List, Dict, Any, AsyncIterator, Collection
 from uuid import UUID
 
+from domain.entities.consultation import ConsultationStatus
+from domain.entities.user import UserRole
+
 from application.dto.user_dto import (
     AuthUserRequest,
     AuthResponse,
@@ -12,7 +15,17 @@ from application.dto.consultation_dto import (
     CreateConsultationRequest,
     AssignConsultationRequest,
     SubmitReportRequest,
-    ConsultationDTO
+    ConsultationDTO,
+    DraftReportJobDTO,
+    StudyMetadataFilter,
+    ConsultationViewDTO,
+    VersionedConsultationDTO,
+    VersionedConsultationListDTO,
+)
+from application.dto.notification_dto import (
+    NotificationPageDTO,
+    AcknowledgeNotificationsRequest,
+    AcknowledgeNotificationsResponse,
 )
 
 class UserAuthenticationUseCase(ABC):
@@ -65,11 +78,57 @@ class ManageConsultationsUseCase(ABC):
         """Retrieve all consultations assigned to an expert."""
         ...
 
+    @abstractmethod
+    def get_by_study_metadata(self, metadata_filter: StudyMetadataFilter) -> List[ConsultationDTO]:
+        """Retrieve consultations whose study metadata matches the filter."""
+        ...
+
+    @abstractmethod
+    def get_versioned(self, consultation_id: UUID,
+                      known_etags: Collection[str] = ()) -> Optional[VersionedConsultationDTO]:
+        """Retrieve a consultation with its ETag, skipping the DTO when the caller already has that version."""
+        ...
+
+    @abstractmethod
+    def get_filtered(self, role: UserRole, user_id: Optional[UUID] = None,
+                     status: Optional[ConsultationStatus] = None,
+                     metadata_filter: Optional[StudyMetadataFilter] = None,
+                     known_etags: Collection[str] = ()) -> VersionedConsultationListDTO:
+        """Retrieve consultations matching every given filter with the list's ETag, skipping the DTOs on a match."""
+        ...
+
+    @abstractmethod
+    def get_dashboard(self, status: Optional[ConsultationStatus] = None, expert_id: Optional[UUID] = None,
+                      patient_id: Optional[UUID] = None, limit: int = 100) -> List[ConsultationViewDTO]:
+        """Retrieve the newest dashboard rows matching every given criterion, from the read model."""
+        ...
+
+    @abstractmethod
+    def render_study_preview(self, consultation_id: UUID, max_size: int, window_center: Optional[float] = None,
+                             window_width: Optional[float] = None) -> Optional[bytes]:
+        """Render a consultation's study as a PNG for display."""
+        ...
+
     @abstractmethod
     def generate_draft_report(self, consultation_id: UUID, user_id: UUID) -> Dict[str, Any]:
         """Generate a draft report for a consultation and return the report content."""
         ...
 
+    @abstractmethod
+    def stream_draft_report(self, consultation_id: UUID, user_id: UUID) -> AsyncIterator[Dict[str, Any]]:
+        """Generate a draft report for a consultation, yielding its text as it is produced."""
+        ...
+
+    @abstractmethod
+    def submit_draft_report(self, consultation_id: UUID, user_id: UUID) -> DraftReportJobDTO:
+        """Queue an asynchronous draft report generation and return its job."""
+        ...
+
+    @abstractmethod
+    def get_draft_report_job(self, job_id: UUID, user_id: UUID) -> DraftReportJobDTO:
+        """Retrieve the status and result of a draft report job."""
+        ...
+
 class AdminManagementUseCase(ABC):
     """Interface for admin management operations."""
 
@@ -97,3 +156,23 @@ class AdminManagementUseCase(ABC):
     def delete_consultation(self, consultation_id: UUID) -> bool:
         """Delete a consultation from the system."""
         ...
+
+    @abstractmethod
+    def rebuild_consultation_views(self) -> int:
+        """Re-project every consultation into the dashboard read model and return how many were written."""
+        ...
+
+
+class ManageNotificationsUseCase(ABC):
+    """Interface for reading and acknowledging the persisted notification inbox."""
+
+    @abstractmethod
+    def get_inbox(self, user_id: UUID, before_seq: Optional[int], limit: int,
+                  unacknowledged_only: bool = False) -> NotificationPageDTO:
+        """Retrieve a page of a user's notifications, newest first."""
+        ...
+
+    @abstractmethod
+    def acknowledge(self, user_id: UUID, dto: AcknowledgeNotificationsRequest) -> AcknowledgeNotificationsResponse:
+        """Acknowledge notifications of a user by sequence number."""
+        ...
@@ -1,5 +1,5 @@
 from abc import ABC, abstractmethod
-from typing import BinaryIO, Optional, Tuple
+from typing import BinaryIO, Iterator, Optional, Tuple
 from uuid import UUID
 
 
@@ -15,6 +15,11 @@ class FileStorageService(ABC):
         """Retrieve a file from the storage service based on its path."""
         ...
 
+    @abstractmethod
+    def stream(self, path: str, chunk_size: int) -> Iterator[bytes]:
+        """Iterate over a file in chunks of at most chunk_size bytes without loading it whole."""
+        ...
+
     @abstractmethod
     def delete(self, file_path: str) -> bool:
         """Delete a file from the storage service based on its path."""
@@ -0,0 +1,12 @@
+from abc import ABC, abstractmethod
+from typing import Optional
+
+from domain.entities.study import StudyMetadata
+
+
+class StudyMetadataReader(ABC):
+    """Interface for extracting header metadata from an uploaded study."""
+    @abstractmethod
+    def read(self, data: bytes) -> Optional[StudyMetadata]:
+        """Parse the study's headers without decoding its pixels. Returns None for formats without headers."""
+        ...
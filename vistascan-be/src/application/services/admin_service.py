@@ -8,8 +8,9 @@ from application.interfaces.services import AdminManagementUseCase
 from application.interfaces.repositories import UserRepository, ConsultationRepository
 from application.interfaces.security import PasswordHasher
 from application.dto.user_dto import UserDTO, UpdateUserRequest
-from application.dto.consultation_dto import ConsultationDTO, ImagingStudyDTO, ReportDTO
+from application.dto.consultation_dto import ConsultationDTO, to_consultation_dto
 from application.interfaces.storage import FileStorageService
+from application.services.consultation_view_projector import ConsultationViewProjector
 from domain.entities.user import User
 
 
@@ -20,13 +21,15 @@ class AdminService(AdminManagementUseCase):
             consultation_repository: ConsultationRepository,
             file_storage_service: FileStorageService,
             websocket_manager: EventHandler,
-            password_hasher: PasswordHasher
+            password_hasher: PasswordHasher,
+            view_projector: Optional[ConsultationViewProjector] = None
     ):
         self._user_repo = user_repository
         self._consultation_repo = consultation_repository
         self._storage_service = file_storage_service
         self._websocket_manager = websocket_manager
         self._password_hasher = password_hasher
+        self._view_projector = view_projector
 
     def get_all_users(self) -> List[UserDTO]:
         try:
@@ -39,7 +42,7 @@ class AdminService(AdminManagementUseCase):
     def get_all_consultations(self) -> List[ConsultationDTO]:
         try:
             consultations = self._consultation_repo.find_all()
-            return [self._consultation_to_dto(consultation) for consultation in consultations]
+            return [to_consultation_dto(consultation, consultation.download_url) for consultation in consultations]
         except Exception as e:
             logging.error(f"Error fetching all consultations: {e}")
             return []
@@ -68,6 +71,8 @@ class AdminService(AdminManagementUseCase):
 
             updated_user = self._user_repo.update(user)
             if updated_user:
+                if update_data.full_name is not None and self._view_projector is not None:
+                    self._view_projector.rename_user(updated_user)
                 return self._user_to_dto(updated_user)
 
             return None
@@ -84,18 +89,23 @@ class AdminService(AdminManagementUseCase):
 
     async def delete_consultation(self, consultation_id: UUID) -> bool:
         try:
-            consultation = self._consultation_repo.find_by_id(consultation_id)
+            consultation = await self._consultation_repo.load(consultation_id)
             if not consultation:
                 logging.warning(f"Consultation with ID {consultation_id} not found.")
                 return False
             deleted = self._consultation_repo.delete_by_id(consultation_id)
             if deleted:
                 self._storage_service.delete(consultation.imaging_study.file_path)
+                if consultation.imaging_study.preprocessed_path:
+                    self._storage_service.delete(consultation.imaging_study.preprocessed_path)
                 logging.info(f"Consultation with ID {consultation_id} and corresponding imaging study deleted.")
+                if self._view_projector is not None:
+                    self._view_projector.remove(consultation_id)
 
                 await self._websocket_manager.notify_consultation_deleted(
                     str(consultation_id),
                     str(consultation.patient_id),
+                    str(consultation.expert_id) if consultation.expert_id else None,
                 )
             else:
                 logging.warning(f"Failed to delete consultation with ID {consultation_id}, cannot delete imaging study.")
@@ -105,6 +115,19 @@ class AdminService(AdminManagementUseCase):
             logging.error(f"Error deleting consultation {consultation_id}: {e}")
             return False
 
+    def rebuild_consultation_views(self) -> int:
+        if self._view_projector is None:
+            logging.warning("Consultation views rebuild requested but no read model is configured.")
+            return 0
+
+        try:
+            rebuilt = self._view_projector.rebuild(self._consultation_repo.find_all())
+            logging.info(f"Rebuilt {rebuilt} consultation views.")
+            return rebuilt
+        except Exception as e:
+            logging.error(f"Error rebuilding consultation views: {e}")
+            return 0
+
 
     @staticmethod
     def _user_to_dto(user: User) -> UserDTO:
@@ -117,34 +140,3 @@ class AdminService(AdminManagementUseCase):
             gender=user.gender,
             role=user.role
         )
-
-    @staticmethod
-    def _consultation_to_dto(consultation) -> ConsultationDTO:
-        imaging_study_dto = ImagingStudyDTO(
-            file_path=consultation.imaging_study.file_path,
-            file_name=consultation.imaging_study.file_name,
-            content_type=consultation.imaging_study.content_type,
-            size=consultation.imaging_study.size,
-            upload_date=consultation.imaging_study.upload_date
-        )
-
-        report_dto = None
-        if consultation.report:
-            report_dto = ReportDTO(
-                content=consultation.report.content,
-                created_at=consultation.report.created_at,
-                expert_id=str(consultation.report.expert_id),
-                consultation_id=str(consultation.report.consultation_id)
-            )
-
-        return ConsultationDTO(
-            id=str(consultation.id),
-            patient_id=str(consultation.patient_id),
-            imaging_study=imaging_study_dto,
-            status=consultation.status,
-            created_at=consultation.created_at,
-            report=report_dto,
-            expert_id=str(consultation.expert_id) if consultation.expert_id else None,
-            completed_at=consultation.completed_at,
-            download_url=consultation.download_url
-        )
@@ -1,20 +1,34 @@
+import asyncio
+import hashlib
+import io
 import logging
-from typing import Optional, List, Dict, Any
-from datetime import datetime
+from functools import partial
+from typing import Optional, List, Dict, Any, Tuple, AsyncIterator, Collection
+from datetime import datetime, timedelta
 from uuid import UUID
 
 from domain.entities.user import UserRole
 from domain.entities.study import ImagingStudy
 from domain.entities.report import Report
 from domain.entities.consultation import Consultation, ConsultationStatus
+from domain.entities.job import DraftReportJob
 
-from application.dto.consultation_dto import CreateConsultationRequest, ConsultationDTO, ImagingStudyDTO, \
-    AssignConsultationRequest, ReportDTO, SubmitReportRequest
+from application.dto.consultation_dto import CreateConsultationRequest, ConsultationDTO, \
+    AssignConsultationRequest, SubmitReportRequest, DraftReportJobDTO, StudyMetadataFilter, ConsultationViewDTO, \
+    VersionedConsultationDTO, VersionedConsultationListDTO, to_consultation_dto, to_consultation_summary
 from application.interfaces.services import ManageConsultationsUseCase
-from application.interfaces.repositories import ConsultationRepository, UserRepository
+from application.interfaces.repositories import ConsultationRepository, UserRepository, DraftReportJobRepository, \
+    ConsultationViewRepository
 from application.interfaces.storage import FileStorageService
 from application.interfaces.model_client import ModelClient
 from application.interfaces.event_handler import EventHandler
+from application.interfaces.job_queue import JobQueue
+from application.interfaces.draft_report_cache import DraftReportCache
+from application.interfaces.image_preprocessor import ImagePreprocessor
+from application.interfaces.study_metadata import StudyMetadataReader
+from application.exceptions import ConsultationNotFound, ConsultationAccessDenied, JobNotFound, JobQueueFull, \
+    ReportGenerationFailed
+from application.services.consultation_view_projector import ConsultationViewProjector
 
 
 class ConsultationService(ManageConsultationsUseCase):
@@ -24,7 +38,19 @@ class ConsultationService(ManageConsultationsUseCase):
             user_repository: UserRepository,
             file_storage_service: FileStorageService,
             websocket_manager: EventHandler,
-            model_client: ModelClient
+            model_client: ModelClient,
+            draft_report_job_repository: DraftReportJobRepository,
+            draft_report_queue: JobQueue,
+            draft_report_job_timeout: int = 600,
+            draft_report_cache: Optional[DraftReportCache] = None,
+            model_version: str = "",
+            study_chunk_size: int = 256 * 1024,
+            draft_pregeneration_queue: Optional[JobQueue] = None,
+            image_preprocessor: Optional[ImagePreprocessor] = None,
+            preprocess_model_input: bool = False,
+            metadata_reader: Optional[StudyMetadataReader] = None,
+            consultation_view_repository: Optional[ConsultationViewRepository] = None,
+            view_projector: Optional[ConsultationViewProjector] = None
     ):
         self._repo = consultation_repository
         self._user_repo = user_repository
@@ -32,20 +58,42 @@ class ConsultationService(ManageConsultationsUseCase):
 
         self._websocket_manager = websocket_manager
         self._model_service = model_client
+        self._job_repo = draft_report_job_repository
+        self._job_queue = draft_report_queue
+        self._job_timeout = timedelta(seconds=draft_report_job_timeout)
+        self._draft_cache = draft_report_cache
+        self._preprocessor = image_preprocessor
+        self._preprocess_model_input = preprocess_model_input and image_preprocessor is not None
+        # Drafts depend on what the model is fed as well as on the model, so key them by both.
+        self._model_version = f"{model_version}+{image_preprocessor.variant}" if self._preprocess_model_input \
+            else model_version
+        self._study_chunk_size = study_chunk_size
+        self._pregeneration_queue = draft_pregeneration_queue
+        self._metadata_reader = metadata_reader
+        self._view_repo = consultation_view_repository
+        self._view_projector = view_projector
 
     async def create(self, consultation_dto: CreateConsultationRequest) -> Optional[ConsultationDTO]:
-        patient = self._user_repo.find_by_id(consultation_dto.patient_id)
+        patient = await self._user_repo.load(consultation_dto.patient_id)
         if not patient:
             logging.error(f"Patient with ID {consultation_dto.patient_id} not found.")
             return None
 
+        metadata = None
+        content_type = consultation_dto.content_type
+        if self._metadata_reader is not None:
+            metadata = await asyncio.to_thread(self._metadata_reader.read, consultation_dto.file_data)
+            if metadata is not None:
+                # Browsers rarely know the DICOM media type and upload it as application/octet-stream.
+                content_type = "application/dicom"
+
         try:
             file_object = consultation_dto.get_file_object()
 
             file_path, file_size = self._storage.upload(
                 data=file_object,
                 filename=consultation_dto.file_name,
-                content_type=consultation_dto.content_type,
+                content_type=content_type,
                 user_id=consultation_dto.patient_id
             )
 
@@ -58,9 +106,11 @@ class ConsultationService(ManageConsultationsUseCase):
         imaging_study = ImagingStudy(
             file_path=file_path,
             file_name=consultation_dto.file_name,
-            content_type=consultation_dto.content_type,
+            content_type=content_type,
             size=file_size,
             upload_date=now,
+            content_hash=hashlib.sha256(consultation_dto.file_data).hexdigest(),
+            metadata=metadata,
         )
 
         consultation = Consultation(
@@ -77,36 +127,24 @@ class ConsultationService(ManageConsultationsUseCase):
             return None
 
         logging.info(f"Saved consultation successfully: {saved_consultation.id}")
+        await self._project(saved_consultation)
         await self._websocket_manager.notify_consultation_created(
             str(saved_consultation.id),
-            str(consultation_dto.patient_id)
-        )
-
-        download_url = self._storage.get_download_url(file_path)
-        imaging_study_dto = ImagingStudyDTO(
-            file_path=imaging_study.file_path,
-            file_name=imaging_study.file_name,
-            content_type=imaging_study.content_type,
-            size=imaging_study.size,
-            upload_date=imaging_study.upload_date,
+            str(consultation_dto.patient_id),
+            to_consultation_summary(saved_consultation),
         )
+        self._schedule_draft_pregeneration(saved_consultation.id)
 
-        return ConsultationDTO(
-            id=saved_consultation.id,
-            patient_id=consultation_dto.patient_id,
-            imaging_study=imaging_study_dto,
-            status=saved_consultation.status,
-            created_at=saved_consultation.created_at,
-            download_url=download_url,
-        )
+        return self._to_dto(saved_consultation)
 
     async def assign(self, dto: AssignConsultationRequest) -> Optional[ConsultationDTO]:
-        consultation = self._repo.find_by_id(dto.consultation_id)
+        # Both lookups are awaited in the same tick, so a request-scoped repository can batch them.
+        consultation, expert = await asyncio.gather(self._repo.load(dto.consultation_id),
+                                                    self._user_repo.load(dto.expert_id))
         if not consultation:
             logging.error(f"Consultation with ID {dto.consultation_id} not found.")
             return None
 
-        expert = self._user_repo.find_by_id(dto.expert_id)
         if not expert:
             logging.error(f"Expert with ID {dto.expert_id} not found.")
             return None
@@ -123,50 +161,21 @@ class ConsultationService(ManageConsultationsUseCase):
                 return None
 
             logging.info(f"Consultation assigned successfully: {updated_consultation.id}")
+            await self._project(updated_consultation)
             await self._websocket_manager.notify_consultation_assigned(
                 str(dto.consultation_id),
                 str(consultation.patient_id),
-                str(dto.expert_id)
-            )
-
-            imaging_study = updated_consultation.imaging_study
-            download_url = self._storage.get_download_url(imaging_study.file_path)
-
-            imaging_study_dto = ImagingStudyDTO(
-                file_path=imaging_study.file_path,
-                file_name=imaging_study.file_name,
-                content_type=imaging_study.content_type,
-                size=imaging_study.size,
-                upload_date=imaging_study.upload_date
+                str(dto.expert_id),
+                to_consultation_summary(updated_consultation),
             )
 
-            report_dto = None
-            if updated_consultation.report:
-                report = updated_consultation.report
-                report_dto = ReportDTO(
-                    content=report.content,
-                    created_at=report.created_at,
-                    expert_id=report.expert_id,
-                    consultation_id=report.consultation_id
-                )
-
-            return ConsultationDTO(
-                id=updated_consultation.id,
-                patient_id=updated_consultation.patient_id,
-                imaging_study=imaging_study_dto,
-                status=updated_consultation.status,
-                created_at=updated_consultation.created_at,
-                report=report_dto,
-                expert_id=str(updated_consultation.expert_id),
-                completed_at=updated_consultation.completed_at,
-                download_url=download_url
-            )
+            return self._to_dto(updated_consultation)
         except ValueError as e:
             logging.error(f"Error assigning consultation: {e}")
             return None
 
     async def annotate(self, dto: SubmitReportRequest) -> Optional[ConsultationDTO]:
-        consultation = self._repo.find_by_id(dto.consultation_id)
+        consultation = await self._repo.load(dto.consultation_id)
         if not consultation:
             logging.error(f"Consultation with ID {dto.consultation_id} not found.")
             return None
@@ -191,40 +200,15 @@ class ConsultationService(ManageConsultationsUseCase):
                 return None
 
             logging.info(f"Consultation annotated successfully: {updated_consultation.id}")
+            await self._project(updated_consultation)
             await self._websocket_manager.notify_consultation_completed(
                 str(dto.consultation_id),
                 str(consultation.patient_id),
-                str(dto.expert_id)
-            )
-
-            imaging_study = updated_consultation.imaging_study
-            download_url = self._storage.get_download_url(imaging_study.file_path)
-            imaging_study_dto = ImagingStudyDTO(
-                file_path=imaging_study.file_path,
-                file_name=imaging_study.file_name,
-                content_type=imaging_study.content_type,
-                size=imaging_study.size,
-                upload_date=imaging_study.upload_date
-            )
-
-            report_dto = ReportDTO(
-                content=report.content,
-                created_at=report.created_at,
-                expert_id=report.expert_id,
-                consultation_id=report.consultation_id
+                str(dto.expert_id),
+                to_consultation_summary(updated_consultation),
             )
 
-            return ConsultationDTO(
-                id=updated_consultation.id,
-                patient_id=updated_consultation.patient_id,
-                imaging_study=imaging_study_dto,
-                status=updated_consultation.status,
-                created_at=updated_consultation.created_at,
-                report=report_dto,
-                expert_id=str(updated_consultation.expert_id),
-                completed_at=updated_consultation.completed_at,
-                download_url=download_url
-            )
+            return self._to_dto(updated_consultation)
 
         except ValueError as e:
             logging.error(f"Error annotating consultation: {e}")
@@ -236,36 +220,7 @@ class ConsultationService(ManageConsultationsUseCase):
             logging.error(f"Consultation with ID {consultation_id} not found.")
             return None
 
-        download_url = self._storage.get_download_url(consultation.imaging_study.file_path)
-        imaging_study_dto = ImagingStudyDTO(
-            file_path=consultation.imaging_study.file_path,
-            file_name=consultation.imaging_study.file_name,
-            content_type=consultation.imaging_study.content_type,
-            size=consultation.imaging_study.size,
-            upload_date=consultation.imaging_study.upload_date
-        )
-
-        report_dto = None
-        if consultation.report:
-            report = consultation.report
-            report_dto = ReportDTO(
-                content=report.content,
-                created_at=report.created_at,
-                expert_id=report.expert_id,
-                consultation_id=report.consultation_id
-            )
-
-        return ConsultationDTO(
-            id=consultation.id,
-            patient_id=consultation.patient_id,
-            imaging_study=imaging_study_dto,
-            status=consultation.status,
-            created_at=consultation.created_at,
-            report=report_dto,
-            expert_id=str(consultation.expert_id),
-            completed_at=consultation.completed_at,
-            download_url=download_url
-        )
+        return self._to_dto(consultation)
 
     def get_by_expert_id(self, expert_id: UUID) -> List[ConsultationDTO]:
         consultations = self._repo.find_by_expert_id(expert_id)
@@ -273,41 +228,7 @@ class ConsultationService(ManageConsultationsUseCase):
             logging.error(f"No consultations found for expert ID {expert_id}.")
             return []
 
-        consultation_dtos = []
-        for consultation in consultations:
-            download_url = self._storage.get_download_url(consultation.imaging_study.file_path)
-
-            imaging_study_dto = ImagingStudyDTO(
-                file_path=consultation.imaging_study.file_path,
-                file_name=consultation.imaging_study.file_name,
-                content_type=consultation.imaging_study.content_type,
-                size=consultation.imaging_study.size,
-                upload_date=consultation.imaging_study.upload_date
-            )
-
-            report_dto = None
-            if consultation.report:
-                report = consultation.report
-                report_dto = ReportDTO(
-                    content=report.content,
-                    created_at=report.created_at,
-                    expert_id=report.expert_id,
-                    consultation_id=report.consultation_id
-                )
-
-            consultation_dtos.append(ConsultationDTO(
-                id=consultation.id,
-                patient_id=consultation.patient_id,
-                imaging_study=imaging_study_dto,
-                status=consultation.status,
-                created_at=consultation.created_at,
-                report=report_dto,
-                expert_id=str(consultation.expert_id),
-                completed_at=consultation.completed_at,
-                download_url=download_url
-            ))
-
-        return consultation_dtos
+        return [self._to_dto(consultation) for consultation in consultations]
 
     def get_by_patient_id(self, patient_id: UUID) -> List[ConsultationDTO]:
         consultations = self._repo.find_by_patient_id(patient_id)
@@ -315,89 +236,133 @@ class ConsultationService(ManageConsultationsUseCase):
             logging.error(f"No consultations found for patient ID {patient_id}.")
             return []
 
-        consultation_dtos = []
-        for consultation in consultations:
-            download_url = self._storage.get_download_url(consultation.imaging_study.file_path)
-
-            imaging_study_dto = ImagingStudyDTO(
-                file_path=consultation.imaging_study.file_path,
-                file_name=consultation.imaging_study.file_name,
-                content_type=consultation.imaging_study.content_type,
-                size=consultation.imaging_study.size,
-                upload_date=consultation.imaging_study.upload_date
-            )
-
-            report_dto = None
-            if consultation.report:
-                report = consultation.report
-                report_dto = ReportDTO(
-                    content=report.content,
-                    created_at=report.created_at,
-                    expert_id=report.expert_id,
-                    consultation_id=report.consultation_id
-                )
-
-            consultation_dtos.append(ConsultationDTO(
-                id=consultation.id,
-                patient_id=consultation.patient_id,
-                imaging_study=imaging_study_dto,
-                status=consultation.status,
-                created_at=consultation.created_at,
-                report=report_dto,
-                expert_id=str(consultation.expert_id),
-                completed_at=consultation.completed_at,
-                download_url=download_url
-            ))
-
-        return consultation_dtos
+        return [self._to_dto(consultation) for consultation in consultations]
 
     def get_by_status(self, status: ConsultationStatus) -> List[ConsultationDTO]:
         try:
             consultations = self._repo.find_by_status(status)
-            result = []
+            return [self._to_dto(consultation) for consultation in consultations]
+
+        except Exception as e:
+            logging.error(f"Error retrieving consultations by status {status}: {e}")
+            return []
 
-            for consultation in consultations:
+    def get_by_study_metadata(self, metadata_filter: StudyMetadataFilter) -> List[ConsultationDTO]:
+        try:
+            consultations = self._repo.find_by_study_metadata(
+                modality=metadata_filter.modality,
+                body_part=metadata_filter.body_part,
+                study_date_from=metadata_filter.study_date_from,
+                study_date_to=metadata_filter.study_date_to,
+            )
+            return [self._to_dto(consultation) for consultation in consultations]
 
-                download_url = self._storage.get_download_url(consultation.imaging_study.file_path)
+        except Exception as e:
+            logging.error(f"Error retrieving consultations by study metadata {metadata_filter}: {e}")
+            return []
 
-                imaging_study_dto = ImagingStudyDTO(
-                    file_path=consultation.imaging_study.file_path,
-                    file_name=consultation.imaging_study.file_name,
-                    content_type=consultation.imaging_study.content_type,
-                    size=consultation.imaging_study.size,
-                    upload_date=consultation.imaging_study.upload_date,
-                )
+    def get_versioned(self, consultation_id: UUID,
+                      known_etags: Collection[str] = ()) -> Optional[VersionedConsultationDTO]:
+        consultation = self._repo.find_by_id(consultation_id)
+        if not consultation:
+            logging.error(f"Consultation with ID {consultation_id} not found.")
+            return None
 
-                report_dto = None
-                if consultation.report:
-                    report = consultation.report
-                    report_dto = ReportDTO(
-                        content=report.content,
-                        created_at=report.created_at,
-                        expert_id=report.expert_id,
-                        consultation_id=report.consultation_id
-                    )
-
-                consultation_dto = ConsultationDTO(
-                    id=consultation.id,
-                    patient_id=consultation.patient_id,
-                    imaging_study=imaging_study_dto,
-                    status=consultation.status,
-                    created_at=consultation.created_at,
-                    expert_id=str(consultation.expert_id),
-                    completed_at=consultation.completed_at,
-                    download_url=download_url,
-                    report=report_dto,
+        # The ETag only tracks the stored version, so the representation leaves out the presigned download
+        # URL, which expires on its own; clients fetch a fresh one from the download endpoint.
+        etag = f'"{consultation.version}"'
+        return VersionedConsultationDTO(
+            patient_id=consultation.patient_id,
+            etag=etag,
+            last_modified=consultation.last_modified,
+            consultation=None if self._is_known(etag, known_etags) else to_consultation_dto(consultation),
+        )
+
+    def get_filtered(self, role: UserRole, user_id: Optional[UUID] = None,
+                     status: Optional[ConsultationStatus] = None,
+                     metadata_filter: Optional[StudyMetadataFilter] = None,
+                     known_etags: Collection[str] = ()) -> VersionedConsultationListDTO:
+        has_metadata = metadata_filter is not None and not metadata_filter.is_empty()
+
+        consultations: List[Consultation] = []
+        if user_id:
+            if role == UserRole.ADMIN:
+                consultations = self._repo.find_by_patient_id(user_id) + self._repo.find_by_expert_id(user_id)
+            elif role == UserRole.PATIENT:
+                consultations = self._repo.find_by_patient_id(user_id)
+            elif role == UserRole.EXPERT:
+                consultations = self._repo.find_by_expert_id(user_id)
+
+        if status:
+            if not user_id:
+                consultations = self._repo.find_by_status(status)
+            else:
+                consultations = [c for c in consultations if c.status == status]
+
+        if has_metadata:
+            if not user_id and not status:
+                consultations = self._repo.find_by_study_metadata(
+                    modality=metadata_filter.modality,
+                    body_part=metadata_filter.body_part,
+                    study_date_from=metadata_filter.study_date_from,
+                    study_date_to=metadata_filter.study_date_to,
                 )
+            else:
+                consultations = [c for c in consultations if metadata_filter.matches(c.imaging_study.metadata)]
+
+        # Without download URLs, as in get_versioned.
+        etag = self._list_etag(consultations)
+        return VersionedConsultationListDTO(
+            etag=etag,
+            last_modified=max((c.last_modified for c in consultations), default=None),
+            consultations=None if self._is_known(etag, known_etags)
+            else [to_consultation_dto(consultation) for consultation in consultations],
+        )
 
-                result.append(consultation_dto)
+    @staticmethod
+    def _list_etag(consultations: List[Consultation]) -> str:
+        # Versions are per consultation, so the highest version and the count would not change when any
+        # other consultation in the list is edited; a digest of every (id, version) pair does.
+        digest = hashlib.blake2b(digest_size=16)
+        for consultation in consultations:
+            digest.update(f"{consultation.id}:{consultation.version};".encode())
+        return f'"{len(consultations)}-{digest.hexdigest()}"'
 
-            return result
+    @staticmethod
+    def _is_known(etag: str, known_etags: Collection[str]) -> bool:
+        return etag in known_etags or "*" in known_etags
+
+    def get_dashboard(self, status: Optional[ConsultationStatus] = None, expert_id: Optional[UUID] = None,
+                      patient_id: Optional[UUID] = None, limit: int = 100) -> List[ConsultationViewDTO]:
+        if self._view_repo is None:
+            logging.error("Consultation dashboard requested but no read model is configured.")
+            return []
+
+        try:
+            views = self._view_repo.find(status=status, expert_id=expert_id, patient_id=patient_id, limit=limit)
+            return [ConsultationViewDTO.model_validate(view) for view in views]
 
         except Exception as e:
-            logging.error(f"Error retrieving consultations by status {status}: {e}")
+            logging.error(f"Error retrieving consultation dashboard: {e}")
             return []
 
+    async def render_study_preview(self, consultation_id: UUID, max_size: int,
+                                   window_center: Optional[float] = None,
+                                   window_width: Optional[float] = None) -> Optional[bytes]:
+        if self._preprocessor is None:
+            return None
+
+        consultation = self._repo.find_by_id(consultation_id)
+        if not consultation:
+            raise ConsultationNotFound(f"Consultation with ID {consultation_id} not found.")
+
+        image_data = await asyncio.to_thread(self._storage.get, consultation.imaging_study.file_path)
+        if not image_data:
+            logging.error(f"Failed to retrieve image for consultation {consultation_id}")
+            return None
+
+        return await self._preprocessor.render(image_data.read(), max_size, window_center, window_width)
+
     async def generate_draft_report(self, consultation_id: UUID, user_id: UUID) -> Dict[str, Any]:
         consultation = self._repo.find_by_id(consultation_id)
         if not consultation:
@@ -416,35 +381,123 @@ class ConsultationService(ManageConsultationsUseCase):
                 "message": f"User {user_id} is not authorized to generate report for consultation {consultation_id}"
             }
 
-        try:
-            image_data = self._storage.get(consultation.imaging_study.file_path)
-            if not image_data:
-                logging.error(f"Failed to retrieve image for consultation {consultation_id}")
-                return {
-                    "success": False,
-                    "report": "",
-                    "message": f"Failed to retrieve image for consultation {consultation_id}"
-                }
+        return await self._draft_report_for(consultation)
+
+    async def stream_draft_report(self, consultation_id: UUID, user_id: UUID) -> AsyncIterator[Dict[str, Any]]:
+        consultation = self._repo.find_by_id(consultation_id)
+        if not consultation:
+            raise ConsultationNotFound(f"Consultation with ID {consultation_id} not found.")
 
-            result = await self._model_service.generate_report(
-                image_data=image_data,
-                filename=consultation.imaging_study.file_name
+        if consultation.expert_id != user_id:
+            raise ConsultationAccessDenied(
+                f"User {user_id} is not authorized to generate report for consultation {consultation_id}"
             )
 
-            if result.success:
-                draft_report_notice = "[This report was automatically generated by AI and should be reviewed by a qualified radiologist.]"
-                return {
-                    "success": True,
-                    "report": f"AI-Generated Report:\n\n{result.report}\n\nf{draft_report_notice}",
-                    "message": "Draft report generated successfully"
-                }
+        return self._stream_draft_report_for(consultation)
+
+    async def _stream_draft_report_for(self, consultation: Consultation) -> AsyncIterator[Dict[str, Any]]:
+        """
+        Yield the draft's text as token events while the model decodes it, then a done event with the
+        complete draft, AI notice included, or an error event. Known drafts arrive as a single token.
+        """
+        try:
+            try:
+                report = await self._known_draft(consultation)
+            except Exception as e:
+                logging.error(f"Failed to retrieve image for consultation {consultation.id}: {e}")
+                yield {"type": "error", "message": f"Failed to retrieve image for consultation {consultation.id}"}
+                return
+
+            if report is None:
+                file_path, file_name, content_type = await self._model_input(consultation)
+                parts = []
+                # A stream is an interactive draft too: it holds one of the draft job pool's slots, so streams
+                # and queued drafts share one concurrency limit, and it pushes speculative drafts aside.
+                self._preempt_pregeneration()
+                async with self._job_queue.slot():
+                    async for text in self._model_service.stream_report(
+                            open_stream=partial(self._storage.stream, file_path, self._study_chunk_size),
+                            filename=file_name,
+                            content_type=content_type
+                    ):
+                        parts.append(text)
+                        yield {"type": "token", "text": text}
+
+                report = "".join(parts)
+                if self._draft_cache is not None:
+                    self._draft_cache.put(consultation.imaging_study.content_hash, self._model_version, report)
             else:
-                logging.error(f"AI report generation failed: {result.message}")
+                logging.info(f"Serving cached draft report for consultation {consultation.id}")
+                yield {"type": "token", "text": report}
+
+            if report != self._stored_draft(consultation):
+                self._store_draft(consultation.id, report)
+
+            yield {"type": "done", "report": self._with_notice(report)}
+        except ReportGenerationFailed as e:
+            logging.error(f"AI report generation failed: {e.message}")
+            yield {"type": "error", "message": f"AI report generation failed: {e.message}"}
+        except Exception as e:
+            logging.error(f"Error generating AI report: {e}")
+            yield {"type": "error", "message": f"Error generating AI report: {str(e)}"}
+
+    async def _known_draft(self, consultation: Consultation) -> Optional[str]:
+        """The stored or cached draft for the consultation's study, if the current model already made one."""
+        study = consultation.imaging_study
+        report = self._stored_draft(consultation) or self._cached_draft(study.content_hash)
+        if report is None and study.content_hash is None:
+            # Studies uploaded before hashing was introduced are hashed once. Only the hash is written: the
+            # consultation was loaded before the hashing and may have changed since, and the hash is not part
+            # of the DTO, so it must not move the version clients hold ETags for.
+            study.content_hash = await asyncio.to_thread(self._hash_study, study.file_path)
+            self._repo.set_content_hash(consultation.id, study.content_hash)
+            report = self._cached_draft(study.content_hash)
+        return report
+
+    async def _draft_report_for(self, consultation: Consultation) -> Dict[str, Any]:
+        try:
+            study = consultation.imaging_study
+            try:
+                report = await self._known_draft(consultation)
+            except Exception as e:
+                logging.error(f"Failed to retrieve image for consultation {consultation.id}: {e}")
                 return {
                     "success": False,
                     "report": "",
-                    "message": f"AI report generation failed: {result.message}"
+                    "message": f"Failed to retrieve image for consultation {consultation.id}"
                 }
+
+            if report is None:
+                file_path, file_name, content_type = await self._model_input(consultation)
+                # The study is piped from storage to the model service chunk by chunk, never held whole.
+                result = await self._model_service.generate_report_stream(
+                    open_stream=partial(self._storage.stream, file_path, self._study_chunk_size),
+                    filename=file_name,
+                    content_type=content_type
+                )
+
+                if not result.success:
+                    logging.error(f"AI report generation failed: {result.message}")
+                    return {
+                        "success": False,
+                        "report": "",
+                        "message": f"AI report generation failed: {result.message}"
+                    }
+
+                report = result.report
+                if self._draft_cache is not None:
+                    self._draft_cache.put(study.content_hash, self._model_version, report)
+            else:
+                logging.info(f"Serving cached draft report for consultation {consultation.id}")
+
+            if report != self._stored_draft(consultation):
+                self._store_draft(consultation.id, report)
+
+            return {
+                "success": True,
+                "report": self._with_notice(report),
+                "message": "Draft report generated successfully"
+            }
         except Exception as e:
             logging.error(f"Error generating AI report: {e}")
             return {
@@ -453,3 +506,201 @@ class ConsultationService(ManageConsultationsUseCase):
                 "message": f"Error generating AI report: {str(e)}"
             }
 
+    @staticmethod
+    def _with_notice(report: str) -> str:
+        draft_report_notice = "[This report was automatically generated by AI and should be reviewed by a qualified radiologist.]"
+        return f"AI-Generated Report:\n\n{report}\n\nf{draft_report_notice}"
+
+    def _stored_draft(self, consultation: Consultation) -> Optional[str]:
+        if consultation.draft_report_model_version != self._model_version:
+            return None
+        return consultation.draft_report
+
+    def _store_draft(self, consultation_id: UUID, report: str):
+        # Only the draft fields are written: the consultation may have been assigned or annotated while the
+        # model was running, and a full save of an older copy would undo that.
+        if not self._repo.set_draft_report(consultation_id, report, self._model_version):
+            logging.warning(f"Could not store the draft report of consultation {consultation_id}")
+
+    def _schedule_draft_pregeneration(self, consultation_id: UUID):
+        if self._pregeneration_queue is None:
+            return
+        if not self._pregeneration_queue.submit(partial(self._pregenerate_draft_report, consultation_id)):
+            logging.info(f"Skipping draft pre-generation for consultation {consultation_id}, queue is full")
+
+    def _preempt_pregeneration(self):
+        """Free the model service for an expert's draft by cancelling running speculative ones."""
+        if self._pregeneration_queue is None:
+            return
+        cancelled = self._pregeneration_queue.cancel_running()
+        if cancelled:
+            logging.info(f"Cancelled {cancelled} speculative draft generations for an interactive draft")
+
+    async def _pregenerate_draft_report(self, consultation_id: UUID):
+        """
+        Speculatively generate and store a consultation's draft before an expert asks for it.
+        Interactive drafts take precedence: the attempt is dropped while they are queued or the model
+        service is unavailable, and cancelled by _preempt_pregeneration() when one arrives while it runs;
+        the expert's own request then generates it on demand.
+        """
+        if self._job_queue.is_busy() or not self._model_service.is_available():
+            logging.info(f"Skipping draft pre-generation for consultation {consultation_id}, model service is busy")
+            return
+
+        consultation = self._repo.find_by_id(consultation_id)
+        if not consultation or consultation.status == ConsultationStatus.COMPLETED or self._stored_draft(consultation):
+            return
+
+        result = await self._draft_report_for(consultation)
+        if not result["success"]:
+            logging.warning(f"Draft pre-generation failed for consultation {consultation_id}: {result['message']}")
+
+    async def _model_input(self, consultation: Consultation) -> Tuple[str, str, str]:
+        """
+        Pick the object to send to the model service: the study's preprocessed image, made once and stored
+        next to the study, or the original upload when preprocessing is disabled or cannot decode it.
+        """
+        study = consultation.imaging_study
+        original = (study.file_path, study.file_name, study.content_type)
+        if not self._preprocess_model_input:
+            return original
+
+        variant = self._preprocessor.variant
+        extension = self._preprocessor.content_type.split("/")[-1]
+        file_name = f"{study.file_name.rsplit('.', 1)[0]}.{variant}.{extension}"
+        if study.preprocessed_variant == variant and study.preprocessed_path:
+            return study.preprocessed_path, file_name, self._preprocessor.content_type
+
+        image_data = await asyncio.to_thread(self._storage.get, study.file_path)
+        if not image_data:
+            return original
+
+        processed = await self._preprocessor.preprocess(image_data.read())
+        if processed is None:
+            return original
+
+        try:
+            file_path, _ = await asyncio.to_thread(
+                self._storage.upload, io.BytesIO(processed), file_name, self._preprocessor.content_type,
+                consultation.patient_id
+            )
+        except Exception as e:
+            logging.error(f"Error storing preprocessed image for consultation {consultation.id}: {e}")
+            return original
+
+        # Only the preprocessed image fields are written, so changes made to the consultation while the image
+        # was being processed are kept.
+        stale_path = study.preprocessed_path
+        if not self._repo.set_preprocessed_study(consultation.id, file_path, variant):
+            logging.warning(f"Could not record the preprocessed image of consultation {consultation.id}")
+        if stale_path:
+            self._storage.delete(stale_path)
+
+        return file_path, file_name, self._preprocessor.content_type
+
+    def _hash_study(self, file_path: str) -> str:
+        digest = hashlib.sha256()
+        for chunk in self._storage.stream(file_path, self._study_chunk_size):
+            digest.update(chunk)
+        return digest.hexdigest()
+
+    def _cached_draft(self, content_hash: Optional[str]) -> Optional[str]:
+        if self._draft_cache is None or content_hash is None:
+            return None
+        return self._draft_cache.get(content_hash, self._model_version)
+
+    async def submit_draft_report(self, consultation_id: UUID, user_id: UUID) -> DraftReportJobDTO:
+        consultation = self._repo.find_by_id(consultation_id)
+        if not consultation:
+            raise ConsultationNotFound(f"Consultation with ID {consultation_id} not found.")
+
+        if consultation.expert_id != user_id:
+            raise ConsultationAccessDenied(
+                f"User {user_id} is not authorized to generate report for consultation {consultation_id}"
+            )
+
+        # Repeated clicks while a draft is being generated attach to the job already in progress.
+        active_job = self._job_repo.find_active_by_consultation_id(consultation_id)
+        if active_job and not self._expire_if_stale(active_job):
+            return self._job_to_dto(active_job)
+
+        job = DraftReportJob(consultation_id=consultation_id, requested_by=user_id)
+        if not self._job_repo.save(job):
+            raise ValueError("Failed to save draft report job")
+
+        if not self._job_queue.submit(lambda: self._run_draft_report_job(job.id)):
+            job.fail("Too many pending draft reports")
+            self._job_repo.save(job)
+            raise JobQueueFull("Too many draft reports are being generated, try again later.")
+
+        self._preempt_pregeneration()
+        logging.info(f"Queued draft report job {job.id} for consultation {consultation_id}")
+        return self._job_to_dto(job)
+
+    def get_draft_report_job(self, job_id: UUID, user_id: UUID) -> DraftReportJobDTO:
+        job = self._job_repo.find_by_id(job_id)
+        if not job:
+            raise JobNotFound(f"Draft report job with ID {job_id} not found.")
+
+        if job.requested_by != user_id:
+            raise ConsultationAccessDenied(f"User {user_id} is not allowed to view draft report job {job_id}")
+
+        self._expire_if_stale(job)
+        return self._job_to_dto(job)
+
+    async def _run_draft_report_job(self, job_id: UUID):
+        job = self._job_repo.find_by_id(job_id)
+        if not job or not job.is_active():
+            return
+
+        job.start()
+        self._job_repo.save(job)
+
+        try:
+            result = await self.generate_draft_report(job.consultation_id, job.requested_by)
+        except asyncio.CancelledError:
+            # Cancelled by the pool stopping; leave the job finished rather than RUNNING until it expires.
+            job.fail("Draft report generation was cancelled")
+            self._job_repo.save(job)
+            raise
+        if result["success"]:
+            job.succeed(result["report"], result["message"])
+        else:
+            job.fail(result["message"])
+        self._job_repo.save(job)
+
+        consultation = self._repo.find_by_id(job.consultation_id)
+        await self._websocket_manager.notify_draft_report_ready(
+            self._job_to_dto(job),
+            str(consultation.patient_id) if consultation else "",
+            str(job.requested_by),
+        )
+
+    def _expire_if_stale(self, job: DraftReportJob) -> bool:
+        """Fail jobs left queued or running past the timeout, e.g. by a worker that restarted mid-job."""
+        if not job.is_active() or datetime.now() - job.created_at < self._job_timeout:
+            return False
+
+        job.fail("Draft report generation timed out")
+        self._job_repo.save(job)
+        return True
+
+    @staticmethod
+    def _job_to_dto(job: DraftReportJob) -> DraftReportJobDTO:
+        return DraftReportJobDTO(
+            id=job.id,
+            consultation_id=job.consultation_id,
+            status=job.status,
+            report=job.report,
+            message=job.message,
+            created_at=job.created_at,
+            started_at=job.started_at,
+            finished_at=job.finished_at,
+        )
+
+    async def _project(self, consultation: Consultation):
+        if self._view_projector is not None:
+            await self._view_projector.project(consultation)
+
+    def _to_dto(self, consultation: Consultation) -> ConsultationDTO:
+        return to_consultation_dto(consultation, self._storage.get_download_url(consultation.imaging_study.file_path))
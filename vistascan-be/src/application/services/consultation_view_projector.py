@@ -0,0 +1,69 @@
+import logging
+from typing import Dict, Iterable, List
+from uuid import UUID
+
+from domain.entities.consultation import Consultation
+from domain.entities.consultation_view import ConsultationView
+from domain.entities.user import User
+from application.interfaces.repositories import ConsultationViewRepository, UserRepository
+
+
+class ConsultationViewProjector:
+    """
+    Keeps the consultation_views read model in step with the write side. Services call it after each
+    consultation write and user rename; a failed projection is logged rather than failing the write,
+    and rebuild() brings the read model back in line from the consultations themselves.
+    """
+
+    def __init__(self, view_repository: ConsultationViewRepository, user_repository: UserRepository):
+        self._views = view_repository
+        self._user_repo = user_repository
+
+    async def project(self, consultation: Consultation):
+        try:
+            # Usually served from the request's loader: the service has just loaded both users.
+            user_ids = [user_id for user_id in (consultation.patient_id, consultation.expert_id) if user_id]
+            names = {user.id: user.full_name for user in await self._user_repo.load_many(user_ids) if user}
+            self._views.save(self._to_view(consultation, names))
+        except Exception as e:
+            logging.error(f"Error projecting consultation {consultation.id} to its view: {e}")
+
+    def remove(self, consultation_id: UUID):
+        try:
+            self._views.delete_by_id(consultation_id)
+        except Exception as e:
+            logging.error(f"Error removing view of consultation {consultation_id}: {e}")
+
+    def rename_user(self, user: User):
+        try:
+            self._views.rename_user(user.id, user.full_name)
+        except Exception as e:
+            logging.error(f"Error renaming user {user.id} in consultation views: {e}")
+
+    def rebuild(self, consultations: List[Consultation]) -> int:
+        """Re-project every given consultation, looking all their users up in one query."""
+        user_ids = [c.patient_id for c in consultations] + [c.expert_id for c in consultations]
+        names = self._names(user_ids)
+        return self._views.save_many([self._to_view(consultation, names) for consultation in consultations])
+
+    def _names(self, user_ids: Iterable[UUID]) -> Dict[UUID, str]:
+        unique_ids = list({user_id for user_id in user_ids if user_id is not None})
+        return {user.id: user.full_name for user in self._user_repo.find_by_ids(unique_ids)}
+
+    @staticmethod
+    def _to_view(consultation: Consultation, names: Dict[UUID, str]) -> ConsultationView:
+        metadata = consultation.imaging_study.metadata
+        return ConsultationView(
+            id=consultation.id,
+            patient_id=consultation.patient_id,
+            patient_name=names.get(consultation.patient_id, ""),
+            status=consultation.status,
+            file_name=consultation.imaging_study.file_name,
+            created_at=consultation.created_at,
+            updated_at=consultation.last_modified,
+            expert_id=consultation.expert_id,
+            expert_name=names.get(consultation.expert_id) if consultation.expert_id else None,
+            modality=metadata.modality if metadata else None,
+            body_part=metadata.body_part if metadata else None,
+            completed_at=consultation.completed_at,
+        )
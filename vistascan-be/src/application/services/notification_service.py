@@ -0,0 +1,53 @@
+import logging
+from typing import Optional
+from uuid import UUID
+
+from application.interfaces.services import ManageNotificationsUseCase
+from application.interfaces.repositories import NotificationRepository
+from application.dto.notification_dto import (
+    NotificationDTO,
+    NotificationPageDTO,
+    AcknowledgeNotificationsRequest,
+    AcknowledgeNotificationsResponse,
+)
+
+
+class NotificationService(ManageNotificationsUseCase):
+    def __init__(self, notification_repository: NotificationRepository):
+        self._repo = notification_repository
+
+    def get_inbox(self, user_id: UUID, before_seq: Optional[int], limit: int,
+                  unacknowledged_only: bool = False) -> NotificationPageDTO:
+        try:
+            notifications = self._repo.find_by_user_id(user_id, before_seq, limit + 1, unacknowledged_only)
+        except Exception as e:
+            logging.error(f"Error fetching notifications for user {user_id}: {e}")
+            return NotificationPageDTO(items=[])
+
+        page = notifications[:limit]
+        next_cursor = page[-1].seq if len(notifications) > limit else None
+
+        return NotificationPageDTO(
+            items=[
+                NotificationDTO(
+                    seq=notification.seq,
+                    event=notification.event,
+                    created_at=notification.created_at,
+                    acknowledged_at=notification.acknowledged_at,
+                )
+                for notification in page
+            ],
+            next_cursor=next_cursor,
+        )
+
+    def acknowledge(self, user_id: UUID, dto: AcknowledgeNotificationsRequest) -> AcknowledgeNotificationsResponse:
+        acknowledged = 0
+        try:
+            if dto.up_to_seq is not None:
+                acknowledged += self._repo.acknowledge_up_to(user_id, dto.up_to_seq)
+            if dto.seqs:
+                acknowledged += self._repo.acknowledge(user_id, dto.seqs)
+        except Exception as e:
+            logging.error(f"Error acknowledging notifications for user {user_id}: {e}")
+
+        return AcknowledgeNotificationsResponse(acknowledged=acknowledged)
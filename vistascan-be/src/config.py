@@ -23,6 +23,62 @@ class Settings:
     minio_secure: bool = os.getenv("MINIO_SECURE", "False").lower() == "true"
 
     model_service_url: str = os.getenv("MODEL_SERVICE_URL", "http://localhost:8001")
+    model_service_urls: list = [url for url in os.getenv("MODEL_SERVICE_URLS", "").split(",") if url]
+    model_service_balancing: str = os.getenv("MODEL_SERVICE_BALANCING", "least_outstanding")
+    model_version: str = os.getenv("MODEL_VERSION", "clip-xrgen")
+    model_service_timeout: int = int(os.getenv("MODEL_SERVICE_TIMEOUT", 30))
+    model_service_max_connections: int = int(os.getenv("MODEL_SERVICE_MAX_CONNECTIONS", 20))
+    model_service_max_keepalive_connections: int = int(os.getenv("MODEL_SERVICE_MAX_KEEPALIVE_CONNECTIONS", 10))
+    model_service_keepalive_expiry: float = float(os.getenv("MODEL_SERVICE_KEEPALIVE_EXPIRY", 30))
+    model_service_http2: bool = os.getenv("MODEL_SERVICE_HTTP2", "False").lower() == "true"
+    model_service_deadline: float = float(os.getenv("MODEL_SERVICE_DEADLINE", 60))
+    model_service_max_retries: int = int(os.getenv("MODEL_SERVICE_MAX_RETRIES", 2))
+    model_service_retry_backoff: float = float(os.getenv("MODEL_SERVICE_RETRY_BACKOFF", 0.2))
+    model_service_hedging: bool = os.getenv("MODEL_SERVICE_HEDGING", "False").lower() == "true"
+    model_service_breaker_failure_rate: float = float(os.getenv("MODEL_SERVICE_BREAKER_FAILURE_RATE", 0.5))
+    model_service_breaker_window: int = int(os.getenv("MODEL_SERVICE_BREAKER_WINDOW", 20))
+    model_service_breaker_min_calls: int = int(os.getenv("MODEL_SERVICE_BREAKER_MIN_CALLS", 5))
+    model_service_breaker_open_seconds: float = float(os.getenv("MODEL_SERVICE_BREAKER_OPEN_SECONDS", 30))
+    model_service_health_check_interval: float = float(os.getenv("MODEL_SERVICE_HEALTH_CHECK_INTERVAL", 15))
+    model_service_chunk_size: int = int(os.getenv("MODEL_SERVICE_CHUNK_SIZE", 256 * 1024))
+    model_preprocessing_enabled: bool = os.getenv("MODEL_PREPROCESSING_ENABLED", "False").lower() == "true"
+    model_input_size: int = int(os.getenv("MODEL_INPUT_SIZE", 512))
+    model_input_format: str = os.getenv("MODEL_INPUT_FORMAT", "PNG")
+    model_preprocessing_workers: int = int(os.getenv("MODEL_PREPROCESSING_WORKERS", 2))
+    model_batch_enabled: bool = os.getenv("MODEL_BATCH_ENABLED", "False").lower() == "true"
+    model_batch_max_size: int = int(os.getenv("MODEL_BATCH_MAX_SIZE", 8))
+    model_batch_max_wait: float = float(os.getenv("MODEL_BATCH_MAX_WAIT", 0.02))
+
+    draft_report_concurrency: int = int(os.getenv("DRAFT_REPORT_CONCURRENCY", 4))
+    draft_report_queue_size: int = int(os.getenv("DRAFT_REPORT_QUEUE_SIZE", 100))
+    draft_report_job_timeout: int = int(os.getenv("DRAFT_REPORT_JOB_TIMEOUT", 600))
+    draft_report_job_ttl: int = int(os.getenv("DRAFT_REPORT_JOB_TTL", 7 * 24 * 3600))
+    draft_pregeneration_enabled: bool = os.getenv("DRAFT_PREGENERATION_ENABLED", "False").lower() == "true"
+    draft_pregeneration_concurrency: int = int(os.getenv("DRAFT_PREGENERATION_CONCURRENCY", 1))
+    draft_pregeneration_queue_size: int = int(os.getenv("DRAFT_PREGENERATION_QUEUE_SIZE", 100))
+    draft_report_cache_size: int = int(os.getenv("DRAFT_REPORT_CACHE_SIZE", 1024))
+    draft_report_cache_persistent: bool = os.getenv("DRAFT_REPORT_CACHE_PERSISTENT", "False").lower() == "true"
+    draft_report_cache_ttl: int = int(os.getenv("DRAFT_REPORT_CACHE_TTL", 30 * 24 * 3600))
+
+    notification_backplane: str = os.getenv("NOTIFICATION_BACKPLANE", "memory")
+    notification_backplane_collection: str = os.getenv("NOTIFICATION_BACKPLANE_COLLECTION", "notification_events")
+    notification_backplane_size: int = int(os.getenv("NOTIFICATION_BACKPLANE_SIZE", 16 * 1024 * 1024))
+    notification_replay_buffer_size: int = int(os.getenv("NOTIFICATION_REPLAY_BUFFER_SIZE", 100))
+    notification_replay_max_users: int = int(os.getenv("NOTIFICATION_REPLAY_MAX_USERS", 10000))
+    # Off by default: events addressed to a role are written once per member of the role.
+    notification_inbox_enabled: bool = os.getenv("NOTIFICATION_INBOX_ENABLED", "False").lower() == "true"
+    notification_inbox_flush_interval: float = float(os.getenv("NOTIFICATION_INBOX_FLUSH_INTERVAL", 0.5))
+    notification_inbox_batch_size: int = int(os.getenv("NOTIFICATION_INBOX_BATCH_SIZE", 500))
+    notification_inbox_ttl: int = int(os.getenv("NOTIFICATION_INBOX_TTL", 30 * 24 * 3600))
+
+    websocket_ping_interval: float = float(os.getenv("WEBSOCKET_PING_INTERVAL", 20))
+    websocket_ping_timeout: float = float(os.getenv("WEBSOCKET_PING_TIMEOUT", 20))
+    websocket_send_timeout: float = float(os.getenv("WEBSOCKET_SEND_TIMEOUT", 5))
+    websocket_per_message_deflate: bool = os.getenv("WEBSOCKET_PER_MESSAGE_DEFLATE", "True").lower() == "true"
+
+    server_host: str = os.getenv("SERVER_HOST", "0.0.0.0")
+    server_port: int = int(os.getenv("SERVER_PORT", 8000))
+    server_reload: bool = os.getenv("SERVER_RELOAD", "True").lower() == "true"
 
     cors_origins: list = os.getenv("CORS_ORIGINS", "*").split(",")
 
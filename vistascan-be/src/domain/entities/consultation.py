@@ -25,6 +25,11 @@ class Consultation:
     expert_id: Optional[UUID] = None
     completed_at: Optional[datetime] = None
     download_url: Optional[str] = None
+    draft_report: Optional[str] = None
+    draft_report_model_version: Optional[str] = None
+    # Bumped by the repository on every save; conditional GETs derive their ETags from it.
+    version: int = 0
+    updated_at: Optional[datetime] = None
     id: UUID = field(default_factory=uuid4)
 
     def assign_to_expert(self, expert_id: UUID) -> None:
@@ -40,3 +45,8 @@ class Consultation:
         self.report = report
         self.status = ConsultationStatus.COMPLETED
         self.completed_at = datetime.now()
+
+    @property
+    def last_modified(self) -> datetime:
+        """When the consultation last changed; consultations saved before versioning fall back to creation."""
+        return self.updated_at or self.created_at
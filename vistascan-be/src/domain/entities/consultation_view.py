@@ -0,0 +1,23 @@
+from dataclasses import dataclass
+from datetime import datetime
+from typing import Optional
+from uuid import UUID
+
+from domain.entities.consultation import ConsultationStatus
+
+
+@dataclass
+class ConsultationView:
+    """Denormalized dashboard row of a consultation, carrying its patient's and expert's names."""
+    id: UUID
+    patient_id: UUID
+    patient_name: str
+    status: ConsultationStatus
+    file_name: str
+    created_at: datetime
+    updated_at: datetime
+    expert_id: Optional[UUID] = None
+    expert_name: Optional[str] = None
+    modality: Optional[str] = None
+    body_part: Optional[str] = None
+    completed_at: Optional[datetime] = None
@@ -1,7 +1,8 @@
-from enum import Enum
-from typing import Optional
-from dataclasses import dataclass, asdict
+from enum import Enum, StrEnum
+from typing import Optional, Dict, Any
+from dataclasses import dataclass, field
 from datetime import datetime
+from uuid import UUID, uuid4
 
 
 class NotificationEventType(str, Enum):
@@ -10,6 +11,11 @@ class NotificationEventType(str, Enum):
     CONSULTATION_STATUS_CHANGED = "consultation_status_changed"
     CONSULTATION_COMPLETED = "consultation_completed"
     CONSULTATION_DELETED = "consultation_deleted"
+    DRAFT_REPORT_READY = "draft_report_ready"
+
+
+class NotificationTopic(StrEnum):
+    PENDING_QUEUE = "pending_queue"
 
 
 @dataclass
@@ -22,20 +28,36 @@ class NotificationEvent:
     new_status: Optional[str] = None
     timestamp: Optional[datetime] = None
     message: str = ""
+    seq: Optional[int] = None
+    consultation: Optional[Dict[str, Any]] = None
+    job: Optional[Dict[str, Any]] = None
 
     def __post_init__(self):
         if self.timestamp is None:
             self.timestamp = datetime.now()
 
     def to_dict(self) -> dict:
-        result = asdict(self)
+        return {
+            "event_type": self.event_type.value,
+            "consultation_id": self.consultation_id,
+            "patient_id": self.patient_id,
+            "expert_id": self.expert_id,
+            "old_status": self.old_status,
+            "new_status": self.new_status,
+            "timestamp": self.timestamp.isoformat() if isinstance(self.timestamp, datetime) else self.timestamp,
+            "message": self.message,
+            "seq": self.seq,
+            "consultation": self.consultation,
+            "job": self.job,
+        }
 
-        if isinstance(result['timestamp'], datetime):
-            result['timestamp'] = result['timestamp'].isoformat()
 
-        if hasattr(result['event_type'], 'value'):
-            result['event_type'] = result['event_type'].value
-        elif isinstance(result['event_type'], Enum):
-            result['event_type'] = str(result['event_type'].value)
-
-        return result
+@dataclass
+class InboxNotification:
+    """Entity representing a notification persisted in a user's inbox."""
+    user_id: UUID
+    seq: int
+    event: Dict[str, Any]
+    created_at: datetime = field(default_factory=datetime.now)
+    acknowledged_at: Optional[datetime] = None
+    id: UUID = field(default_factory=uuid4)
@@ -0,0 +1,44 @@
+from enum import StrEnum
+from typing import Optional
+from uuid import UUID, uuid4
+from datetime import datetime
+from dataclasses import dataclass, field
+
+
+class DraftReportJobStatus(StrEnum):
+    QUEUED = "QUEUED"
+    RUNNING = "RUNNING"
+    SUCCEEDED = "SUCCEEDED"
+    FAILED = "FAILED"
+
+
+@dataclass
+class DraftReportJob:
+    """Entity tracking an asynchronous AI draft report generation for a consultation."""
+    consultation_id: UUID
+    requested_by: UUID
+    status: DraftReportJobStatus = DraftReportJobStatus.QUEUED
+    report: Optional[str] = None
+    message: str = ""
+    created_at: datetime = field(default_factory=datetime.now)
+    started_at: Optional[datetime] = None
+    finished_at: Optional[datetime] = None
+    id: UUID = field(default_factory=uuid4)
+
+    def is_active(self) -> bool:
+        return self.status in (DraftReportJobStatus.QUEUED, DraftReportJobStatus.RUNNING)
+
+    def start(self) -> None:
+        self.status = DraftReportJobStatus.RUNNING
+        self.started_at = datetime.now()
+
+    def succeed(self, report: str, message: str = "") -> None:
+        self.status = DraftReportJobStatus.SUCCEEDED
+        self.report = report
+        self.message = message
+        self.finished_at = datetime.now()
+
+    def fail(self, message: str) -> None:
+        self.status = DraftReportJobStatus.FAILED
+        self.message = message
+        self.finished_at = datetime.now()
@@ -1,8 +1,19 @@
 from dataclasses import dataclass, field
-from datetime import datetime
+from datetime import date, datetime
+from typing import Optional
 from uuid import UUID, uuid4
 
 
+@dataclass
+class StudyMetadata:
+    """Header attributes of a DICOM study, extracted at upload so studies can be triaged without their pixels."""
+    modality: Optional[str] = None
+    body_part: Optional[str] = None
+    rows: Optional[int] = None
+    columns: Optional[int] = None
+    study_date: Optional[date] = None
+
+
 @dataclass
 class ImagingStudy:
     """Entity representing a CXR imaging study uploaded by a patient."""
@@ -12,4 +23,8 @@ class ImagingStudy:
     size: int
     upload_date: datetime
     patient_id: UUID = field(default_factory=uuid4)
+    content_hash: Optional[str] = None
+    preprocessed_path: Optional[str] = None
+    preprocessed_variant: Optional[str] = None
+    metadata: Optional[StudyMetadata] = None
 
@@ -0,0 +1,83 @@
+import logging
+from collections import OrderedDict
+from datetime import datetime
+from typing import Optional, Tuple
+
+import mongoengine as me
+
+from application.interfaces.draft_report_cache import DraftReportCache
+from infrastructure.persistence.mongo.models import DraftReportCacheDocument
+
+
+class LRUDraftReportCache(DraftReportCache):
+    """
+    In-process LRU of draft reports, optionally in front of a shared backing cache.
+    Backing hits are promoted into the LRU and writes go through to both.
+    """
+
+    def __init__(self, max_entries: int, backing: Optional[DraftReportCache] = None):
+        self._max_entries = max_entries
+        self._backing = backing
+        self._entries: "OrderedDict[Tuple[str, str], str]" = OrderedDict()
+
+    def get(self, content_hash: str, model_version: str) -> Optional[str]:
+        key = (content_hash, model_version)
+        report = self._entries.get(key)
+        if report is not None:
+            self._entries.move_to_end(key)
+            return report
+
+        if self._backing is not None:
+            report = self._backing.get(content_hash, model_version)
+            if report is not None:
+                self._store(key, report)
+                return report
+
+        return None
+
+    def put(self, content_hash: str, model_version: str, report: str) -> None:
+        self._store((content_hash, model_version), report)
+        if self._backing is not None:
+            self._backing.put(content_hash, model_version, report)
+
+    def _store(self, key: Tuple[str, str], report: str):
+        self._entries[key] = report
+        self._entries.move_to_end(key)
+        while len(self._entries) > self._max_entries:
+            self._entries.popitem(last=False)
+
+
+class MongoDraftReportCache(DraftReportCache):
+    """Draft report cache shared by all workers through a MongoDB collection."""
+
+    def __init__(self, db_name: str, db_uri: str, ttl_seconds: int):
+        me.connect(db_name, host=db_uri)
+        DraftReportCacheDocument._get_collection().create_index(
+            "created_at",
+            name="created_at_ttl",
+            expireAfterSeconds=ttl_seconds,
+        )
+
+    def get(self, content_hash: str, model_version: str) -> Optional[str]:
+        try:
+            doc = DraftReportCacheDocument.objects(id=self._key(content_hash, model_version)).first()
+            return doc.report if doc else None
+        except Exception as e:
+            logging.error(f"Error reading cached draft report for {content_hash}: {e}")
+            return None
+
+    def put(self, content_hash: str, model_version: str, report: str) -> None:
+        try:
+            DraftReportCacheDocument(
+                id=self._key(content_hash, model_version),
+                content_hash=content_hash,
+                model_version=model_version,
+                report=report,
+                created_at=datetime.now(),
+            ).save()
+        except Exception as e:
+            logging.error(f"Error caching draft report for {content_hash}: {e}")
+
+    @staticmethod
+    def _key(content_hash: str, model_version: str) -> str:
+        return f"{model_version}:{content_hash}"
@@ -0,0 +1,152 @@
+import asyncio
+import itertools
+import logging
+from abc import ABC, abstractmethod
+from datetime import datetime
+from typing import Any, Awaitable, Callable, Dict, Optional
+from uuid import uuid4
+
+from motor.motor_asyncio import AsyncIOMotorClient
+from pymongo import CursorType, ReturnDocument
+from pymongo.errors import CollectionInvalid
+
+EnvelopeHandler = Callable[[Dict[str, Any]], Awaitable[None]]
+
+
+class NotificationBackplane(ABC):
+    """Pub/sub channel that fans notification envelopes out to every API worker."""
+
+    @abstractmethod
+    async def start(self, handler: EnvelopeHandler) -> None:
+        """Start receiving envelopes, passing each one to the handler."""
+        ...
+
+    @abstractmethod
+    async def stop(self) -> None:
+        """Stop receiving envelopes and release any resources."""
+        ...
+
+    @abstractmethod
+    async def publish(self, envelope: Dict[str, Any]) -> None:
+        """Publish an envelope to all subscribed workers, including this one."""
+        ...
+
+    @abstractmethod
+    async def next_sequence(self) -> int:
+        """Return the next value of the sequence shared by all workers."""
+        ...
+
+
+class InMemoryNotificationBackplane(NotificationBackplane):
+    """Single-process backplane, delivering envelopes directly to the local handler."""
+
+    def __init__(self):
+        self._handler: Optional[EnvelopeHandler] = None
+        self._sequence = itertools.count(1)
+
+    async def start(self, handler: EnvelopeHandler) -> None:
+        self._handler = handler
+
+    async def stop(self) -> None:
+        self._handler = None
+
+    async def publish(self, envelope: Dict[str, Any]) -> None:
+        if self._handler is None:
+            logging.warning("Notification backplane not started, dropping event")
+            return
+
+        await self._handler(envelope)
+
+    async def next_sequence(self) -> int:
+        return next(self._sequence)
+
+
+class MongoNotificationBackplane(NotificationBackplane):
+    """
+    Backplane built on a MongoDB capped collection.
+    Every worker tails the collection with a tailable cursor and delivers the envelopes it reads.
+    """
+
+    def __init__(self, db_uri: str, db_name: str, collection_name: str, size: int,
+                 counters_collection_name: str = "counters", reconnect_delay: float = 1.0):
+        self._client = AsyncIOMotorClient(db_uri)
+        self._db = self._client[db_name]
+        self._collection_name = collection_name
+        self._size = size
+        self._counters_collection_name = counters_collection_name
+        self._reconnect_delay = reconnect_delay
+        self._origin = uuid4().hex
+        self._handler: Optional[EnvelopeHandler] = None
+        self._tail_task: Optional[asyncio.Task] = None
+
+    async def start(self, handler: EnvelopeHandler) -> None:
+        self._handler = handler
+        await self._ensure_collection()
+        self._tail_task = asyncio.create_task(self._tail())
+        logging.info(f"Mongo notification backplane started for worker {self._origin}")
+
+    async def stop(self) -> None:
+        if self._tail_task:
+            self._tail_task.cancel()
+            try:
+                await self._tail_task
+            except asyncio.CancelledError:
+                pass
+            self._tail_task = None
+
+        self._handler = None
+        self._client.close()
+
+    async def publish(self, envelope: Dict[str, Any]) -> None:
+        await self._db[self._collection_name].insert_one({
+            "origin": self._origin,
+            "published_at": datetime.now(),
+            "envelope": envelope,
+        })
+
+    async def next_sequence(self) -> int:
+        counter = await self._db[self._counters_collection_name].find_one_and_update(
+            {"_id": self._collection_name},
+            {"$inc": {"seq": 1}},
+            upsert=True,
+            return_document=ReturnDocument.AFTER,
+        )
+        return counter["seq"]
+
+    async def _ensure_collection(self):
+        try:
+            await self._db.create_collection(self._collection_name, capped=True, size=self._size)
+        except CollectionInvalid:
+            options = await self._db[self._collection_name].options()
+            if not options.get("capped"):
+                raise RuntimeError(f"Collection {self._collection_name} exists but is not capped")
+
+        collection = self._db[self._collection_name]
+        # A tailable cursor on an empty capped collection dies immediately, so seed it with a marker.
+        if await collection.estimated_document_count() == 0:
+            await collection.insert_one({"origin": self._origin, "published_at": datetime.now(), "envelope": None})
+
+    async def _tail(self):
+        collection = self._db[self._collection_name]
+        last_doc = await collection.find_one(sort=[("$natural", -1)])
+        last_id = last_doc["_id"] if last_doc else None
+
+        while True:
+            query = {"_id": {"$gt": last_id}} if last_id else {}
+            cursor = collection.find(query, cursor_type=CursorType.TAILABLE_AWAIT)
+            try:
+                while cursor.alive:
+                    async for doc in cursor:
+                        last_id = doc["_id"]
+                        if doc.get("envelope") is None:
+                            continue
+                        try:
+                            await self._handler(doc["envelope"])
+                        except Exception as e:
+                            logging.error(f"Error delivering backplane envelope {last_id}: {e}")
+            except asyncio.CancelledError:
+                raise
+            except Exception as e:
+                logging.error(f"Notification backplane cursor error: {e}")
+
+            await asyncio.sleep(self._reconnect_delay)
@@ -0,0 +1,38 @@
+from enum import StrEnum
+from typing import Any, Dict, Optional, Union
+
+import msgpack
+import orjson
+
+Frame = Union[str, bytes]
+
+
+class NotificationEncoding(StrEnum):
+    JSON = "json"
+    MSGPACK = "msgpack"
+    SSE = "sse"
+
+
+WEBSOCKET_ENCODINGS = {NotificationEncoding.JSON, NotificationEncoding.MSGPACK}
+
+
+def negotiate_encoding(requested: Optional[str]) -> NotificationEncoding:
+    if requested in WEBSOCKET_ENCODINGS:
+        return NotificationEncoding(requested)
+    return NotificationEncoding.JSON
+
+
+def encode_frame(message: Dict[str, Any], encoding: NotificationEncoding) -> Frame:
+    """
+    Serialize a message for the wire: JSON goes out as a text frame, msgpack as a binary frame
+    and SSE as a complete event-stream record, with the event sequence as its id so browsers resume from it.
+    """
+    if encoding == NotificationEncoding.MSGPACK:
+        return msgpack.packb(message, use_bin_type=True)
+
+    data = orjson.dumps(message).decode()
+    if encoding == NotificationEncoding.SSE:
+        if "type" not in message and message.get("seq") is not None:
+            return f"id: {message['seq']}\ndata: {data}\n\n"
+        return f"data: {data}\n\n"
+    return data
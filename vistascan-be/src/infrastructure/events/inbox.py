@@ -0,0 +1,114 @@
+import asyncio
+import logging
+from typing import Any, Dict, Iterable, List, Optional, Set, Tuple
+from uuid import UUID
+
+from domain.entities.event import InboxNotification
+from domain.entities.user import UserRole
+from application.interfaces.repositories import NotificationRepository, UserRepository
+
+
+class NotificationInboxWriter:
+    """
+    Buffers inbox notifications in memory and persists them in batches on a short interval,
+    so publishing an event never waits on a database write. Events addressed to roles are fanned out
+    to the role's members at flush time, with one user lookup per role per flush.
+    """
+
+    def __init__(self, repository: NotificationRepository, flush_interval: float = 0.5,
+                 batch_size: int = 500, max_buffer_size: int = 50000,
+                 user_repository: Optional[UserRepository] = None):
+        self._repository = repository
+        self._user_repo = user_repository
+        self._fanouts: List[Tuple[List[str], List[UserRole], Dict[str, Any]]] = []
+        self._flush_interval = flush_interval
+        self._batch_size = batch_size
+        self._max_buffer_size = max_buffer_size
+        self._buffer: List[InboxNotification] = []
+        self._batch_ready = asyncio.Event()
+        self._flush_task: Optional[asyncio.Task] = None
+
+    async def start(self):
+        self._flush_task = asyncio.create_task(self._run())
+
+    async def stop(self):
+        if self._flush_task:
+            self._flush_task.cancel()
+            try:
+                await self._flush_task
+            except asyncio.CancelledError:
+                pass
+            self._flush_task = None
+
+        while self._buffer or self._fanouts:
+            if not await self.flush():
+                break
+
+    def enqueue(self, user_ids: Iterable[str], event: Dict[str, Any], roles: Iterable[UserRole] = ()):
+        roles = list(roles)
+        if roles and self._user_repo is not None:
+            self._fanouts.append((list(user_ids), roles, event))
+            if len(self._fanouts) > self._max_buffer_size:
+                dropped = len(self._fanouts) - self._max_buffer_size
+                del self._fanouts[:dropped]
+                logging.error(f"Notification inbox buffer full, dropped {dropped} oldest role notifications")
+            return
+
+        for user_id in user_ids:
+            self._buffer.append(InboxNotification(user_id=UUID(user_id), seq=event["seq"], event=event))
+
+        if len(self._buffer) > self._max_buffer_size:
+            dropped = len(self._buffer) - self._max_buffer_size
+            del self._buffer[:dropped]
+            logging.error(f"Notification inbox buffer full, dropped {dropped} oldest notifications")
+
+        if len(self._buffer) >= self._batch_size:
+            self._batch_ready.set()
+
+    async def flush(self) -> bool:
+        if self._fanouts:
+            fanouts, self._fanouts = self._fanouts, []
+            try:
+                self._buffer.extend(await asyncio.to_thread(self._expand, fanouts))
+            except Exception as e:
+                logging.error(f"Error resolving role recipients of {len(fanouts)} notifications, will retry: {e}")
+                self._fanouts[:0] = fanouts
+                return False
+
+        if not self._buffer:
+            return True
+
+        batch = self._buffer[:self._batch_size]
+        del self._buffer[:self._batch_size]
+        try:
+            await asyncio.to_thread(self._repository.save_many, batch)
+            return True
+        except Exception as e:
+            logging.error(f"Error persisting {len(batch)} inbox notifications, will retry: {e}")
+            self._buffer[:0] = batch
+            return False
+
+    def _expand(self, fanouts: List[Tuple[List[str], List[UserRole], Dict[str, Any]]]) -> List[InboxNotification]:
+        members: Dict[UserRole, Set[UUID]] = {}
+        notifications = []
+        for user_ids, roles, event in fanouts:
+            recipients = {UUID(user_id) for user_id in user_ids}
+            for role in roles:
+                if role not in members:
+                    members[role] = {user.id for user in self._user_repo.find_by_role(role)}
+                recipients |= members[role]
+            notifications.extend(InboxNotification(user_id=user_id, seq=event["seq"], event=event)
+                                 for user_id in recipients)
+        return notifications
+
+    async def _run(self):
+        while True:
+            try:
+                await asyncio.wait_for(self._batch_ready.wait(), timeout=self._flush_interval)
+            except asyncio.TimeoutError:
+                pass
+            self._batch_ready.clear()
+
+            while self._buffer or self._fanouts:
+                if not await self.flush():
+                    break
@@ -0,0 +1,101 @@
+from collections import OrderedDict, deque
+from typing import Any, Deque, Dict, Iterable, List, Optional, Tuple
+
+USER_CHANNEL_PREFIX = "user:"
+
+
+class ReplayBuffer:
+    """
+    Bounded ring buffers of recently delivered events, one per notification channel.
+    Channels are the routing keys of an event target (a user, a role or a topic), so recording
+    an event costs O(channels) and a user's backlog is the merge of the channels it listens on.
+    """
+
+    def __init__(self, capacity: int, max_user_channels: int):
+        self._capacity = capacity
+        self._max_user_channels = max_user_channels
+        self._channels: "OrderedDict[str, Deque[Tuple[int, Dict[str, Any]]]]" = OrderedDict()
+        self._floors: Dict[str, int] = {}
+        self._user_channel_count = 0
+        self._base_seq: Optional[int] = None
+        self._evicted_seq = 0
+        self.last_seq = 0
+
+    @staticmethod
+    def channels_for_target(target: Dict[str, Any]) -> List[str]:
+        return ([f"{USER_CHANNEL_PREFIX}{user_id}" for user_id in target["user_ids"]] +
+                [f"role:{role}" for role in target["roles"]] +
+                [f"topic:{topic}" for topic in target["topics"]])
+
+    @staticmethod
+    def channels_for_subscriber(user_id: str, role: str, topics: Iterable[str]) -> List[str]:
+        return [f"{USER_CHANNEL_PREFIX}{user_id}", f"role:{role}"] + [f"topic:{topic}" for topic in topics]
+
+    def record(self, seq: int, channels: Iterable[str], event: Dict[str, Any]):
+        if self._base_seq is None:
+            self._base_seq = seq - 1
+        self.last_seq = max(self.last_seq, seq)
+
+        for channel in channels:
+            buffer = self._channels.get(channel)
+            if buffer is None:
+                buffer = self._create_channel(channel)
+            elif channel.startswith(USER_CHANNEL_PREFIX):
+                self._channels.move_to_end(channel)
+
+            # Sequence numbers are taken before the backplane insert, so with several workers events can
+            # arrive out of order; keep every buffer sorted by seq rather than by arrival.
+            index = len(buffer)
+            while index and buffer[index - 1][0] > seq:
+                index -= 1
+            buffer.insert(index, (seq, event))
+            if len(buffer) > self._capacity:
+                evicted_seq, _ = buffer.popleft()
+                self._floors[channel] = max(self._floors[channel], evicted_seq)
+
+    def replay(self, channels: Iterable[str], last_seq: int) -> Optional[List[Dict[str, Any]]]:
+        """
+        Return the events with a sequence number above last_seq, in order.
+        Returns None when the gap cannot be filled from the buffers and the client must resync.
+        """
+        if self._base_seq is None or last_seq < self._base_seq or last_seq > self.last_seq:
+            return None
+
+        events = {}
+        for channel in channels:
+            buffer = self._channels.get(channel)
+            floor = self._floors.get(channel, self._default_floor())
+            if last_seq < floor:
+                return None
+            if buffer is None:
+                continue
+
+            for seq, event in buffer:
+                if seq > last_seq:
+                    events[seq] = event
+
+        return [events[seq] for seq in sorted(events)]
+
+    def _create_channel(self, channel: str) -> Deque[Tuple[int, Dict[str, Any]]]:
+        if channel.startswith(USER_CHANNEL_PREFIX):
+            self._user_channel_count += 1
+            if self._user_channel_count > self._max_user_channels:
+                self._evict_user_channel()
+
+        buffer = deque()
+        self._channels[channel] = buffer
+        self._floors[channel] = self._default_floor()
+        return buffer
+
+    def _evict_user_channel(self):
+        for channel in self._channels:
+            if channel.startswith(USER_CHANNEL_PREFIX):
+                buffer = self._channels.pop(channel)
+                self._floors.pop(channel, None)
+                self._user_channel_count -= 1
+                if buffer:
+                    self._evicted_seq = max(self._evicted_seq, buffer[-1][0])
+                return
+
+    def _default_floor(self) -> int:
+        return max(self._base_seq or 0, self._evicted_seq)
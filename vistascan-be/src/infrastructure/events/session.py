@@ -0,0 +1,69 @@
+import asyncio
+import time
+from dataclasses import dataclass, field
+from datetime import datetime
+from typing import AsyncIterator, Optional, Set
+from uuid import uuid4
+from fastapi import WebSocket
+
+from domain.entities.user import UserRole
+from infrastructure.events.encoding import Frame, NotificationEncoding
+
+
+@dataclass(eq=False)
+class WebSocketSession:
+    """A single client connection registered with the connection manager."""
+    user_id: str
+    role: UserRole
+    websocket: WebSocket
+    id: str = field(default_factory=lambda: uuid4().hex)
+    connected_at: datetime = field(default_factory=datetime.now)
+    topics: Set[str] = field(default_factory=set)
+    version: int = 1
+    encoding: NotificationEncoding = NotificationEncoding.JSON
+
+    async def send(self, frame: Frame):
+        if isinstance(frame, bytes):
+            await self.websocket.send_bytes(frame)
+        else:
+            await self.websocket.send_text(frame)
+
+    async def close(self, code: int = 1000, reason: str = ""):
+        await self.websocket.close(code=code, reason=reason)
+
+
+@dataclass(eq=False)
+class EventStreamSession(WebSocketSession):
+    """
+    A Server-Sent Events subscriber. Frames are queued here and written by the HTTP response stream,
+    so the connection needs no receive loop and a slow reader only ever costs one queue.
+    """
+    websocket: Optional[WebSocket] = None
+    encoding: NotificationEncoding = NotificationEncoding.SSE
+    queue: asyncio.Queue = field(default_factory=lambda: asyncio.Queue(maxsize=1024))
+    last_seen: float = field(default_factory=time.monotonic)
+
+    async def send(self, frame: Frame):
+        # Raises QueueFull for a reader that fell too far behind, which makes the manager drop it.
+        self.queue.put_nowait(frame)
+
+    async def close(self, code: int = 1000, reason: str = ""):
+        while not self.queue.empty():
+            self.queue.get_nowait()
+        self.queue.put_nowait(None)
+
+    async def stream(self) -> AsyncIterator[str]:
+        """Yield queued frames until the session is closed, joining whatever is ready into a single write."""
+        while True:
+            frame = await self.queue.get()
+            chunk = []
+            while frame is not None:
+                chunk.append(frame)
+                if self.queue.empty():
+                    break
+                frame = self.queue.get_nowait()
+
+            if chunk:
+                yield "".join(chunk)
+            if frame is None:
+                return
@@ -1,67 +1,380 @@
-import json
+import asyncio
 import logging
-from typing import Dict, List
+import time
+from collections import OrderedDict
+from typing import Any, Dict, Iterable, List, Optional, Tuple
 from fastapi import WebSocket
 
 from domain.entities.user import UserRole
-from domain.entities.event import NotificationEvent, NotificationEventType
+from domain.entities.event import NotificationEvent, NotificationEventType, NotificationTopic
 from application.interfaces.event_handler import EventHandler
+from application.dto.consultation_dto import ConsultationSummaryDTO, DraftReportJobDTO
+from infrastructure.events.backplane import NotificationBackplane, InMemoryNotificationBackplane
+from infrastructure.events.session import WebSocketSession, EventStreamSession
+from infrastructure.events.replay import ReplayBuffer
+from infrastructure.events.inbox import NotificationInboxWriter
+from infrastructure.events.encoding import Frame, NotificationEncoding, encode_frame, negotiate_encoding
+
+TOPIC_ROLES = {
+    NotificationTopic.PENDING_QUEUE: {UserRole.EXPERT, UserRole.ADMIN},
+}
+
+DEFAULT_TOPICS = {
+    UserRole.EXPERT: {NotificationTopic.PENDING_QUEUE},
+}
+
+# Version 1 events only carry ids and statuses, version 2 events also embed the consultation summary.
+PROTOCOL_VERSION_LEGACY = 1
+PROTOCOL_VERSION_LATEST = 2
 
 
 class WebSocketConnectionManager(EventHandler):
-    def __init__(self):
-        self._active_connections: Dict[str, WebSocket] = {}
-        self._user_roles: Dict[str, UserRole] = {}
+    def __init__(self, backplane: Optional[NotificationBackplane] = None,
+                 replay_buffer_size: int = 100, replay_max_users: int = 10000,
+                 inbox: Optional[NotificationInboxWriter] = None,
+                 ping_interval: float = 20, ping_timeout: float = 20, send_timeout: float = 5,
+                 frame_cache_size: int = 1024):
+        self._sessions: Dict[str, WebSocketSession] = {}
+        self._user_sessions: Dict[str, Dict[str, WebSocketSession]] = {}
+        self._role_sessions: Dict[UserRole, Dict[str, WebSocketSession]] = {}
+        self._topic_sessions: Dict[str, Dict[str, WebSocketSession]] = {}
+        self._backplane = backplane or InMemoryNotificationBackplane()
+        self._replay = ReplayBuffer(capacity=replay_buffer_size, max_user_channels=replay_max_users)
+        self._inbox = inbox
+        self._ping_interval = ping_interval
+        self._ping_timeout = ping_timeout
+        self._send_timeout = send_timeout
+        self._heartbeat_task: Optional[asyncio.Task] = None
+        self._frames: "OrderedDict[Tuple[int, int, NotificationEncoding], Frame]" = OrderedDict()
+        self._frame_cache_size = frame_cache_size
+        self._opened_total = 0
+        self._reaped_total = 0
+        self._error_closed_total = 0
+        self._messages_sent_total = 0
 
-    async def connect(self, websocket: WebSocket, user_id: str, user_role: UserRole):
-        await websocket.accept()
-        self._active_connections[user_id] = websocket
-        self._user_roles[user_id] = user_role
-        logging.info(f"WebSocket connection established for user {user_id} with role {user_role.value}")
-
-    def disconnect(self, user_id: str):
-        if user_id in self._active_connections:
-            del self._active_connections[user_id]
-        if user_id in self._user_roles:
-            del self._user_roles[user_id]
-        logging.info(f"WebSocket connection closed for user {user_id}")
-
-    async def send_message(self, message: str, user_id: str):
-        if user_id in self._active_connections:
-            try:
-                await self._active_connections[user_id].send_text(message)
-            except Exception as e:
-                logging.error(f"Error sending message to user {user_id}: {e}")
-                self.disconnect(user_id)
-
-    async def broadcast_to_roles(self, message: str, target_roles: List[UserRole]):
-        for user_id, user_role in self._user_roles.items():
-            if user_role in target_roles:
-                await self.send_message(message, user_id)
-
-    async def broadcast_to_all(self, message: str):
-        disconnected_users = []
-        for user_id, websocket in self._active_connections.items():
+    @property
+    def current_seq(self) -> int:
+        return self._replay.last_seq
+
+    async def start(self):
+        await self._backplane.start(self._deliver)
+        if self._inbox is not None:
+            await self._inbox.start()
+        self._heartbeat_task = asyncio.create_task(self._heartbeat())
+
+    async def stop(self):
+        if self._heartbeat_task:
+            self._heartbeat_task.cancel()
             try:
-                await websocket.send_text(message)
-            except Exception as e:
-                logging.error(f"Error sending message to user {user_id}: {e}")
-                disconnected_users.append(user_id)
+                await self._heartbeat_task
+            except asyncio.CancelledError:
+                pass
+            self._heartbeat_task = None
+
+        await self._backplane.stop()
+        if self._inbox is not None:
+            await self._inbox.stop()
+
+    async def connect(self, websocket: WebSocket, user_id: str, user_role: UserRole,
+                      version: int = PROTOCOL_VERSION_LEGACY,
+                      encoding: Optional[str] = None) -> WebSocketSession:
+        await websocket.accept()
+        session = WebSocketSession(user_id=user_id, role=user_role, websocket=websocket)
+        session.version = self.negotiate_version(version)
+        session.encoding = negotiate_encoding(encoding)
+
+        self._register(session)
+        logging.info(f"WebSocket connection {session.id} established for user {user_id} with role {user_role.value}")
+        return session
+
+    def connect_stream(self, user_id: str, user_role: UserRole,
+                       version: int = PROTOCOL_VERSION_LEGACY) -> EventStreamSession:
+        """Register a Server-Sent Events subscriber, routed exactly like a WebSocket session."""
+        session = EventStreamSession(user_id=user_id, role=user_role)
+        session.version = self.negotiate_version(version)
+
+        self._register(session)
+        logging.info(f"Event stream {session.id} established for user {user_id} with role {user_role.value}")
+        return session
+
+    def _register(self, session: WebSocketSession):
+        self._sessions[session.id] = session
+        self._user_sessions.setdefault(session.user_id, {})[session.id] = session
+        self._role_sessions.setdefault(session.role, {})[session.id] = session
+        self.subscribe(session.id, DEFAULT_TOPICS.get(session.role, set()))
+        self._opened_total += 1
+
+    def disconnect(self, session_id: str):
+        session = self._sessions.pop(session_id, None)
+        if session is None:
+            return
+
+        self._remove_from_index(self._user_sessions, session.user_id, session_id)
+        self._remove_from_index(self._role_sessions, session.role, session_id)
+        for topic in session.topics:
+            self._remove_from_index(self._topic_sessions, topic, session_id)
+        logging.info(f"WebSocket connection {session_id} closed for user {session.user_id}")
+
+    def touch(self, session_id: str):
+        """Record a completed write to an event stream, keeping it from being reaped."""
+        session = self._sessions.get(session_id)
+        if isinstance(session, EventStreamSession):
+            session.last_seen = time.monotonic()
+
+    def metrics(self) -> Dict[str, int]:
+        return {
+            "live_connections": len(self._sessions),
+            "live_users": len(self._user_sessions),
+            "opened_total": self._opened_total,
+            "reaped_total": self._reaped_total,
+            "error_closed_total": self._error_closed_total,
+            "messages_sent_total": self._messages_sent_total,
+            "current_seq": self.current_seq,
+        }
+
+    @staticmethod
+    def negotiate_version(requested: Optional[int]) -> int:
+        if not isinstance(requested, int):
+            return PROTOCOL_VERSION_LEGACY
+        return min(max(requested, PROTOCOL_VERSION_LEGACY), PROTOCOL_VERSION_LATEST)
+
+    def set_version(self, session_id: str, version: int) -> int:
+        session = self._sessions.get(session_id)
+        if session is None:
+            return PROTOCOL_VERSION_LEGACY
+
+        session.version = self.negotiate_version(version)
+        return session.version
+
+    def subscribe(self, session_id: str, topics: Iterable[str]) -> List[str]:
+        session = self._sessions.get(session_id)
+        if session is None:
+            return []
+
+        for topic in topics:
+            if topic not in TOPIC_ROLES or session.role not in TOPIC_ROLES[topic]:
+                logging.warning(f"User {session.user_id} is not allowed to subscribe to topic {topic}")
+                continue
+            session.topics.add(topic)
+            self._topic_sessions.setdefault(topic, {})[session_id] = session
+
+        return sorted(session.topics)
+
+    def unsubscribe(self, session_id: str, topics: Iterable[str]) -> List[str]:
+        session = self._sessions.get(session_id)
+        if session is None:
+            return []
+
+        for topic in topics:
+            if topic in session.topics:
+                session.topics.discard(topic)
+                self._remove_from_index(self._topic_sessions, topic, session_id)
+
+        return sorted(session.topics)
+
+    async def send_backlog(self, session: WebSocketSession, last_seq: Optional[int]):
+        """Replay the events a reconnecting client missed since last_seq, or ask it to resync."""
+        if last_seq is None:
+            return
+
+        channels = ReplayBuffer.channels_for_subscriber(session.user_id, session.role.value, session.topics)
+        events = self._replay.replay(channels, last_seq)
+        if events is None:
+            logging.info(f"Replay gap too large for user {session.user_id} since seq {last_seq}, requesting resync")
+            await self.send_control(session, {"type": "resync_required", "seq": self.current_seq})
+            return
+
+        for event in events:
+            if not await self._send(session, self._encode(event, session.version, session.encoding)):
+                return
+
+    async def send_control(self, session: WebSocketSession, message: Dict[str, Any]) -> bool:
+        """Send a protocol message to a single session in the encoding it negotiated."""
+        return await self._send(session, encode_frame(message, session.encoding))
+
+    async def send_message(self, message: Frame, user_id: str):
+        await self._send_all(self._user_sessions.get(user_id, {}).values(), message)
+
+    async def broadcast_to_roles(self, message: Frame, target_roles: List[UserRole]):
+        sessions = {}
+        for role in target_roles:
+            sessions.update(self._role_sessions.get(role, {}))
 
-        for user_id in disconnected_users:
-            self.disconnect(user_id)
+        await self._send_all(sessions.values(), message)
 
-    async def notify_consultation_created(self, consultation_id: str, patient_id: str):
+    async def broadcast_to_all(self, message: Frame):
+        await self._send_all(self._sessions.values(), message)
+
+    async def publish(self, event: NotificationEvent, user_ids: Optional[List[str]] = None,
+                      roles: Optional[List[UserRole]] = None, topics: Optional[List[str]] = None):
+        try:
+            event.seq = await self._backplane.next_sequence()
+        except Exception as e:
+            logging.error(f"Error assigning sequence to {event.event_type} event for consultation {event.consultation_id}: {e}")
+            return
+
+        envelope = {
+            "event": event.to_dict(),
+            "target": {
+                "user_ids": [user_id for user_id in user_ids or [] if user_id],
+                "roles": [role.value for role in roles or []],
+                "topics": [str(topic) for topic in topics or []],
+            },
+        }
+
+        if self._inbox is not None:
+            self._inbox.enqueue(envelope["target"]["user_ids"], envelope["event"],
+                                roles=self._inbox_roles(roles or [], topics or []))
+
+        try:
+            await self._backplane.publish(envelope)
+        except Exception as e:
+            logging.error(f"Error publishing {event.event_type} event for consultation {event.consultation_id}: {e}")
+
+    @staticmethod
+    def _inbox_roles(roles: List[UserRole], topics: List[str]) -> List[UserRole]:
+        """
+        The roles whose members keep an inbox copy of an event: the roles it targets, plus those subscribed
+        by default to one of its topics, since every session of such a role would have received it.
+        """
+        inbox_roles = set(roles)
+        for role, default_topics in DEFAULT_TOPICS.items():
+            if any(topic in default_topics for topic in topics):
+                inbox_roles.add(role)
+        return list(inbox_roles)
+
+    async def _deliver(self, envelope: Dict[str, Any]):
+        event = envelope["event"]
+        if event.get("seq") is not None:
+            self._replay.record(event["seq"], ReplayBuffer.channels_for_target(envelope["target"]), event)
+
+        sessions = self._resolve_sessions(envelope["target"])
+        if not sessions:
+            return
+
+        # Serialize once per protocol version and encoding, sharing the frame across that group's sessions.
+        groups: Dict[Tuple[int, NotificationEncoding], List[WebSocketSession]] = {}
+        for session in sessions.values():
+            groups.setdefault((session.version, session.encoding), []).append(session)
+
+        await asyncio.gather(*(
+            self._send_all(group, self._encode(event, version, encoding))
+            for (version, encoding), group in groups.items()
+        ))
+
+    def _encode(self, event: Dict[str, Any], version: int, encoding: NotificationEncoding) -> Frame:
+        seq = event.get("seq")
+        cache_key = (seq, version, encoding)
+        if seq is not None and cache_key in self._frames:
+            return self._frames[cache_key]
+
+        if version < PROTOCOL_VERSION_LATEST and "consultation" in event:
+            event = {key: value for key, value in event.items() if key != "consultation"}
+        frame = encode_frame(event, encoding)
+
+        # Keep recent frames so replays to reconnecting clients reuse the bytes built at delivery.
+        if seq is not None:
+            self._frames[cache_key] = frame
+            if len(self._frames) > self._frame_cache_size:
+                self._frames.popitem(last=False)
+        return frame
+
+    def _resolve_sessions(self, target: Dict[str, Any]) -> Dict[str, WebSocketSession]:
+        sessions = {}
+        for user_id in target["user_ids"]:
+            sessions.update(self._user_sessions.get(user_id, {}))
+        for role in target["roles"]:
+            sessions.update(self._role_sessions.get(UserRole(role), {}))
+        for topic in target["topics"]:
+            sessions.update(self._topic_sessions.get(topic, {}))
+
+        return sessions
+
+    async def _send_all(self, sessions: Iterable[WebSocketSession], message: Frame):
+        sessions = list(sessions)
+        if len(sessions) == 1:
+            await self._send(sessions[0], message)
+        elif sessions:
+            await asyncio.gather(*(self._send(session, message) for session in sessions))
+
+    async def _send(self, session: WebSocketSession, message: Frame) -> bool:
+        try:
+            await asyncio.wait_for(session.send(message), timeout=self._send_timeout)
+            self._messages_sent_total += 1
+            return True
+        except Exception as e:
+            logging.error(f"Error sending message to user {session.user_id} on connection {session.id}: {e!r}")
+            self._error_closed_total += 1
+            await self._close(session, code=1011, reason="Send failed")
+            return False
+
+    async def _close(self, session: WebSocketSession, code: int, reason: str):
+        self.disconnect(session.id)
+        try:
+            await asyncio.wait_for(session.close(code=code, reason=reason), timeout=self._send_timeout)
+        except Exception:
+            pass
+
+    async def _heartbeat(self):
+        """
+        Send every session an application-level {"type": "ping"} carrying the current seq on a fixed interval,
+        so idle clients can spot missed events, and reap event streams whose writes stopped completing.
+        WebSocket sessions are not reaped here and need not answer: their liveness is the protocol-level
+        ping/pong uvicorn runs (ws_ping_interval/ws_ping_timeout in main.run()), which browsers answer on
+        their own and which ends the receive loop when it fails.
+        """
+        while True:
+            await asyncio.sleep(self._ping_interval)
+
+            deadline = time.monotonic() - (self._ping_interval + self._ping_timeout)
+            alive: Dict[NotificationEncoding, List[WebSocketSession]] = {}
+            for session in list(self._sessions.values()):
+                if isinstance(session, EventStreamSession) and session.last_seen < deadline:
+                    logging.info(f"Reaping unresponsive WebSocket connection {session.id} for user {session.user_id}")
+                    self._reaped_total += 1
+                    await self._close(session, code=1001, reason="Heartbeat timeout")
+                else:
+                    alive.setdefault(session.encoding, []).append(session)
+
+            ping = {"type": "ping", "seq": self.current_seq}
+            await asyncio.gather(*(
+                self._send_all(group, encode_frame(ping, encoding))
+                for encoding, group in alive.items()
+            ))
+
+    @staticmethod
+    def _remove_from_index(index: Dict[Any, Dict[str, WebSocketSession]], key: Any, session_id: str):
+        sessions = index.get(key)
+        if sessions is None:
+            return
+
+        sessions.pop(session_id, None)
+        if not sessions:
+            del index[key]
+
+    @staticmethod
+    def _summary_to_dict(consultation: Optional[ConsultationSummaryDTO]) -> Optional[Dict[str, Any]]:
+        return consultation.model_dump(mode="json") if consultation is not None else None
+
+    async def notify_consultation_created(self, consultation_id: str, patient_id: str,
+                                          consultation: Optional[ConsultationSummaryDTO] = None):
         event = NotificationEvent(
             event_type=NotificationEventType.CONSULTATION_CREATED,
             consultation_id=consultation_id,
             patient_id=patient_id,
-            message=f"New consultation submitted and ready for review"
+            message=f"New consultation submitted and ready for review",
+            consultation=self._summary_to_dict(consultation),
         )
 
-        await self.broadcast_to_roles(json.dumps(event.to_dict()),[UserRole.EXPERT, UserRole.ADMIN])
+        await self.publish(
+            event,
+            user_ids=[patient_id],
+            roles=[UserRole.ADMIN],
+            topics=[NotificationTopic.PENDING_QUEUE],
+        )
 
-    async def notify_consultation_assigned(self, consultation_id: str, patient_id: str, expert_id: str):
+    async def notify_consultation_assigned(self, consultation_id: str, patient_id: str, expert_id: str,
+                                           consultation: Optional[ConsultationSummaryDTO] = None):
         event = NotificationEvent(
             event_type=NotificationEventType.CONSULTATION_ASSIGNED,
             consultation_id=consultation_id,
@@ -69,14 +382,20 @@ class WebSocketConnectionManager(EventHandler):
             expert_id=expert_id,
             old_status="PENDING",
             new_status="IN_REVIEW",
-            message=f"Consultation has been assigned to an expert for review"
+            message=f"Consultation has been assigned to an expert for review",
+            consultation=self._summary_to_dict(consultation),
         )
 
-        await self.broadcast_to_roles(json.dumps(event.to_dict()),[UserRole.EXPERT, UserRole.ADMIN])
-        await self.send_message(json.dumps(event.to_dict()), patient_id)
+        await self.publish(
+            event,
+            user_ids=[patient_id, expert_id],
+            roles=[UserRole.ADMIN],
+            topics=[NotificationTopic.PENDING_QUEUE],
+        )
 
     async def notify_consultation_status_changed(self, consultation_id: str, patient_id: str,
-                                                 expert_id: str, old_status: str, new_status: str):
+                                                 expert_id: str, old_status: str, new_status: str,
+                                                 consultation: Optional[ConsultationSummaryDTO] = None):
         event = NotificationEvent(
             event_type=NotificationEventType.CONSULTATION_STATUS_CHANGED,
             consultation_id=consultation_id,
@@ -84,15 +403,18 @@ class WebSocketConnectionManager(EventHandler):
             expert_id=expert_id,
             old_status=old_status,
             new_status=new_status,
-            message=f"Consultation status updated to {new_status}"
+            message=f"Consultation status updated to {new_status}",
+            consultation=self._summary_to_dict(consultation),
         )
 
         if new_status == "COMPLETED":
-            await self.notify_consultation_completed(consultation_id, patient_id, expert_id)
+            await self.notify_consultation_completed(consultation_id, patient_id, expert_id, consultation)
         else:
-            await self.broadcast_to_all(json.dumps(event.to_dict()))
+            topics = [NotificationTopic.PENDING_QUEUE] if "PENDING" in (old_status, new_status) else []
+            await self.publish(event, user_ids=[patient_id, expert_id], roles=[UserRole.ADMIN], topics=topics)
 
-    async def notify_consultation_completed(self, consultation_id: str, patient_id: str, expert_id: str):
+    async def notify_consultation_completed(self, consultation_id: str, patient_id: str, expert_id: str,
+                                            consultation: Optional[ConsultationSummaryDTO] = None):
         event = NotificationEvent(
             event_type=NotificationEventType.CONSULTATION_COMPLETED,
             consultation_id=consultation_id,
@@ -100,18 +422,33 @@ class WebSocketConnectionManager(EventHandler):
             expert_id=expert_id,
             old_status="IN_REVIEW",
             new_status="COMPLETED",
-            message="Consultation has been completed - report is now available"
+            message="Consultation has been completed - report is now available",
+            consultation=self._summary_to_dict(consultation),
         )
 
-        await self.broadcast_to_all(json.dumps(event.to_dict()))
+        await self.publish(event, user_ids=[patient_id, expert_id], roles=[UserRole.ADMIN])
 
-    async def notify_consultation_deleted(self, consultation_id: str, patient_id: str):
+    async def notify_consultation_deleted(self, consultation_id: str, patient_id: str, expert_id: Optional[str] = None):
         event = NotificationEvent(
             event_type=NotificationEventType.CONSULTATION_DELETED,
             consultation_id=consultation_id,
             patient_id=patient_id,
-            expert_id='',
+            expert_id=expert_id or '',
             message="Consultation has been deleted by administrator"
         )
 
-        await self.broadcast_to_all(json.dumps(event.to_dict()))
\ No newline at end of file
+        # Unassigned consultations are still sitting in the experts' pending queue.
+        topics = [] if expert_id else [NotificationTopic.PENDING_QUEUE]
+        await self.publish(event, user_ids=[patient_id, expert_id], roles=[UserRole.ADMIN], topics=topics)
+
+    async def notify_draft_report_ready(self, job: DraftReportJobDTO, patient_id: str, expert_id: str):
+        event = NotificationEvent(
+            event_type=NotificationEventType.DRAFT_REPORT_READY,
+            consultation_id=str(job.consultation_id),
+            patient_id=patient_id,
+            expert_id=expert_id,
+            message="AI draft report is ready for review" if job.report else f"AI draft report failed: {job.message}",
+            job=job.model_dump(mode="json"),
+        )
+
+        await self.publish(event, user_ids=[expert_id])
@@ -0,0 +1,100 @@
+import io
+import logging
+from datetime import datetime
+from typing import Optional
+
+import numpy as np
+import pydicom
+from pydicom.errors import InvalidDicomError
+
+from domain.entities.study import StudyMetadata
+from application.interfaces.study_metadata import StudyMetadataReader
+
+DICOM_CONTENT_TYPE = "application/dicom"
+
+HEADER_TAGS = ["Modality", "BodyPartExamined", "Rows", "Columns", "StudyDate"]
+
+
+def is_dicom(data: bytes) -> bool:
+    """Part 10 files carry a 128-byte preamble followed by the DICM magic."""
+    return data[128:132] == b"DICM"
+
+
+class DicomMetadataReader(StudyMetadataReader):
+    """Reads the header tags we index with pydicom, stopping before the pixel data is parsed."""
+
+    def read(self, data: bytes) -> Optional[StudyMetadata]:
+        if not is_dicom(data):
+            return None
+
+        try:
+            dataset = pydicom.dcmread(io.BytesIO(data), stop_before_pixels=True, specific_tags=HEADER_TAGS)
+        except (InvalidDicomError, ValueError, EOFError) as e:
+            logging.warning(f"Could not parse DICOM header: {e}")
+            return None
+
+        return StudyMetadata(
+            modality=_code(dataset.get("Modality")),
+            body_part=_code(dataset.get("BodyPartExamined")),
+            rows=int(dataset.Rows) if "Rows" in dataset else None,
+            columns=int(dataset.Columns) if "Columns" in dataset else None,
+            study_date=_parse_date(dataset.get("StudyDate")),
+        )
+
+
+def _code(value) -> Optional[str]:
+    """Code strings are upper case by the standard, but not every modality honours it."""
+    return str(value).strip().upper() or None if value else None
+
+
+def _parse_date(value: Optional[str]):
+    if not value:
+        return None
+    try:
+        return datetime.strptime(str(value), "%Y%m%d").date()
+    except ValueError:
+        return None
+
+
+def apply_window(pixels: np.ndarray, center: Optional[float] = None, width: Optional[float] = None) -> np.ndarray:
+    """
+    Map intensities to 8-bit with a linear window. Without an explicit window,
+    the 0.5-99.5 percentile range is used so outliers do not wash out the image.
+    """
+    if center is None or width is None or width <= 0:
+        low, high = np.percentile(pixels, (0.5, 99.5))
+    else:
+        low, high = center - width / 2, center + width / 2
+    if high <= low:
+        high = low + 1
+    return np.clip((pixels - low) * (255.0 / (high - low)), 0, 255).astype(np.uint8)
+
+
+def dicom_to_grayscale(data: bytes, center: Optional[float] = None, width: Optional[float] = None) -> np.ndarray:
+    """
+    Decode DICOM pixel data to an 8-bit grayscale array: modality rescale to real units,
+    then the requested window, the file's own VOI window, or a percentile window, in that order.
+    """
+    dataset = pydicom.dcmread(io.BytesIO(data))
+    pixels = dataset.pixel_array
+    if int(dataset.get("NumberOfFrames", 1) or 1) > 1:
+        pixels = pixels[0]
+    if int(dataset.get("SamplesPerPixel", 1)) == 3:
+        pixels = pixels @ np.array([0.299, 0.587, 0.114], dtype=np.float32)
+
+    pixels = pixels.astype(np.float32)
+    pixels *= float(dataset.get("RescaleSlope", 1) or 1)
+    pixels += float(dataset.get("RescaleIntercept", 0) or 0)
+
+    if center is None and "WindowCenter" in dataset and "WindowWidth" in dataset:
+        center = _first(dataset.WindowCenter)
+        width = _first(dataset.WindowWidth)
+
+    grayscale = apply_window(pixels, center, width)
+    if dataset.get("PhotometricInterpretation") == "MONOCHROME1":
+        grayscale = 255 - grayscale
+    return grayscale
+
+
+def _first(value) -> float:
+    return float(value[0]) if isinstance(value, pydicom.multival.MultiValue) else float(value)
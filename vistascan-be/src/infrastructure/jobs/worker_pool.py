@@ -0,0 +1,101 @@
+import asyncio
+import logging
+from contextlib import asynccontextmanager
+from typing import Any, AsyncIterator, Dict, List, Optional, Set
+
+from application.interfaces.job_queue import JobQueue, Job
+
+
+class AsyncWorkerPool(JobQueue):
+    """
+    Bounded in-process job queue drained by a fixed number of worker tasks,
+    so at most `concurrency` jobs run at once and bursts wait in the queue instead of piling onto downstream services.
+    Work run inline through slot() takes from the same `concurrency` slots as queued jobs.
+    """
+
+    def __init__(self, concurrency: int, max_queue_size: int, name: str = "jobs"):
+        self._concurrency = concurrency
+        self._queue: asyncio.Queue[Optional[Job]] = asyncio.Queue(maxsize=max_queue_size)
+        self._name = name
+        self._workers: List[asyncio.Task] = []
+        self._slots = asyncio.Semaphore(concurrency)
+        self._inline_running = 0
+        self._running_jobs: Set[asyncio.Task] = set()
+        self._running = 0
+        self._completed_total = 0
+        self._failed_total = 0
+        self._rejected_total = 0
+        self._cancelled_total = 0
+
+    async def start(self):
+        self._workers = [asyncio.create_task(self._work()) for _ in range(self._concurrency)]
+
+    async def stop(self):
+        for worker in self._workers:
+            worker.cancel()
+        await asyncio.gather(*self._workers, return_exceptions=True)
+        self._workers = []
+
+    def submit(self, job: Job) -> bool:
+        try:
+            self._queue.put_nowait(job)
+            return True
+        except asyncio.QueueFull:
+            self._rejected_total += 1
+            logging.warning(f"Job queue {self._name} is full, rejecting job")
+            return False
+
+    def is_busy(self) -> bool:
+        return self._slots.locked() or not self._queue.empty()
+
+    @asynccontextmanager
+    async def slot(self) -> AsyncIterator[None]:
+        async with self._slots:
+            self._inline_running += 1
+            try:
+                yield
+            finally:
+                self._inline_running -= 1
+
+    def cancel_running(self) -> int:
+        for job_task in self._running_jobs:
+            job_task.cancel()
+        return len(self._running_jobs)
+
+    def stats(self) -> Dict[str, Any]:
+        return {
+            "concurrency": self._concurrency,
+            "queued": self._queue.qsize(),
+            "max_queue_size": self._queue.maxsize,
+            "running": self._running,
+            "inline_running": self._inline_running,
+            "completed_total": self._completed_total,
+            "failed_total": self._failed_total,
+            "rejected_total": self._rejected_total,
+            "cancelled_total": self._cancelled_total,
+        }
+
+    async def _work(self):
+        while True:
+            job = await self._queue.get()
+            await self._slots.acquire()
+            self._running += 1
+            # Each job runs in its own task so cancel_running() can stop it without losing the worker.
+            job_task = asyncio.create_task(job())
+            self._running_jobs.add(job_task)
+            try:
+                await job_task
+                self._completed_total += 1
+            except asyncio.CancelledError:
+                if asyncio.current_task().cancelling():
+                    raise
+                self._cancelled_total += 1
+                logging.info(f"Job in queue {self._name} was cancelled")
+            except Exception as e:
+                self._failed_total += 1
+                logging.error(f"Job in queue {self._name} failed: {e}")
+            finally:
+                self._running_jobs.discard(job_task)
+                self._running -= 1
+                self._slots.release()
+                self._queue.task_done()
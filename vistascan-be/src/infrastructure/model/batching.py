@@ -0,0 +1,100 @@
+import asyncio
+import logging
+from typing import AsyncIterator, BinaryIO, List, Optional, Tuple
+
+from domain.entities.report import ReportGenerationResult
+from application.interfaces.model_client import ModelClient, StudyStreamOpener
+from infrastructure.model.model_service import ModelServiceClient
+from infrastructure.model.multipart import bytes_opener
+
+PendingRequest = Tuple[StudyStreamOpener, str, str, asyncio.Future]
+
+
+class BatchingModelClient(ModelClient):
+    """
+    Collects concurrent generate_report calls into micro-batches for the model service batch endpoint.
+    A batch is sent once it holds max_batch_size images or max_wait seconds after its first image arrived,
+    whichever comes first, so batching never adds more than max_wait to a request.
+    """
+
+    def __init__(self, client: ModelServiceClient, max_batch_size: int = 8, max_wait: float = 0.02,
+                 chunk_size: int = 256 * 1024):
+        self._client = client
+        self._chunk_size = chunk_size
+        self._max_batch_size = max_batch_size
+        self._max_wait = max_wait
+        self._pending: List[PendingRequest] = []
+        self._flush_timer: Optional[asyncio.TimerHandle] = None
+        self._batch_supported = True
+        self._in_flight = set()
+
+    async def generate_report(self, image_data: BinaryIO, filename: str,
+                              content_type: str = "image/jpeg") -> ReportGenerationResult:
+        return await self.generate_report_stream(
+            bytes_opener(image_data.read(), self._chunk_size), filename, content_type
+        )
+
+    async def generate_report_stream(self, open_stream: StudyStreamOpener, filename: str,
+                                     content_type: str = "image/jpeg") -> ReportGenerationResult:
+        if not self._batch_supported:
+            return await self._client.generate_report_stream(open_stream, filename, content_type)
+
+        loop = asyncio.get_running_loop()
+        future = loop.create_future()
+        self._pending.append((open_stream, filename, content_type, future))
+
+        if len(self._pending) >= self._max_batch_size:
+            self._flush()
+        elif self._flush_timer is None:
+            self._flush_timer = loop.call_later(self._max_wait, self._flush)
+
+        return await future
+
+    async def stream_report(self, open_stream: StudyStreamOpener, filename: str,
+                            content_type: str = "image/jpeg") -> AsyncIterator[str]:
+        # A streamed report is read while it is decoded, so it gets a call of its own rather than a batch slot.
+        async for text in self._client.stream_report(open_stream, filename, content_type):
+            yield text
+
+    def is_available(self) -> bool:
+        return self._client.is_available()
+
+    async def health_check(self) -> bool:
+        return await self._client.health_check()
+
+    def _flush(self):
+        if self._flush_timer is not None:
+            self._flush_timer.cancel()
+            self._flush_timer = None
+
+        batch, self._pending = self._pending, []
+        if batch:
+            task = asyncio.create_task(self._send(batch))
+            self._in_flight.add(task)
+            task.add_done_callback(self._in_flight.discard)
+
+    async def _send(self, batch: List[PendingRequest]):
+        try:
+            if len(batch) == 1:
+                open_stream, filename, content_type, _ = batch[0]
+                results = [await self._client.generate_report_stream(open_stream, filename, content_type)]
+            else:
+                results = await self._client.generate_reports_stream(
+                    [(open_stream, filename, content_type) for open_stream, filename, content_type, _ in batch]
+                )
+                if results is None:
+                    if self._batch_supported:
+                        logging.warning("Model service has no batch endpoint, falling back to single requests")
+                        self._batch_supported = False
+                    results = await asyncio.gather(*(
+                        self._client.generate_report_stream(open_stream, filename, content_type)
+                        for open_stream, filename, content_type, _ in batch
+                    ))
+        except Exception as e:
+            logging.error(f"Unexpected error sending batch of {len(batch)} images to model service: {e}")
+            results = [ReportGenerationResult(report="", success=False, message="An unexpected error occurred")
+                       for _ in batch]
+
+        for (_, _, _, future), result in zip(batch, results):
+            if not future.done():
+                future.set_result(result)
@@ -0,0 +1,94 @@
+import random
+from enum import StrEnum
+from typing import Any, Dict, List, Optional, Sequence, Set
+
+
+class BalancingStrategy(StrEnum):
+    LEAST_OUTSTANDING = "least_outstanding"
+    EWMA = "ewma"
+
+
+class ModelEndpoint:
+    """One inference server, with the load and latency signals the pool balances on."""
+
+    def __init__(self, url: str):
+        self.url = url.rstrip('/')
+        self.outstanding = 0
+        self.ewma_latency: Optional[float] = None
+        self.healthy = True
+        self.requests_total = 0
+        self.failures_total = 0
+        self.ejections_total = 0
+
+    def stats(self) -> Dict[str, Any]:
+        return {
+            "url": self.url,
+            "healthy": self.healthy,
+            "outstanding": self.outstanding,
+            "ewma_latency_ms": self.ewma_latency * 1000 if self.ewma_latency is not None else None,
+            "requests_total": self.requests_total,
+            "failures_total": self.failures_total,
+            "ejections_total": self.ejections_total,
+        }
+
+
+class EndpointPool:
+    """
+    Picks a model service endpoint per request.
+    LEAST_OUTSTANDING sends each request to the endpoint with the fewest requests in flight;
+    EWMA weighs that by each endpoint's smoothed latency, so a slow node also gets fewer requests.
+    Endpoints failing health checks are ejected until a check passes again.
+    """
+
+    def __init__(self, urls: Sequence[str], strategy: BalancingStrategy = BalancingStrategy.LEAST_OUTSTANDING,
+                 ewma_alpha: float = 0.3):
+        if not urls:
+            raise ValueError("At least one model service endpoint is required")
+        self.endpoints: List[ModelEndpoint] = [ModelEndpoint(url) for url in urls]
+        self._strategy = BalancingStrategy(strategy)
+        self._alpha = ewma_alpha
+
+    def pick(self, exclude: Optional[Set[str]] = None) -> ModelEndpoint:
+        candidates = [endpoint for endpoint in self.endpoints if endpoint.healthy] or self.endpoints
+        if exclude:
+            candidates = [endpoint for endpoint in candidates if endpoint.url not in exclude] or candidates
+
+        best_score = min(self._score(endpoint) for endpoint in candidates)
+        # Break ties at random, so idle endpoints share the load instead of the first one taking it all.
+        return random.choice([endpoint for endpoint in candidates if self._score(endpoint) == best_score])
+
+    def acquire(self, endpoint: ModelEndpoint):
+        endpoint.outstanding += 1
+        endpoint.requests_total += 1
+
+    def release(self, endpoint: ModelEndpoint, latency: Optional[float] = None):
+        """Finish a request; latency is left out for failed requests so errors do not look fast."""
+        endpoint.outstanding -= 1
+        if latency is None:
+            endpoint.failures_total += 1
+        elif endpoint.ewma_latency is None:
+            endpoint.ewma_latency = latency
+        else:
+            endpoint.ewma_latency += self._alpha * (latency - endpoint.ewma_latency)
+
+    def mark_health(self, endpoint: ModelEndpoint, healthy: bool):
+        if endpoint.healthy and not healthy:
+            endpoint.ejections_total += 1
+        endpoint.healthy = healthy
+
+    def has_healthy(self) -> bool:
+        return any(endpoint.healthy for endpoint in self.endpoints)
+
+    def stats(self) -> Dict[str, Any]:
+        return {
+            "strategy": self._strategy.value,
+            "endpoints": [endpoint.stats() for endpoint in self.endpoints],
+        }
+
+    def _score(self, endpoint: ModelEndpoint) -> float:
+        if self._strategy == BalancingStrategy.EWMA:
+            # Unmeasured endpoints score as the fastest known one, so new nodes get traffic right away.
+            known = [e.ewma_latency for e in self.endpoints if e.ewma_latency is not None]
+            latency = endpoint.ewma_latency if endpoint.ewma_latency is not None else min(known, default=1.0)
+            return latency * (endpoint.outstanding + 1)
+        return endpoint.outstanding
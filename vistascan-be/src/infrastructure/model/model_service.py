@@ -1,45 +1,159 @@
+import asyncio
 import httpx
+import json
 import logging
-from typing import BinaryIO
+import secrets
+import time
+from typing import Any, AsyncIterator, BinaryIO, Dict, List, Optional, Sequence, Tuple
 
 from domain.entities.report import ReportGenerationResult
-from application.interfaces.model_client import ModelClient
+from application.exceptions import ReportGenerationFailed
+from application.interfaces.model_client import ModelClient, StudyStreamOpener
+from infrastructure.model.endpoints import BalancingStrategy, EndpointPool, ModelEndpoint
+from infrastructure.model.multipart import MultipartFile, bytes_opener, multipart_body
+from infrastructure.model.resilience import (
+    CircuitBreaker, CircuitOpenError, CircuitState, ResilientCaller, RetryPolicy, is_failure_status,
+)
 
 
 class ModelServiceClient(ModelClient):
-    def __init__(self, base_url: str, timeout: int = 30):
-        self.base_url = base_url.rstrip('/')
+    """
+    Client for the AI model service. A single pooled AsyncClient is kept for the lifetime of the app,
+    so requests reuse keep-alive connections instead of paying DNS, TCP and TLS setup every call.
+    Report requests go through a ResilientCaller (circuit breaker, retries, hedging and a per-call deadline),
+    and a background health probe feeds the same breaker. Studies are sent as a streamed multipart body
+    of chunk_size pieces, so a request holds one chunk in memory rather than the whole study.
+    With several endpoints, each request goes to the one the EndpointPool picks, and health checks
+    eject and readmit individual endpoints. stream_report relays the report as the model decodes it.
+    """
+
+    def __init__(self, base_url: str, timeout: int = 30, max_connections: int = 20,
+                 max_keepalive_connections: int = 10, keepalive_expiry: float = 30, http2: bool = False,
+                 caller: Optional[ResilientCaller] = None, health_check_interval: float = 0,
+                 chunk_size: int = 256 * 1024, endpoints: Sequence[str] = (),
+                 balancing: BalancingStrategy = BalancingStrategy.LEAST_OUTSTANDING,
+                 transport: Optional[httpx.AsyncBaseTransport] = None):
+        self._endpoints = EndpointPool(endpoints or [base_url], balancing)
         self.timeout = timeout
+        self._limits = httpx.Limits(
+            max_connections=max_connections,
+            max_keepalive_connections=max_keepalive_connections,
+            keepalive_expiry=keepalive_expiry,
+        )
+        self._http2 = http2
+        self._client = httpx.AsyncClient(timeout=self.timeout, limits=self._limits, http2=http2, transport=transport)
+        self._in_flight = 0
+        self._peak_in_flight = 0
+        self._requests_total = 0
+        self._caller = caller or ResilientCaller(CircuitBreaker(), RetryPolicy())
+        self._health_check_interval = health_check_interval
+        self._health_task: Optional[asyncio.Task] = None
+        self._chunk_size = chunk_size
+
+    def is_available(self) -> bool:
+        """Whether calls are currently let through, i.e. the circuit breaker is not open."""
+        return self._caller.breaker.state != CircuitState.OPEN
+
+    async def start(self):
+        if self._health_check_interval > 0 and self._health_task is None:
+            self._health_task = asyncio.create_task(self._probe_health())
+
+    async def aclose(self):
+        if self._health_task is not None:
+            self._health_task.cancel()
+            try:
+                await self._health_task
+            except asyncio.CancelledError:
+                pass
+            self._health_task = None
+        await self._client.aclose()
+
+    async def _probe_health(self):
+        while True:
+            await asyncio.sleep(self._health_check_interval)
+            await self.health_check()
+
+    def pool_stats(self) -> Dict[str, Any]:
+        """Report connection-pool utilization, to tell when draft generation is bound by connections."""
+        connections = []
+        # httpx does not expose its pool, so read the httpcore one when it is there.
+        pool = getattr(getattr(self._client, "_transport", None), "_pool", None)
+        if pool is not None:
+            connections = list(getattr(pool, "connections", []))
 
-    async def generate_report(self, image_data: BinaryIO, filename: str) -> ReportGenerationResult:
+        return {
+            "max_connections": self._limits.max_connections,
+            "max_keepalive_connections": self._limits.max_keepalive_connections,
+            "http2": self._http2,
+            "in_flight": self._in_flight,
+            "peak_in_flight": self._peak_in_flight,
+            "requests_total": self._requests_total,
+            "open_connections": len(connections),
+            "idle_connections": sum(1 for connection in connections if connection.is_idle()),
+            **self._caller.stats(),
+            **self._endpoints.stats(),
+        }
+
+    async def _request(self, method: str, path: str, endpoint: Optional[ModelEndpoint] = None,
+                       **kwargs) -> httpx.Response:
+        endpoint = endpoint or self._endpoints.pick()
+        self._endpoints.acquire(endpoint)
+        self._in_flight += 1
+        self._requests_total += 1
+        self._peak_in_flight = max(self._peak_in_flight, self._in_flight)
+        started = time.monotonic()
+        latency = None
         try:
-            files = {
-                'file': (filename, image_data, 'image/jpeg')
-            }
-
-            async with httpx.AsyncClient(timeout=self.timeout) as client:
-                response = await client.post(
-                    f"{self.base_url}/generate-report",
-                    files=files
-                )
+            response = await self._client.request(method, f"{endpoint.url}{path}", **kwargs)
+            if not is_failure_status(response.status_code):
+                latency = time.monotonic() - started
+            return response
+        finally:
+            self._in_flight -= 1
+            self._endpoints.release(endpoint, latency)
 
-                if response.status_code == 200:
-                    result = response.json()
-                    return ReportGenerationResult(
-                        report=result.get('report', ''),
-                        success=result.get('success', False),
-                        message=result.get('message', '')
-                    )
-                else:
-                    error_detail = response.json().get('detail',
-                                                       'Unknown error') if response.content else 'No response content'
-                    logging.error(f"Model service request failed with status {response.status_code}: {error_detail}")
-                    return ReportGenerationResult(
-                        report="",
-                        success=False,
-                        message=f"Model service error: {error_detail}"
-                    )
+    async def _post_files(self, path: str, files: List[MultipartFile]) -> httpx.Response:
+        boundary = secrets.token_hex(16)
+        headers = {"Content-Type": f"multipart/form-data; boundary={boundary}"}
+        # Every attempt (retry or hedge) builds a fresh body generator, which reopens each file.
+        return await self._caller.call(
+            lambda: self._request("POST", path, content=multipart_body(files, boundary), headers=headers)
+        )
+
+    async def generate_report(self, image_data: BinaryIO, filename: str,
+                              content_type: str = "image/jpeg") -> ReportGenerationResult:
+        return await self.generate_report_stream(
+            bytes_opener(image_data.read(), self._chunk_size), filename, content_type
+        )
 
+    async def generate_report_stream(self, open_stream: StudyStreamOpener, filename: str,
+                                     content_type: str = "image/jpeg") -> ReportGenerationResult:
+        try:
+            response = await self._post_files("/generate-report", [("file", filename, content_type, open_stream)])
+
+            if response.status_code == 200:
+                result = response.json()
+                return ReportGenerationResult(
+                    report=result.get('report', ''),
+                    success=result.get('success', False),
+                    message=result.get('message', '')
+                )
+            else:
+                error_detail = response.json().get('detail',
+                                                   'Unknown error') if response.content else 'No response content'
+                logging.error(f"Model service request failed with status {response.status_code}: {error_detail}")
+                return ReportGenerationResult(
+                    report="",
+                    success=False,
+                    message=f"Model service error: {error_detail}"
+                )
+
+        except CircuitOpenError:
+            return ReportGenerationResult(
+                report="",
+                success=False,
+                message="AI model service is temporarily unavailable"
+            )
         except httpx.TimeoutException:
             logging.error("Timeout when calling model service")
             return ReportGenerationResult(
@@ -62,11 +176,171 @@ class ModelServiceClient(ModelClient):
                 message="An unexpected error occurred"
             )
 
+    async def stream_report(self, open_stream: StudyStreamOpener, filename: str,
+                            content_type: str = "image/jpeg") -> AsyncIterator[str]:
+        """
+        Generate a report through the streaming endpoint, yielding text as the model decodes it. The endpoint
+        may answer with server-sent events, each carrying a token as JSON or plain text, or with plain chunked
+        text. Once text has been yielded the call cannot be replayed, so it goes through the circuit breaker
+        but is neither retried nor hedged. Without a streaming endpoint the whole report is yielded at once.
+        Raises ReportGenerationFailed when no report can be produced.
+        """
+        if not self._caller.breaker.allow_request():
+            raise ReportGenerationFailed("AI model service is temporarily unavailable")
+
+        endpoint = self._endpoints.pick()
+        boundary = secrets.token_hex(16)
+        request = self._client.build_request(
+            "POST", f"{endpoint.url}/generate-report/stream",
+            content=multipart_body([("file", filename, content_type, open_stream)], boundary),
+            headers={"Content-Type": f"multipart/form-data; boundary={boundary}", "Accept": "text/event-stream"},
+        )
+        self._endpoints.acquire(endpoint)
+        self._in_flight += 1
+        self._requests_total += 1
+        self._peak_in_flight = max(self._peak_in_flight, self._in_flight)
+        started = time.monotonic()
+        latency = None
+        fallback = False
+        try:
+            response = await self._client.send(request, stream=True)
+            if response.status_code != 200 and not is_failure_status(response.status_code):
+                latency = time.monotonic() - started
+            try:
+                if response.status_code in (404, 405):
+                    self._caller.breaker.record_response(response.status_code)
+                    fallback = True
+                elif response.status_code != 200:
+                    await response.aread()
+                    error_detail = response.json().get('detail',
+                                                       'Unknown error') if response.content else 'No response content'
+                    self._caller.breaker.record_response(response.status_code)
+                    logging.error(f"Model service stream failed with status {response.status_code}: {error_detail}")
+                    raise ReportGenerationFailed(f"Model service error: {error_detail}")
+                else:
+                    async for text in self._report_chunks(response):
+                        yield text
+                    self._caller.breaker.record_success()
+                    latency = time.monotonic() - started
+            finally:
+                await response.aclose()
+        except httpx.TimeoutException:
+            self._caller.breaker.record_failure()
+            logging.error("Timeout when streaming from model service")
+            raise ReportGenerationFailed("Request to AI model service timed out")
+        except httpx.RequestError as e:
+            self._caller.breaker.record_failure()
+            logging.error(f"Request error when streaming from model service: {str(e)}")
+            raise ReportGenerationFailed("Failed to connect to AI model service")
+        except BaseException:
+            self._caller.breaker.abandon_trial()
+            raise
+        finally:
+            self._in_flight -= 1
+            self._endpoints.release(endpoint, latency)
+
+        if fallback:
+            result = await self.generate_report_stream(open_stream, filename, content_type)
+            if not result.success:
+                raise ReportGenerationFailed(result.message)
+            yield result.report
+
+    @staticmethod
+    async def _report_chunks(response: httpx.Response) -> AsyncIterator[str]:
+        if not response.headers.get("content-type", "").startswith("text/event-stream"):
+            async for text in response.aiter_text():
+                if text:
+                    yield text
+            return
+
+        async for line in response.aiter_lines():
+            if not line.startswith("data:"):
+                continue
+            data = line[5:].removeprefix(" ")
+            if data == "[DONE]":
+                return
+            try:
+                event = json.loads(data)
+            except ValueError:
+                yield data
+                continue
+            if not isinstance(event, dict):
+                yield str(event)
+            elif event.get("error"):
+                raise ReportGenerationFailed(f"Model service error: {event['error']}")
+            elif event.get("token") or event.get("text"):
+                yield event.get("token") or event.get("text")
+
+    async def generate_reports(self, images: List[Tuple[BinaryIO, str]]) -> Optional[List[ReportGenerationResult]]:
+        return await self.generate_reports_stream([
+            (bytes_opener(image_data.read(), self._chunk_size), filename, "image/jpeg")
+            for image_data, filename in images
+        ])
+
+    async def generate_reports_stream(
+            self, images: List[Tuple[StudyStreamOpener, str, str]]
+    ) -> Optional[List[ReportGenerationResult]]:
+        """
+        Generate reports for several images in a single request to the batch endpoint, in input order.
+        Returns None when the model service has no batch endpoint, so callers can fall back to single requests.
+        """
+        try:
+            files = [("files", filename, content_type, open_stream) for open_stream, filename, content_type in images]
+
+            response = await self._post_files("/generate-report/batch", files)
+
+            if response.status_code in (404, 405):
+                return None
+
+            if response.status_code == 200:
+                results = response.json().get('results', [])
+                if len(results) == len(images):
+                    return [
+                        ReportGenerationResult(
+                            report=result.get('report', ''),
+                            success=result.get('success', False),
+                            message=result.get('message', '')
+                        )
+                        for result in results
+                    ]
+                error_detail = f"expected {len(images)} results, got {len(results)}"
+            else:
+                error_detail = response.json().get('detail',
+                                                   'Unknown error') if response.content else 'No response content'
+
+            logging.error(f"Model service batch request failed with status {response.status_code}: {error_detail}")
+            message = f"Model service error: {error_detail}"
+        except CircuitOpenError:
+            message = "AI model service is temporarily unavailable"
+        except httpx.TimeoutException:
+            logging.error("Timeout when calling model service batch endpoint")
+            message = "Request to AI model service timed out"
+        except httpx.RequestError as e:
+            logging.error(f"Request error when calling model service batch endpoint: {str(e)}")
+            message = "Failed to connect to AI model service"
+        except Exception as e:
+            logging.error(f"Unexpected error when calling model service batch endpoint: {str(e)}")
+            message = "An unexpected error occurred"
+
+        return [ReportGenerationResult(report="", success=False, message=message) for _ in images]
+
     async def health_check(self) -> bool:
+        """Check every endpoint, ejecting failing ones and readmitting recovered ones. True if any is healthy."""
+        await asyncio.gather(*(self._check_endpoint(endpoint) for endpoint in self._endpoints.endpoints))
+        healthy = self._endpoints.has_healthy()
+        self._caller.breaker.record_health(healthy)
+        return healthy
+
+    async def _check_endpoint(self, endpoint: ModelEndpoint):
         try:
-            async with httpx.AsyncClient(timeout=5) as client:
-                response = await client.get(f"{self.base_url}/health")
-                return response.status_code == 200
+            # Sent directly rather than through _request: a cheap /health round-trip is not load, and must not
+            # pull down the latency average that generation requests are balanced on.
+            response = await self._client.get(f"{endpoint.url}/health", timeout=5)
+            healthy = response.status_code == 200
         except Exception as e:
-            logging.error(f"Health check failed: {str(e)}")
-            return False
\ No newline at end of file
+            logging.error(f"Health check of {endpoint.url} failed: {str(e)}")
+            healthy = False
+
+        if healthy != endpoint.healthy:
+            logging.warning(f"Model service endpoint {endpoint.url} is {'back' if healthy else 'down, ejecting it'}")
+        self._endpoints.mark_health(endpoint, healthy)
\ No newline at end of file
@@ -0,0 +1,60 @@
+import asyncio
+from typing import AsyncIterator, Iterator, List, Tuple
+
+from application.interfaces.model_client import StudyStreamOpener
+
+# (form field, filename, content type, opener) for each file in a multipart request
+MultipartFile = Tuple[str, str, str, StudyStreamOpener]
+
+
+def bytes_opener(content: bytes, chunk_size: int) -> StudyStreamOpener:
+    """Expose an in-memory study through the same chunked interface as a storage stream."""
+    def open_stream() -> Iterator[bytes]:
+        for offset in range(0, len(content), chunk_size):
+            yield content[offset:offset + chunk_size]
+    return open_stream
+
+
+async def iterate_in_thread(chunks: Iterator[bytes]) -> AsyncIterator[bytes]:
+    """
+    Pull a blocking chunk iterator (e.g. a MinIO response body) from a worker thread, one chunk at a time.
+    If the consumer goes away mid-read, the iterator is closed once the pending read returns,
+    since a generator cannot be closed while another thread is running it.
+    """
+    loop = asyncio.get_running_loop()
+    pending = None
+    try:
+        while True:
+            pending = loop.run_in_executor(None, next, chunks, None)
+            chunk = await asyncio.shield(pending)
+            if chunk is None:
+                break
+            yield chunk
+    finally:
+        if pending is not None and not pending.done():
+            pending.add_done_callback(lambda read: _close(chunks, read))
+        else:
+            _close(chunks)
+
+
+def _close(chunks: Iterator[bytes], read: asyncio.Future = None):
+    if read is not None and not read.cancelled():
+        read.exception()
+    close = getattr(chunks, "close", None)
+    if close is not None:
+        close()
+
+
+async def multipart_body(files: List[MultipartFile], boundary: str) -> AsyncIterator[bytes]:
+    """Stream a multipart/form-data body, opening each file only when the request reaches it."""
+    for field, filename, content_type, open_stream in files:
+        quoted = filename.replace('"', "%22")
+        yield (
+            f'--{boundary}\r\n'
+            f'Content-Disposition: form-data; name="{field}"; filename="{quoted}"\r\n'
+            f'Content-Type: {content_type}\r\n\r\n'
+        ).encode()
+        async for chunk in iterate_in_thread(open_stream()):
+            yield chunk
+        yield b"\r\n"
+    yield f"--{boundary}--\r\n".encode()
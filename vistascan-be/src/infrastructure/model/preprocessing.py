@@ -0,0 +1,107 @@
+import asyncio
+import io
+import logging
+import multiprocessing
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from typing import Callable, Optional
+
+import numpy as np
+from PIL import Image
+
+from application.interfaces.image_preprocessor import ImagePreprocessor
+from infrastructure.imaging.dicom import apply_window, dicom_to_grayscale, is_dicom
+
+CONTENT_TYPES = {
+    "PNG": "image/png",
+    "JPEG": "image/jpeg",
+}
+
+
+def to_grayscale(data: bytes, center: Optional[float] = None, width: Optional[float] = None) -> np.ndarray:
+    """Decode a DICOM or a Pillow-readable image to windowed 8-bit grayscale pixels."""
+    if is_dicom(data):
+        return dicom_to_grayscale(data, center, width)
+
+    image = Image.open(io.BytesIO(data))
+    if image.mode in ("I", "I;16", "I;16B", "I;16L", "F"):
+        pixels = np.asarray(image, dtype=np.float32)
+    else:
+        pixels = np.asarray(image.convert("L"), dtype=np.float32)
+    return apply_window(pixels, center, width)
+
+
+def encode_image(pixels: np.ndarray, size: int, output_format: str, fit_longest_side: bool = False) -> bytes:
+    """Resize the shorter side (or the longer one, to fit a box) down to size and encode once."""
+    image = Image.fromarray(pixels)
+    scale = size / (max(image.size) if fit_longest_side else min(image.size))
+    if scale < 1:
+        image = image.resize(
+            (max(1, round(image.width * scale)), max(1, round(image.height * scale))),
+            Image.Resampling.LANCZOS,
+        )
+
+    output = io.BytesIO()
+    image.save(output, format=output_format)
+    return output.getvalue()
+
+
+def preprocess_image(data: bytes, input_size: int, output_format: str) -> bytes:
+    """Build the model input for a study. Runs in a worker process."""
+    return encode_image(to_grayscale(data), input_size, output_format)
+
+
+def render_image(data: bytes, max_size: int, center: Optional[float], width: Optional[float]) -> bytes:
+    """Render a study as a PNG for display, optionally with an explicit window. Runs in a worker process."""
+    return encode_image(to_grayscale(data, center, width), max_size, "PNG", fit_longest_side=True)
+
+
+class PillowImagePreprocessor(ImagePreprocessor):
+    """
+    Preprocesses studies with NumPy, Pillow and pydicom in a process pool, keeping the CPU-bound decode
+    and resize off the event loop and out of the GIL.
+    """
+
+    def __init__(self, input_size: int = 512, output_format: str = "PNG", max_workers: int = 2):
+        self._input_size = input_size
+        self._output_format = output_format.upper()
+        self._max_workers = max_workers
+        self._executor: Optional[ProcessPoolExecutor] = None
+
+    @property
+    def variant(self) -> str:
+        return f"{self._input_size}-{self._output_format.lower()}"
+
+    @property
+    def content_type(self) -> str:
+        return CONTENT_TYPES[self._output_format]
+
+    async def preprocess(self, data: bytes) -> Optional[bytes]:
+        return await self._run(preprocess_image, data, self._input_size, self._output_format)
+
+    async def render(self, data: bytes, max_size: int, window_center: Optional[float] = None,
+                     window_width: Optional[float] = None) -> Optional[bytes]:
+        return await self._run(render_image, data, max_size, window_center, window_width)
+
+    async def _run(self, function: Callable[..., bytes], *args) -> Optional[bytes]:
+        if self._executor is None:
+            # Spawned rather than forked workers, since forking a process running threads can deadlock.
+            self._executor = ProcessPoolExecutor(
+                max_workers=self._max_workers,
+                mp_context=multiprocessing.get_context("spawn"),
+            )
+
+        try:
+            return await asyncio.get_running_loop().run_in_executor(self._executor, function, *args)
+        except BrokenProcessPool as e:
+            logging.error(f"Preprocessing worker pool crashed, restarting it: {e}")
+            self.shutdown()
+            return None
+        except Exception as e:
+            logging.warning(f"Could not decode study: {e}")
+            return None
+
+    def shutdown(self):
+        if self._executor is not None:
+            self._executor.shutdown(cancel_futures=True)
+            self._executor = None
@@ -0,0 +1,249 @@
+import asyncio
+import random
+import time
+from collections import deque
+from enum import StrEnum
+from typing import Any, Awaitable, Callable, Deque, Dict, Optional
+
+import httpx
+
+# Statuses worth another attempt of an idempotent call: it may well succeed on a healthy replica or a moment later.
+RETRYABLE_STATUSES = {502, 503, 504}
+
+# Errors raised before the request was sent, so retrying them never runs a call twice.
+CONNECT_ERRORS = (httpx.ConnectError, httpx.ConnectTimeout, httpx.PoolTimeout)
+
+
+def is_failure_status(status_code: int) -> bool:
+    """Whether a response counts against the breaker: any 5xx, retryable or not. 4xx are the caller's fault."""
+    return status_code >= 500
+
+Attempt = Callable[[], Awaitable[httpx.Response]]
+
+
+class CircuitOpenError(Exception):
+    """Raised instead of calling the model service while its circuit breaker is open."""
+    def __init__(self, message="Model service circuit breaker is open."):
+        self.message = message
+        super().__init__(self.message)
+
+
+class CircuitState(StrEnum):
+    CLOSED = "closed"
+    OPEN = "open"
+    HALF_OPEN = "half_open"
+
+
+class CircuitBreaker:
+    """
+    Error-rate circuit breaker over a sliding window of recent calls.
+    Opens when the failure rate crosses the threshold, then lets a single trial call through
+    after open_seconds, closing again when it succeeds. Health checks can trip or recover it too.
+    """
+
+    def __init__(self, failure_rate: float = 0.5, window: int = 20, min_calls: int = 5, open_seconds: float = 30,
+                 clock: Callable[[], float] = time.monotonic):
+        self._clock = clock
+        self._failure_rate = failure_rate
+        self._min_calls = min_calls
+        self._open_seconds = open_seconds
+        self._outcomes: Deque[bool] = deque(maxlen=window)
+        self._state = CircuitState.CLOSED
+        self._opened_at = 0.0
+        self._trial_in_flight = False
+        self.opened_total = 0
+        self.short_circuited_total = 0
+
+    @property
+    def state(self) -> CircuitState:
+        if self._state == CircuitState.OPEN and self._clock() - self._opened_at >= self._open_seconds:
+            self._state = CircuitState.HALF_OPEN
+            self._trial_in_flight = False
+        return self._state
+
+    def allow_request(self) -> bool:
+        state = self.state
+        if state == CircuitState.CLOSED:
+            return True
+        if state == CircuitState.HALF_OPEN and not self._trial_in_flight:
+            self._trial_in_flight = True
+            return True
+
+        self.short_circuited_total += 1
+        return False
+
+    def record_success(self):
+        if self._state != CircuitState.CLOSED:
+            self._close()
+        self._outcomes.append(True)
+
+    def record_response(self, status_code: int):
+        if is_failure_status(status_code):
+            self.record_failure()
+        else:
+            self.record_success()
+
+    def record_failure(self):
+        if self._state == CircuitState.HALF_OPEN:
+            self._open()
+            return
+
+        self._outcomes.append(False)
+        failures = self._outcomes.count(False)
+        if len(self._outcomes) >= self._min_calls and failures / len(self._outcomes) >= self._failure_rate:
+            self._open()
+
+    def record_health(self, healthy: bool):
+        if not healthy and self.state != CircuitState.OPEN:
+            self._open()
+        elif healthy and self.state == CircuitState.HALF_OPEN:
+            self._close()
+
+    def abandon_trial(self):
+        """Let another trial through when the current one ended without an outcome, e.g. was cancelled."""
+        self._trial_in_flight = False
+
+    def _open(self):
+        self._state = CircuitState.OPEN
+        self._opened_at = self._clock()
+        self._trial_in_flight = False
+        self.opened_total += 1
+
+    def _close(self):
+        self._state = CircuitState.CLOSED
+        self._trial_in_flight = False
+        self._outcomes.clear()
+
+
+class RetryPolicy:
+    """Bounded retries with full-jitter exponential backoff."""
+
+    def __init__(self, max_retries: int = 2, base_delay: float = 0.2, max_delay: float = 2.0):
+        self.max_retries = max_retries
+        self._base_delay = base_delay
+        self._max_delay = max_delay
+
+    def backoff(self, retry: int) -> float:
+        return random.uniform(0, min(self._max_delay, self._base_delay * 2 ** retry))
+
+
+class LatencyTracker:
+    """Sliding window of recent successful call latencies, used to time hedged requests."""
+
+    def __init__(self, window: int = 200, min_samples: int = 20):
+        self._samples: Deque[float] = deque(maxlen=window)
+        self._min_samples = min_samples
+
+    def record(self, seconds: float):
+        self._samples.append(seconds)
+
+    def p95(self) -> Optional[float]:
+        if len(self._samples) < self._min_samples:
+            return None
+        ordered = sorted(self._samples)
+        return ordered[int(0.95 * (len(ordered) - 1))]
+
+
+class ResilientCaller:
+    """
+    Runs model service requests under a per-call deadline, through the circuit breaker, with jittered
+    retries and, when enabled, a hedged second attempt once the first has been outstanding longer than the
+    recent p95. Every call is retried on errors raised before the request was sent; only idempotent calls
+    are also retried on other request errors, such as read timeouts, and on gateway statuses, since the
+    model may already be working on a request that failed after it was sent.
+    """
+
+    def __init__(self, breaker: CircuitBreaker, retry: RetryPolicy, deadline: Optional[float] = None,
+                 hedging: bool = False, latency: Optional[LatencyTracker] = None):
+        self.breaker = breaker
+        self._retry = retry
+        self._deadline = deadline
+        self._hedging = hedging
+        self._latency = latency or LatencyTracker()
+        self._retries_total = 0
+        self._hedges_total = 0
+        self._hedge_wins_total = 0
+
+    def stats(self) -> Dict[str, Any]:
+        p95 = self._latency.p95()
+        return {
+            "circuit_state": self.breaker.state.value,
+            "circuit_opened_total": self.breaker.opened_total,
+            "short_circuited_total": self.breaker.short_circuited_total,
+            "retries_total": self._retries_total,
+            "hedges_total": self._hedges_total,
+            "hedge_wins_total": self._hedge_wins_total,
+            "latency_p95_ms": p95 * 1000 if p95 is not None else None,
+        }
+
+    async def call(self, attempt: Attempt, idempotent: bool = False) -> httpx.Response:
+        if not self.breaker.allow_request():
+            raise CircuitOpenError()
+
+        try:
+            async with asyncio.timeout(self._deadline):
+                return await self._call_with_retries(attempt, idempotent)
+        except TimeoutError:
+            self.breaker.record_failure()
+            raise httpx.TimeoutException(f"Model service call exceeded its {self._deadline}s deadline")
+        except BaseException:
+            self.breaker.abandon_trial()
+            raise
+
+    async def _call_with_retries(self, attempt: Attempt, idempotent: bool) -> httpx.Response:
+        retry = 0
+        while True:
+            try:
+                response = await self._hedged(attempt)
+                self.breaker.record_response(response.status_code)
+                if not idempotent or response.status_code not in RETRYABLE_STATUSES:
+                    return response
+                if retry >= self._retry.max_retries or not self.breaker.allow_request():
+                    return response
+            except httpx.RequestError as e:
+                self.breaker.record_failure()
+                if not (idempotent or isinstance(e, CONNECT_ERRORS)):
+                    raise
+                if retry >= self._retry.max_retries or not self.breaker.allow_request():
+                    raise
+
+            await asyncio.sleep(self._retry.backoff(retry))
+            retry += 1
+            self._retries_total += 1
+
+    async def _hedged(self, attempt: Attempt) -> httpx.Response:
+        hedge_after = self._latency.p95() if self._hedging else None
+        first = asyncio.create_task(self._timed(attempt))
+        if hedge_after is None:
+            return await first
+
+        tasks = {first}
+        try:
+            done, _ = await asyncio.wait(tasks, timeout=hedge_after)
+            if not done:
+                self._hedges_total += 1
+                tasks.add(asyncio.create_task(self._timed(attempt)))
+
+            while True:
+                done, pending = await asyncio.wait(tasks, return_when=asyncio.FIRST_COMPLETED)
+                for task in done:
+                    if task.exception() is None and not is_failure_status(task.result().status_code):
+                        if task is not first:
+                            self._hedge_wins_total += 1
+                        return task.result()
+                if not pending:
+                    # Every attempt failed, surface the last outcome to the retry loop.
+                    return done.pop().result()
+                tasks = pending
+        finally:
+            for task in tasks:
+                task.cancel()
+            # Collect the losers' outcomes, so their errors are not reported as never retrieved.
+            await asyncio.gather(*tasks, return_exceptions=True)
+
+    async def _timed(self, attempt: Attempt) -> httpx.Response:
+        started = time.monotonic()
+        response = await attempt()
+        if not is_failure_status(response.status_code):
+            self._latency.record(time.monotonic() - started)
+        return response
@@ -0,0 +1,107 @@
+import asyncio
+from contextlib import contextmanager
+from contextvars import ContextVar
+from typing import Callable, Dict, Generic, Hashable, Iterator, List, Optional, TypeVar
+
+K = TypeVar("K", bound=Hashable)
+V = TypeVar("V")
+
+
+class DataLoader(Generic[K, V]):
+    """
+    Batches and memoizes lookups by key for the length of one request.
+    load() calls made in the same event-loop tick are coalesced into a single fetch_many call, and every
+    result, misses included, is kept so later lookups of the same key in the request cost nothing.
+    """
+
+    def __init__(self, fetch_many: Callable[[List[K]], List[V]], key_of: Callable[[V], K]):
+        self._fetch_many = fetch_many
+        self._key_of = key_of
+        self._memo: Dict[K, Optional[V]] = {}
+        self._pending: Dict[K, asyncio.Future] = {}
+        self.fetches_total = 0
+
+    async def load(self, key: K) -> Optional[V]:
+        if key in self._memo:
+            return self._memo[key]
+
+        future = self._pending.get(key)
+        if future is None:
+            loop = asyncio.get_running_loop()
+            if not self._pending:
+                loop.call_soon(self._dispatch)
+            future = self._pending[key] = loop.create_future()
+        return await future
+
+    async def load_many(self, keys: List[K]) -> List[Optional[V]]:
+        return list(await asyncio.gather(*(self.load(key) for key in keys)))
+
+    def get(self, key: K) -> Optional[V]:
+        """Synchronous lookup for callers outside a coroutine; memoized, but fetched on its own."""
+        return self.get_many([key])[0]
+
+    def get_many(self, keys: List[K]) -> List[Optional[V]]:
+        missing = list(dict.fromkeys(key for key in keys if key not in self._memo))
+        if missing:
+            self._fetch(missing)
+        return [self._memo[key] for key in keys]
+
+    def prime(self, key: K, value: Optional[V]):
+        self._memo[key] = value
+
+    def clear(self, key: K):
+        self._memo.pop(key, None)
+
+    def _dispatch(self):
+        pending, self._pending = self._pending, {}
+        try:
+            self._fetch(list(pending))
+        except Exception as e:
+            for future in pending.values():
+                if not future.done():
+                    future.set_exception(e)
+            return
+
+        for key, future in pending.items():
+            if not future.done():
+                future.set_result(self._memo[key])
+
+    def _fetch(self, keys: List[K]):
+        self.fetches_total += 1
+        found = {self._key_of(value): value for value in self._fetch_many(keys)}
+        for key in keys:
+            self._memo[key] = found.get(key)
+
+
+class RequestScope:
+    """The loaders of one request. Closed scopes are ignored, so tasks that outlive the request never see them."""
+
+    def __init__(self):
+        self.loaders: Dict[str, DataLoader] = {}
+        self.closed = False
+
+
+_current_scope: ContextVar[Optional[RequestScope]] = ContextVar("request_scope", default=None)
+
+
+@contextmanager
+def request_scope() -> Iterator[RequestScope]:
+    scope = RequestScope()
+    token = _current_scope.set(scope)
+    try:
+        yield scope
+    finally:
+        scope.closed = True
+        _current_scope.reset(token)
+
+
+def scoped_loader(name: str, factory: Callable[[], DataLoader]) -> Optional[DataLoader]:
+    """The request's loader with this name, created on first use, or None outside an open request scope."""
+    scope = _current_scope.get()
+    if scope is None or scope.closed:
+        return None
+
+    loader = scope.loaders.get(name)
+    if loader is None:
+        loader = scope.loaders[name] = factory()
+    return loader
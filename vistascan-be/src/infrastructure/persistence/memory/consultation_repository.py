@@ -0,0 +1,78 @@
+from datetime import date, datetime
+from typing import Dict, Optional, List
+from uuid import UUID
+
+from domain.entities.consultation import Consultation, ConsultationStatus
+from application.interfaces.repositories import ConsultationRepository
+
+
+class InMemoryConsultationRepository(ConsultationRepository):
+    """Dictionary-backed consultation repository for benchmarks and local experiments."""
+
+    def __init__(self):
+        self._consultations: Dict[UUID, Consultation] = {}
+
+    def save(self, consultation: Consultation) -> Optional[Consultation]:
+        stored = self._consultations.get(consultation.id)
+        consultation.version = (stored.version if stored else consultation.version) + 1
+        consultation.updated_at = datetime.now()
+        self._consultations[consultation.id] = consultation
+        return consultation
+
+    def delete_by_id(self, consultation_id: UUID) -> bool:
+        return self._consultations.pop(consultation_id, None) is not None
+
+    def find_by_id(self, consultation_id: UUID) -> Optional[Consultation]:
+        return self._consultations.get(consultation_id)
+
+    def find_by_ids(self, consultation_ids: List[UUID]) -> List[Consultation]:
+        return [self._consultations[c_id] for c_id in consultation_ids if c_id in self._consultations]
+
+    def find_by_patient_id(self, patient_id: UUID) -> List[Consultation]:
+        return [c for c in self._consultations.values() if c.patient_id == patient_id]
+
+    def find_by_expert_id(self, expert_id: UUID) -> List[Consultation]:
+        return [c for c in self._consultations.values() if c.expert_id == expert_id]
+
+    def find_by_status(self, status: ConsultationStatus) -> List[Consultation]:
+        return [c for c in self._consultations.values() if c.status == status]
+
+    def find_by_study_metadata(self, modality: Optional[str] = None, body_part: Optional[str] = None,
+                               study_date_from: Optional[date] = None,
+                               study_date_to: Optional[date] = None) -> List[Consultation]:
+        def matches(consultation: Consultation) -> bool:
+            metadata = consultation.imaging_study.metadata
+            if metadata is None:
+                return False
+            return ((not modality or metadata.modality == modality.upper()) and
+                    (not body_part or metadata.body_part == body_part.upper()) and
+                    (not study_date_from or (metadata.study_date and metadata.study_date >= study_date_from)) and
+                    (not study_date_to or (metadata.study_date and metadata.study_date <= study_date_to)))
+
+        return [c for c in self._consultations.values() if matches(c)]
+
+    def find_all(self) -> List[Consultation]:
+        return list(self._consultations.values())
+
+    def set_content_hash(self, consultation_id: UUID, content_hash: str) -> bool:
+        consultation = self._consultations.get(consultation_id)
+        if consultation is None:
+            return False
+        consultation.imaging_study.content_hash = content_hash
+        return True
+
+    def set_draft_report(self, consultation_id: UUID, draft_report: str, model_version: str) -> bool:
+        consultation = self._consultations.get(consultation_id)
+        if consultation is None:
+            return False
+        consultation.draft_report = draft_report
+        consultation.draft_report_model_version = model_version
+        return True
+
+    def set_preprocessed_study(self, consultation_id: UUID, preprocessed_path: str, preprocessed_variant: str) -> bool:
+        consultation = self._consultations.get(consultation_id)
+        if consultation is None:
+            return False
+        consultation.imaging_study.preprocessed_path = preprocessed_path
+        consultation.imaging_study.preprocessed_variant = preprocessed_variant
+        return True
@@ -0,0 +1,46 @@
+from typing import Dict, List, Optional
+from uuid import UUID
+
+from domain.entities.consultation import ConsultationStatus
+from domain.entities.consultation_view import ConsultationView
+from application.interfaces.repositories import ConsultationViewRepository
+
+
+class InMemoryConsultationViewRepository(ConsultationViewRepository):
+    """Dictionary-backed consultation view repository for benchmarks and local experiments."""
+
+    def __init__(self):
+        self._views: Dict[UUID, ConsultationView] = {}
+
+    def save(self, view: ConsultationView) -> Optional[ConsultationView]:
+        self._views[view.id] = view
+        return view
+
+    def save_many(self, views: List[ConsultationView]) -> int:
+        for view in views:
+            self._views[view.id] = view
+        return len(views)
+
+    def delete_by_id(self, consultation_id: UUID) -> bool:
+        return self._views.pop(consultation_id, None) is not None
+
+    def rename_user(self, user_id: UUID, full_name: str) -> int:
+        renamed = 0
+        for view in self._views.values():
+            if view.patient_id == user_id:
+                view.patient_name = full_name
+                renamed += 1
+            if view.expert_id == user_id:
+                view.expert_name = full_name
+                renamed += 1
+        return renamed
+
+    def find(self, status: Optional[ConsultationStatus] = None, expert_id: Optional[UUID] = None,
+             patient_id: Optional[UUID] = None, limit: int = 100) -> List[ConsultationView]:
+        views = [
+            view for view in self._views.values()
+            if (status is None or view.status == status)
+            and (expert_id is None or view.expert_id == expert_id)
+            and (patient_id is None or view.patient_id == patient_id)
+        ]
+        return sorted(views, key=lambda view: view.created_at, reverse=True)[:limit]
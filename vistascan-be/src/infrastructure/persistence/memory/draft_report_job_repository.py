@@ -0,0 +1,23 @@
+from typing import Dict, Optional
+from uuid import UUID
+
+from domain.entities.job import DraftReportJob
+from application.interfaces.repositories import DraftReportJobRepository
+
+
+class InMemoryDraftReportJobRepository(DraftReportJobRepository):
+    """Dictionary-backed draft report job repository for benchmarks and local experiments."""
+
+    def __init__(self):
+        self._jobs: Dict[UUID, DraftReportJob] = {}
+
+    def save(self, job: DraftReportJob) -> Optional[DraftReportJob]:
+        self._jobs[job.id] = job
+        return job
+
+    def find_by_id(self, job_id: UUID) -> Optional[DraftReportJob]:
+        return self._jobs.get(job_id)
+
+    def find_active_by_consultation_id(self, consultation_id: UUID) -> Optional[DraftReportJob]:
+        return next((job for job in self._jobs.values()
+                     if job.consultation_id == consultation_id and job.is_active()), None)
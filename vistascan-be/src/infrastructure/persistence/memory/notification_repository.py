@@ -0,0 +1,50 @@
+from datetime import datetime
+from typing import Dict, Optional, List, Tuple
+from uuid import UUID
+
+from domain.entities.event import InboxNotification
+from application.interfaces.repositories import NotificationRepository
+
+
+class InMemoryNotificationRepository(NotificationRepository):
+    """Dictionary-backed notification inbox for benchmarks and local experiments."""
+
+    def __init__(self):
+        self._notifications: Dict[Tuple[UUID, int], InboxNotification] = {}
+
+    def save_many(self, notifications: List[InboxNotification]) -> int:
+        saved = 0
+        for notification in notifications:
+            key = (notification.user_id, notification.seq)
+            if key not in self._notifications:
+                self._notifications[key] = notification
+                saved += 1
+
+        return saved
+
+    def find_by_user_id(self, user_id: UUID, before_seq: Optional[int], limit: int,
+                        unacknowledged_only: bool = False) -> List[InboxNotification]:
+        notifications = [
+            n for (owner, seq), n in self._notifications.items()
+            if owner == user_id
+            and (before_seq is None or seq < before_seq)
+            and (not unacknowledged_only or n.acknowledged_at is None)
+        ]
+        notifications.sort(key=lambda n: n.seq, reverse=True)
+        return notifications[:limit]
+
+    def acknowledge(self, user_id: UUID, seqs: List[int]) -> int:
+        return self._acknowledge(user_id, lambda seq: seq in seqs)
+
+    def acknowledge_up_to(self, user_id: UUID, seq: int) -> int:
+        return self._acknowledge(user_id, lambda other: other <= seq)
+
+    def _acknowledge(self, user_id: UUID, matches) -> int:
+        acknowledged = 0
+        now = datetime.now()
+        for (owner, seq), notification in self._notifications.items():
+            if owner == user_id and notification.acknowledged_at is None and matches(seq):
+                notification.acknowledged_at = now
+                acknowledged += 1
+
+        return acknowledged
@@ -0,0 +1,44 @@
+from typing import Dict, Optional, List
+from uuid import UUID
+
+from domain.entities.user import User, UserRole
+from application.interfaces.repositories import UserRepository
+
+
+class InMemoryUserRepository(UserRepository):
+    """Dictionary-backed user repository for benchmarks and local experiments."""
+
+    def __init__(self):
+        self._users: Dict[UUID, User] = {}
+
+    def save(self, user: User) -> Optional[User]:
+        self._users[user.id] = user
+        return user
+
+    def find_by_id(self, user_id: UUID) -> Optional[User]:
+        return self._users.get(user_id)
+
+    def find_by_ids(self, user_ids: List[UUID]) -> List[User]:
+        return [self._users[user_id] for user_id in user_ids if user_id in self._users]
+
+    def find_by_email(self, email: str) -> Optional[User]:
+        return next((user for user in self._users.values() if user.email == email), None)
+
+    def find_by_username(self, username: str) -> Optional[User]:
+        return next((user for user in self._users.values() if user.username == username), None)
+
+    def find_by_role(self, role: UserRole) -> List[User]:
+        return [user for user in self._users.values() if user.role == role]
+
+    def find_all(self) -> List[User]:
+        return list(self._users.values())
+
+    def delete_by_id(self, user_id: UUID) -> bool:
+        return self._users.pop(user_id, None) is not None
+
+    def update(self, user: User) -> Optional[User]:
+        if user.id not in self._users:
+            return None
+
+        self._users[user.id] = user
+        return user
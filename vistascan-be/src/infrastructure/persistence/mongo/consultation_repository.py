@@ -1,13 +1,17 @@
 import logging
 import mongoengine as me
+from datetime import date, datetime
 from typing import Optional, List
 from uuid import UUID
 
+from pymongo import ReturnDocument
+
 from application.interfaces.repositories import ConsultationRepository
 from domain.entities.consultation import Consultation, ConsultationStatus
-from domain.entities.study import ImagingStudy
+from domain.entities.study import ImagingStudy, StudyMetadata
 from domain.entities.report import Report
-from infrastructure.persistence.mongo.models import ConsultationDocument, ImagingStudyDocument, ReportDocument
+from infrastructure.persistence.mongo.models import ConsultationDocument, ImagingStudyDocument, ReportDocument, \
+    StudyMetadataDocument
 
 
 class MongoConsultationRepository(ConsultationRepository):
@@ -17,10 +21,26 @@ class MongoConsultationRepository(ConsultationRepository):
     def save(self, consultation: Consultation) -> Optional[Consultation]:
         try:
             consultation_doc = self._entity_to_doc(consultation)
-            consultation_doc.save()
+            consultation_doc.validate()
+
+            fields = consultation_doc.to_mongo().to_dict()
+            fields.pop('_id', None)
+            fields.pop('version', None)
+            fields['updated_at'] = datetime.now()
+            update = {'$set': fields, '$inc': {'version': 1}}
+            # to_mongo() leaves out None values, so cleared fields have to be unset explicitly.
+            cleared = {field.db_field: '' for name, field in ConsultationDocument._fields.items()
+                       if name not in ('id', 'version') and field.db_field not in fields}
+            if cleared:
+                update['$unset'] = cleared
+
+            # The fields and the version bump go out in one findAndModify, so a reader never sees new content
+            # under the old ETag and concurrent saves each move the version on.
+            raw = ConsultationDocument._get_collection().find_one_and_update(
+                {'_id': str(consultation.id)}, update, upsert=True, return_document=ReturnDocument.AFTER)
 
             logging.info(f"Saving consultation {consultation.id}")
-            return self._doc_to_entity(consultation_doc)
+            return self._doc_to_entity(ConsultationDocument._from_son(raw))
         except Exception as e:
             logging.error(f"Error saving consultation {consultation.id}: {e}")
             return None
@@ -47,6 +67,14 @@ class MongoConsultationRepository(ConsultationRepository):
             logging.warning(f"Consultation with ID {consultation_id} not found.")
             return None
 
+    def find_by_ids(self, consultation_ids: List[UUID]) -> List[Consultation]:
+        try:
+            consultations = ConsultationDocument.objects(id__in=[str(c_id) for c_id in consultation_ids])
+            return [self._doc_to_entity(consultation) for consultation in consultations]
+        except Exception as e:
+            logging.error(f"Error retrieving consultations {consultation_ids}: {e}")
+            return []
+
     def find_by_patient_id(self, patient_id: UUID) -> List[Consultation]:
         try:
             consultations = ConsultationDocument.objects(patient_id=str(patient_id))
@@ -65,6 +93,28 @@ class MongoConsultationRepository(ConsultationRepository):
             logging.warning(f"No consultations found with status {status}.")
             return []
 
+    def find_by_study_metadata(self, modality: Optional[str] = None, body_part: Optional[str] = None,
+                               study_date_from: Optional[date] = None,
+                               study_date_to: Optional[date] = None) -> List[Consultation]:
+        query = {}
+        if modality:
+            query['imaging_study__metadata__modality'] = modality.upper()
+        if body_part:
+            query['imaging_study__metadata__body_part'] = body_part.upper()
+        if study_date_from:
+            query['imaging_study__metadata__study_date__gte'] = study_date_from
+        if study_date_to:
+            query['imaging_study__metadata__study_date__lte'] = study_date_to
+        if not query:
+            query['imaging_study__metadata__exists'] = True
+
+        try:
+            consultations = ConsultationDocument.objects(**query)
+            return [self._doc_to_entity(consultation) for consultation in consultations]
+        except Exception as e:
+            logging.error(f"Error finding consultations by study metadata: {e}")
+            return []
+
     def find_by_expert_id(self, expert_id: UUID) -> List[Consultation]:
         try:
             consultations = ConsultationDocument.objects(expert_id=str(expert_id))
@@ -82,19 +132,51 @@ class MongoConsultationRepository(ConsultationRepository):
             logging.error(f"Error fetching all consultations: {e}")
             return []
 
+    def set_content_hash(self, consultation_id: UUID, content_hash: str) -> bool:
+        try:
+            return ConsultationDocument.objects(id=str(consultation_id)).update_one(
+                set__imaging_study__content_hash=content_hash) > 0
+        except Exception as e:
+            logging.error(f"Error setting content hash of consultation {consultation_id}: {e}")
+            return False
+
+    def set_draft_report(self, consultation_id: UUID, draft_report: str, model_version: str) -> bool:
+        try:
+            return ConsultationDocument.objects(id=str(consultation_id)).update_one(
+                set__draft_report=draft_report, set__draft_report_model_version=model_version) > 0
+        except Exception as e:
+            logging.error(f"Error setting draft report of consultation {consultation_id}: {e}")
+            return False
+
+    def set_preprocessed_study(self, consultation_id: UUID, preprocessed_path: str, preprocessed_variant: str) -> bool:
+        try:
+            return ConsultationDocument.objects(id=str(consultation_id)).update_one(
+                set__imaging_study__preprocessed_path=preprocessed_path,
+                set__imaging_study__preprocessed_variant=preprocessed_variant) > 0
+        except Exception as e:
+            logging.error(f"Error setting preprocessed image of consultation {consultation_id}: {e}")
+            return False
+
     @staticmethod
     def _entity_to_doc(consultation: Consultation) -> ConsultationDocument:
-        try:
-            consultation_doc = ConsultationDocument.objects.get(id=str(consultation.id))
-        except me.DoesNotExist:
-            consultation_doc = ConsultationDocument(id=str(consultation.id))
+        consultation_doc = ConsultationDocument(id=str(consultation.id))
 
         imaging_study_doc = ImagingStudyDocument(
             file_name=consultation.imaging_study.file_name,
             content_type=consultation.imaging_study.content_type,
             size=consultation.imaging_study.size,
             upload_date=consultation.imaging_study.upload_date,
-            file_path=consultation.imaging_study.file_path
+            file_path=consultation.imaging_study.file_path,
+            content_hash=consultation.imaging_study.content_hash,
+            preprocessed_path=consultation.imaging_study.preprocessed_path,
+            preprocessed_variant=consultation.imaging_study.preprocessed_variant,
+            metadata=StudyMetadataDocument(
+                modality=consultation.imaging_study.metadata.modality,
+                body_part=consultation.imaging_study.metadata.body_part,
+                rows=consultation.imaging_study.metadata.rows,
+                columns=consultation.imaging_study.metadata.columns,
+                study_date=consultation.imaging_study.metadata.study_date
+            ) if consultation.imaging_study.metadata else None
         )
 
         report_doc = None
@@ -114,6 +196,8 @@ class MongoConsultationRepository(ConsultationRepository):
         consultation_doc.expert_id = str(consultation.expert_id) if consultation.expert_id else None
         consultation_doc.completed_at = consultation.completed_at
         consultation_doc.download_url = consultation.download_url
+        consultation_doc.draft_report = consultation.draft_report
+        consultation_doc.draft_report_model_version = consultation.draft_report_model_version
 
         return consultation_doc
 
@@ -124,7 +208,17 @@ class MongoConsultationRepository(ConsultationRepository):
             content_type=doc.imaging_study.content_type,
             size=doc.imaging_study.size,
             upload_date=doc.imaging_study.upload_date,
-            file_path=doc.imaging_study.file_path
+            file_path=doc.imaging_study.file_path,
+            content_hash=doc.imaging_study.content_hash,
+            preprocessed_path=doc.imaging_study.preprocessed_path,
+            preprocessed_variant=doc.imaging_study.preprocessed_variant,
+            metadata=StudyMetadata(
+                modality=doc.imaging_study.metadata.modality,
+                body_part=doc.imaging_study.metadata.body_part,
+                rows=doc.imaging_study.metadata.rows,
+                columns=doc.imaging_study.metadata.columns,
+                study_date=doc.imaging_study.metadata.study_date
+            ) if doc.imaging_study.metadata else None
         )
 
         report = None
@@ -145,5 +239,9 @@ class MongoConsultationRepository(ConsultationRepository):
             report=report,
             expert_id=UUID(doc.expert_id) if doc.expert_id else None,
             completed_at=doc.completed_at,
-            download_url=doc.download_url
+            download_url=doc.download_url,
+            draft_report=doc.draft_report,
+            draft_report_model_version=doc.draft_report_model_version,
+            version=doc.version or 0,
+            updated_at=doc.updated_at,
         )
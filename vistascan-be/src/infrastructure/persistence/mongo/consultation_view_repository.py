@@ -0,0 +1,113 @@
+import logging
+import mongoengine as me
+from typing import Any, Dict, List, Optional
+from uuid import UUID
+
+from pymongo import ReplaceOne
+
+from application.interfaces.repositories import ConsultationViewRepository
+from domain.entities.consultation import ConsultationStatus
+from domain.entities.consultation_view import ConsultationView
+from infrastructure.persistence.mongo.models import ConsultationViewDocument
+
+
+class MongoConsultationViewRepository(ConsultationViewRepository):
+    """
+    consultation_views collection: one flat document per consultation, so a dashboard page is a single
+    indexed query returning raw documents, with no joins against users and no mongoengine instantiation.
+    The indexes select and order the rows, but the query is not covered: the rows carry names and study
+    fields the indexes do not, so each matching document is still fetched, at most limit of them.
+    """
+
+    def __init__(self, db_name: str, db_uri: str):
+        me.connect(db_name, host=db_uri)
+        ConsultationViewDocument.ensure_indexes()
+
+    def save(self, view: ConsultationView) -> Optional[ConsultationView]:
+        try:
+            self._entity_to_doc(view).save()
+            return view
+        except Exception as e:
+            logging.error(f"Error saving consultation view {view.id}: {e}")
+            return None
+
+    def save_many(self, views: List[ConsultationView]) -> int:
+        if not views:
+            return 0
+
+        try:
+            operations = []
+            for view in views:
+                document = self._entity_to_doc(view).to_mongo().to_dict()
+                operations.append(ReplaceOne({"_id": document["_id"]}, document, upsert=True))
+            result = ConsultationViewDocument._get_collection().bulk_write(operations, ordered=False)
+            return result.upserted_count + result.modified_count
+        except Exception as e:
+            logging.error(f"Error saving {len(views)} consultation views: {e}")
+            return 0
+
+    def delete_by_id(self, consultation_id: UUID) -> bool:
+        try:
+            return ConsultationViewDocument.objects(id=str(consultation_id)).delete() > 0
+        except Exception as e:
+            logging.error(f"Error deleting consultation view {consultation_id}: {e}")
+            return False
+
+    def rename_user(self, user_id: UUID, full_name: str) -> int:
+        try:
+            return (ConsultationViewDocument.objects(patient_id=str(user_id)).update(set__patient_name=full_name) +
+                    ConsultationViewDocument.objects(expert_id=str(user_id)).update(set__expert_name=full_name))
+        except Exception as e:
+            logging.error(f"Error renaming user {user_id} in consultation views: {e}")
+            return 0
+
+    def find(self, status: Optional[ConsultationStatus] = None, expert_id: Optional[UUID] = None,
+             patient_id: Optional[UUID] = None, limit: int = 100) -> List[ConsultationView]:
+        query = {}
+        if status:
+            query['status'] = status.value
+        if expert_id:
+            query['expert_id'] = str(expert_id)
+        if patient_id:
+            query['patient_id'] = str(patient_id)
+
+        try:
+            documents = ConsultationViewDocument.objects(**query).order_by('-created_at').limit(limit).as_pymongo()
+            return [self._raw_to_entity(document) for document in documents]
+        except Exception as e:
+            logging.error(f"Error finding consultation views: {e}")
+            return []
+
+    @staticmethod
+    def _entity_to_doc(view: ConsultationView) -> ConsultationViewDocument:
+        return ConsultationViewDocument(
+            id=str(view.id),
+            patient_id=str(view.patient_id),
+            patient_name=view.patient_name,
+            expert_id=str(view.expert_id) if view.expert_id else None,
+            expert_name=view.expert_name,
+            status=view.status.value,
+            file_name=view.file_name,
+            modality=view.modality,
+            body_part=view.body_part,
+            created_at=view.created_at,
+            updated_at=view.updated_at,
+            completed_at=view.completed_at,
+        )
+
+    @staticmethod
+    def _raw_to_entity(document: Dict[str, Any]) -> ConsultationView:
+        return ConsultationView(
+            id=UUID(document['_id']),
+            patient_id=UUID(document['patient_id']),
+            patient_name=document['patient_name'],
+            expert_id=UUID(document['expert_id']) if document.get('expert_id') else None,
+            expert_name=document.get('expert_name'),
+            status=ConsultationStatus(document['status']),
+            file_name=document['file_name'],
+            modality=document.get('modality'),
+            body_part=document.get('body_part'),
+            created_at=document['created_at'],
+            updated_at=document['updated_at'],
+            completed_at=document.get('completed_at'),
+        )
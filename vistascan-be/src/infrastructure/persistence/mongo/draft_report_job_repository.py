@@ -0,0 +1,69 @@
+import logging
+import mongoengine as me
+from typing import Optional
+from uuid import UUID
+
+from application.interfaces.repositories import DraftReportJobRepository
+from domain.entities.job import DraftReportJob, DraftReportJobStatus
+from infrastructure.persistence.mongo.models import DraftReportJobDocument
+
+
+class MongoDraftReportJobRepository(DraftReportJobRepository):
+    def __init__(self, db_name: str, db_uri: str, ttl_seconds: int):
+        me.connect(db_name, host=db_uri)
+        DraftReportJobDocument.ensure_indexes()
+        DraftReportJobDocument._get_collection().create_index(
+            "created_at",
+            name="created_at_ttl",
+            expireAfterSeconds=ttl_seconds,
+        )
+
+    def save(self, job: DraftReportJob) -> Optional[DraftReportJob]:
+        try:
+            self._entity_to_doc(job).save()
+            return job
+        except Exception as e:
+            logging.error(f"Error saving draft report job {job.id}: {e}")
+            return None
+
+    def find_by_id(self, job_id: UUID) -> Optional[DraftReportJob]:
+        try:
+            return self._doc_to_entity(DraftReportJobDocument.objects.get(id=str(job_id)))
+        except me.DoesNotExist:
+            logging.warning(f"Draft report job with ID {job_id} not found.")
+            return None
+
+    def find_active_by_consultation_id(self, consultation_id: UUID) -> Optional[DraftReportJob]:
+        doc = DraftReportJobDocument.objects(
+            consultation_id=str(consultation_id),
+            status__in=[DraftReportJobStatus.QUEUED.value, DraftReportJobStatus.RUNNING.value],
+        ).order_by("-created_at").first()
+        return self._doc_to_entity(doc) if doc else None
+
+    @staticmethod
+    def _entity_to_doc(job: DraftReportJob) -> DraftReportJobDocument:
+        return DraftReportJobDocument(
+            id=str(job.id),
+            consultation_id=str(job.consultation_id),
+            requested_by=str(job.requested_by),
+            status=job.status.value,
+            report=job.report,
+            message=job.message,
+            created_at=job.created_at,
+            started_at=job.started_at,
+            finished_at=job.finished_at,
+        )
+
+    @staticmethod
+    def _doc_to_entity(doc: DraftReportJobDocument) -> DraftReportJob:
+        return DraftReportJob(
+            id=UUID(doc.id),
+            consultation_id=UUID(doc.consultation_id),
+            requested_by=UUID(doc.requested_by),
+            status=DraftReportJobStatus(doc.status),
+            report=doc.report,
+            message=doc.message or "",
+            created_at=doc.created_at,
+            started_at=doc.started_at,
+            finished_at=doc.finished_at,
+        )
@@ -2,6 +2,7 @@ import mongoengine as me
 
 from domain.entities.user import Gender, UserRole
 from domain.entities.consultation import ConsultationStatus
+from domain.entities.job import DraftReportJobStatus
 
 
 class UserDocument(me.Document):
@@ -19,16 +20,29 @@ class UserDocument(me.Document):
         'indexes': [
             'username',
             'email',
+            'role',
         ]
     }
 
 
+class StudyMetadataDocument(me.EmbeddedDocument):
+    modality = me.StringField()
+    body_part = me.StringField()
+    rows = me.IntField()
+    columns = me.IntField()
+    study_date = me.DateField()
+
+
 class ImagingStudyDocument(me.EmbeddedDocument):
     file_path = me.StringField(required=True)
     file_name = me.StringField(required=True)
     content_type = me.StringField(required=True)
     size = me.IntField(required=True)
     upload_date = me.DateTimeField(required=True)
+    content_hash = me.StringField()
+    preprocessed_path = me.StringField()
+    preprocessed_variant = me.StringField()
+    metadata = me.EmbeddedDocumentField(StudyMetadataDocument)
 
 
 class ReportDocument(me.EmbeddedDocument):
@@ -49,6 +63,10 @@ class ConsultationDocument(me.Document):
     expert_id = me.StringField()
     completed_at = me.DateTimeField()
     download_url = me.StringField()
+    draft_report = me.StringField()
+    draft_report_model_version = me.StringField()
+    version = me.IntField(default=0)
+    updated_at = me.DateTimeField()
 
     meta = {
         'collection': 'consultations',
@@ -56,5 +74,86 @@ class ConsultationDocument(me.Document):
             'patient_id',
             'expert_id',
             'status',
+            {'fields': ['imaging_study.metadata.modality', 'imaging_study.metadata.body_part',
+                        '-imaging_study.metadata.study_date']},
+            '-imaging_study.metadata.study_date',
+        ]
+    }
+
+
+class ConsultationViewDocument(me.Document):
+    """MongoDB document model for the denormalized consultation read model."""
+    id = me.StringField(primary_key=True)
+    patient_id = me.StringField(required=True)
+    patient_name = me.StringField(required=True)
+    expert_id = me.StringField()
+    expert_name = me.StringField()
+    status = me.StringField(required=True, choices=[s.value for s in ConsultationStatus])
+    file_name = me.StringField(required=True)
+    modality = me.StringField()
+    body_part = me.StringField()
+    created_at = me.DateTimeField(required=True)
+    updated_at = me.DateTimeField(required=True)
+    completed_at = me.DateTimeField()
+
+    meta = {
+        'collection': 'consultation_views',
+        # One index per dashboard query, each ending in the sort key so results come back in index order.
+        'indexes': [
+            ('status', '-created_at'),
+            ('expert_id', 'status', '-created_at'),
+            ('expert_id', '-created_at'),
+            ('patient_id', '-created_at'),
+            '-created_at',
+        ]
+    }
+
+
+class NotificationDocument(me.Document):
+    """MongoDB document model for a persisted inbox notification."""
+    id = me.StringField(primary_key=True)
+    user_id = me.StringField(required=True)
+    seq = me.IntField(required=True)
+    event = me.DictField(required=True)
+    created_at = me.DateTimeField(required=True)
+    acknowledged_at = me.DateTimeField()
+
+    meta = {
+        'collection': 'notifications',
+        'indexes': [
+            {'fields': ['user_id', '-seq'], 'unique': True},
         ]
     }
+
+
+class DraftReportJobDocument(me.Document):
+    """MongoDB document model for an asynchronous draft report job."""
+    id = me.StringField(primary_key=True)
+    consultation_id = me.StringField(required=True)
+    requested_by = me.StringField(required=True)
+    status = me.StringField(required=True, choices=[s.value for s in DraftReportJobStatus])
+    report = me.StringField()
+    message = me.StringField()
+    created_at = me.DateTimeField(required=True)
+    started_at = me.DateTimeField()
+    finished_at = me.DateTimeField()
+
+    meta = {
+        'collection': 'draft_report_jobs',
+        'indexes': [
+            ('consultation_id', 'status'),
+        ]
+    }
+
+
+class DraftReportCacheDocument(me.Document):
+    """MongoDB document model for a cached AI draft report, keyed by model version and image content hash."""
+    id = me.StringField(primary_key=True)
+    content_hash = me.StringField(required=True)
+    model_version = me.StringField(required=True)
+    report = me.StringField(required=True)
+    created_at = me.DateTimeField(required=True)
+
+    meta = {
+        'collection': 'draft_report_cache',
+    }
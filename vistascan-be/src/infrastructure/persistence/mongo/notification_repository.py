@@ -0,0 +1,84 @@
+import logging
+import mongoengine as me
+from datetime import datetime
+from typing import Optional, List
+from uuid import UUID
+from pymongo.errors import BulkWriteError
+
+from application.interfaces.repositories import NotificationRepository
+from domain.entities.event import InboxNotification
+from infrastructure.persistence.mongo.models import NotificationDocument
+
+
+class MongoNotificationRepository(NotificationRepository):
+    def __init__(self, db_name: str, db_uri: str, ttl_seconds: int):
+        me.connect(db_name, host=db_uri)
+        NotificationDocument.ensure_indexes()
+        NotificationDocument._get_collection().create_index(
+            "created_at",
+            name="created_at_ttl",
+            expireAfterSeconds=ttl_seconds,
+        )
+
+    def save_many(self, notifications: List[InboxNotification]) -> int:
+        if not notifications:
+            return 0
+
+        documents = [self._entity_to_doc(notification).to_mongo() for notification in notifications]
+        try:
+            result = NotificationDocument._get_collection().insert_many(documents, ordered=False)
+            return len(result.inserted_ids)
+        except BulkWriteError as e:
+            # Duplicates come from retried batches and are safe to skip.
+            logging.warning(f"Skipped {len(e.details.get('writeErrors', []))} notifications while saving batch")
+            return e.details.get("nInserted", 0)
+
+    def find_by_user_id(self, user_id: UUID, before_seq: Optional[int], limit: int,
+                        unacknowledged_only: bool = False) -> List[InboxNotification]:
+        query = {"user_id": str(user_id)}
+        if before_seq is not None:
+            query["seq__lt"] = before_seq
+        if unacknowledged_only:
+            query["acknowledged_at"] = None
+
+        documents = NotificationDocument.objects(**query).order_by("-seq").limit(limit)
+        return [self._doc_to_entity(doc) for doc in documents]
+
+    def acknowledge(self, user_id: UUID, seqs: List[int]) -> int:
+        if not seqs:
+            return 0
+
+        return NotificationDocument.objects(
+            user_id=str(user_id),
+            seq__in=seqs,
+            acknowledged_at=None,
+        ).update(set__acknowledged_at=datetime.now())
+
+    def acknowledge_up_to(self, user_id: UUID, seq: int) -> int:
+        return NotificationDocument.objects(
+            user_id=str(user_id),
+            seq__lte=seq,
+            acknowledged_at=None,
+        ).update(set__acknowledged_at=datetime.now())
+
+    @staticmethod
+    def _entity_to_doc(notification: InboxNotification) -> NotificationDocument:
+        return NotificationDocument(
+            id=str(notification.id),
+            user_id=str(notification.user_id),
+            seq=notification.seq,
+            event=notification.event,
+            created_at=notification.created_at,
+            acknowledged_at=notification.acknowledged_at,
+        )
+
+    @staticmethod
+    def _doc_to_entity(doc: NotificationDocument) -> InboxNotification:
+        return InboxNotification(
+            id=UUID(doc.id),
+            user_id=UUID(doc.user_id),
+            seq=doc.seq,
+            event=doc.event,
+            created_at=doc.created_at,
+            acknowledged_at=doc.acknowledged_at,
+        )
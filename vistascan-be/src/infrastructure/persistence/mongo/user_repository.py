@@ -5,7 +5,7 @@ from uuid import UUID
 from pymongo import MongoClient
 
 from .models import UserDocument
-from domain.entities.user import User
+from domain.entities.user import User, UserRole
 from application.interfaces.repositories import UserRepository
 
 
@@ -43,6 +43,14 @@ class MongoUserRepository(UserRepository):
             logging.warning(f"User with ID {user_id} not found.")
             return None
 
+    def find_by_ids(self, user_ids: List[UUID]) -> List[User]:
+        try:
+            user_docs = UserDocument.objects(id__in=[str(user_id) for user_id in user_ids])
+            return [self._doc_to_entity(doc) for doc in user_docs]
+        except Exception as e:
+            logging.error(f"Error retrieving users {user_ids}: {e}")
+            return []
+
     def find_by_email(self, email: str) -> Optional[User]:
         try:
             user_doc = UserDocument.objects.get(email=email)
@@ -59,6 +67,14 @@ class MongoUserRepository(UserRepository):
             logging.warning(f"User with username {username} not found.")
             return None
 
+    def find_by_role(self, role: UserRole) -> List[User]:
+        try:
+            user_docs = UserDocument.objects(role=role.value)
+            return [self._doc_to_entity(doc) for doc in user_docs]
+        except Exception as e:
+            logging.error(f"Error retrieving users with role {role}: {e}")
+            return []
+
     def find_all(self) -> List[User]:
         try:
             user_docs = UserDocument.objects.all()
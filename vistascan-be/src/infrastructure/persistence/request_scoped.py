@@ -0,0 +1,165 @@
+from datetime import date
+from typing import List, Optional
+from uuid import UUID
+
+from domain.entities.user import User, UserRole
+from domain.entities.consultation import Consultation, ConsultationStatus
+from application.interfaces.repositories import UserRepository, ConsultationRepository
+from infrastructure.persistence.loader import DataLoader, scoped_loader
+
+
+class RequestScopedUserRepository(UserRepository):
+    """
+    Serves find_by_id and find_by_ids through the request's DataLoader, so the user the auth dependency
+    loaded is not fetched again by the service, and load()/load_many() calls in one tick share one $in query.
+    Writes go straight through and drop the request's copy, so the next lookup reads what was stored rather
+    than the object the caller changed. Outside a request it is a plain pass-through.
+    """
+
+    def __init__(self, repository: UserRepository):
+        self._repo = repository
+        self._loader_name = f"users:{id(self)}"
+
+    def _loader(self) -> Optional[DataLoader[UUID, User]]:
+        return scoped_loader(self._loader_name, lambda: DataLoader(self._repo.find_by_ids, lambda user: user.id))
+
+    async def load(self, user_id: UUID) -> Optional[User]:
+        loader = self._loader()
+        return await loader.load(user_id) if loader is not None else self._repo.find_by_id(user_id)
+
+    async def load_many(self, user_ids: List[UUID]) -> List[Optional[User]]:
+        loader = self._loader()
+        if loader is None:
+            return await self._repo.load_many(user_ids)
+        return await loader.load_many(user_ids)
+
+    def save(self, user: User) -> Optional[User]:
+        saved = self._repo.save(user)
+        self._forget(user.id)
+        return saved
+
+    def find_by_id(self, user_id: UUID) -> Optional[User]:
+        loader = self._loader()
+        return loader.get(user_id) if loader is not None else self._repo.find_by_id(user_id)
+
+    def find_by_ids(self, user_ids: List[UUID]) -> List[User]:
+        loader = self._loader()
+        if loader is None:
+            return self._repo.find_by_ids(user_ids)
+        return [user for user in loader.get_many(user_ids) if user is not None]
+
+    def find_by_email(self, email: str) -> Optional[User]:
+        return self._repo.find_by_email(email)
+
+    def find_by_username(self, username: str) -> Optional[User]:
+        return self._repo.find_by_username(username)
+
+    def find_by_role(self, role: UserRole) -> List[User]:
+        return self._repo.find_by_role(role)
+
+    def find_all(self) -> List[User]:
+        return self._repo.find_all()
+
+    def delete_by_id(self, user_id: UUID) -> bool:
+        deleted = self._repo.delete_by_id(user_id)
+        self._forget(user_id)
+        return deleted
+
+    def update(self, user: User) -> Optional[User]:
+        updated = self._repo.update(user)
+        self._forget(user.id)
+        return updated
+
+    def _forget(self, user_id: UUID):
+        loader = self._loader()
+        if loader is not None:
+            loader.clear(user_id)
+
+
+class RequestScopedConsultationRepository(ConsultationRepository):
+    """
+    Consultation counterpart of RequestScopedUserRepository. Consultations returned by list queries are
+    primed into the request's loader as well, so a point lookup after a list does not hit the database.
+    """
+
+    def __init__(self, repository: ConsultationRepository):
+        self._repo = repository
+        self._loader_name = f"consultations:{id(self)}"
+
+    def _loader(self) -> Optional[DataLoader[UUID, Consultation]]:
+        return scoped_loader(self._loader_name,
+                             lambda: DataLoader(self._repo.find_by_ids, lambda consultation: consultation.id))
+
+    async def load(self, consultation_id: UUID) -> Optional[Consultation]:
+        loader = self._loader()
+        return await loader.load(consultation_id) if loader is not None else self._repo.find_by_id(consultation_id)
+
+    async def load_many(self, consultation_ids: List[UUID]) -> List[Optional[Consultation]]:
+        loader = self._loader()
+        if loader is None:
+            return await self._repo.load_many(consultation_ids)
+        return await loader.load_many(consultation_ids)
+
+    def save(self, consultation: Consultation) -> Optional[Consultation]:
+        saved = self._repo.save(consultation)
+        self._forget(consultation.id)
+        return saved
+
+    def delete_by_id(self, consultation_id: UUID) -> bool:
+        deleted = self._repo.delete_by_id(consultation_id)
+        self._forget(consultation_id)
+        return deleted
+
+    def find_by_id(self, consultation_id: UUID) -> Optional[Consultation]:
+        loader = self._loader()
+        return loader.get(consultation_id) if loader is not None else self._repo.find_by_id(consultation_id)
+
+    def find_by_ids(self, consultation_ids: List[UUID]) -> List[Consultation]:
+        loader = self._loader()
+        if loader is None:
+            return self._repo.find_by_ids(consultation_ids)
+        return [consultation for consultation in loader.get_many(consultation_ids) if consultation is not None]
+
+    def find_by_patient_id(self, patient_id: UUID) -> List[Consultation]:
+        return self._primed(self._repo.find_by_patient_id(patient_id))
+
+    def find_by_expert_id(self, expert_id: UUID) -> List[Consultation]:
+        return self._primed(self._repo.find_by_expert_id(expert_id))
+
+    def find_by_status(self, status: ConsultationStatus) -> List[Consultation]:
+        return self._primed(self._repo.find_by_status(status))
+
+    def find_by_study_metadata(self, modality: Optional[str] = None, body_part: Optional[str] = None,
+                               study_date_from: Optional[date] = None,
+                               study_date_to: Optional[date] = None) -> List[Consultation]:
+        return self._primed(self._repo.find_by_study_metadata(modality, body_part, study_date_from, study_date_to))
+
+    def find_all(self) -> List[Consultation]:
+        return self._primed(self._repo.find_all())
+
+    def set_content_hash(self, consultation_id: UUID, content_hash: str) -> bool:
+        updated = self._repo.set_content_hash(consultation_id, content_hash)
+        self._forget(consultation_id)
+        return updated
+
+    def set_draft_report(self, consultation_id: UUID, draft_report: str, model_version: str) -> bool:
+        updated = self._repo.set_draft_report(consultation_id, draft_report, model_version)
+        self._forget(consultation_id)
+        return updated
+
+    def set_preprocessed_study(self, consultation_id: UUID, preprocessed_path: str, preprocessed_variant: str) -> bool:
+        updated = self._repo.set_preprocessed_study(consultation_id, preprocessed_path, preprocessed_variant)
+        self._forget(consultation_id)
+        return updated
+
+    def _forget(self, consultation_id: UUID):
+        loader = self._loader()
+        if loader is not None:
+            loader.clear(consultation_id)
+
+    def _primed(self, consultations: List[Consultation]) -> List[Consultation]:
+        loader = self._loader()
+        if loader is not None:
+            for consultation in consultations:
+                loader.prime(consultation.id, consultation)
+        return consultations
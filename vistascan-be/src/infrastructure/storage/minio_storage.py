@@ -4,7 +4,7 @@ from datetime import timedelta
 import minio
 import logging
 from uuid import UUID, uuid4
-from typing import Optional, Tuple, BinaryIO
+from typing import Iterator, Optional, Tuple, BinaryIO
 
 from minio.error import MinioException
 from application.interfaces.storage import FileStorageService
@@ -80,6 +80,22 @@ class MinioStorageService(FileStorageService):
             logging.error(f"Error retrieving file {path}: {e}")
             return None
 
+    def stream(self, path: str, chunk_size: int) -> Iterator[bytes]:
+        response = None
+        try:
+            response = self.client.get_object(
+                bucket_name=self.bucket,
+                object_name=path,
+            )
+            yield from response.stream(chunk_size)
+        except MinioException as e:
+            logging.error(f"Error streaming file {path}: {e}")
+            raise e
+        finally:
+            if response is not None:
+                response.close()
+                response.release_conn()
+
     def delete(self, file_path: str) -> bool:
         try:
             self.client.remove_object(
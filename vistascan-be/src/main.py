@@ -1,4 +1,5 @@
 import uvicorn
+from contextlib import asynccontextmanager
 from fastapi import FastAPI
 from starlette.middleware.cors import CORSMiddleware
 
@@ -6,16 +7,42 @@ from api.rest.routes.auth import router as auth_router
 from api.rest.routes.admin import router as admin_router
 from api.rest.routes.consultation import router as consultation_router
 from api.rest.routes.websocket import router as websocket_router
-from .logger import LogLevels, configure_logging
+from api.rest.routes.notification import router as notification_router
+from api.rest.middleware import RequestScopeMiddleware
+from api.rest.dependencies import get_websocket_manager, get_model_service_client, get_draft_report_queue, \
+    get_draft_pregeneration_queue, get_image_preprocessor
+from logger import LogLevels, configure_logging
 from config import settings
 
 configure_logging(LogLevels.error)
 
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    websocket_manager = get_websocket_manager()
+    await websocket_manager.start()
+    draft_report_queue = get_draft_report_queue()
+    await draft_report_queue.start()
+    draft_pregeneration_queue = get_draft_pregeneration_queue()
+    await draft_pregeneration_queue.start()
+    await get_model_service_client().start()
+
+    yield
+
+    await draft_pregeneration_queue.stop()
+    await draft_report_queue.stop()
+    await websocket_manager.stop()
+    await get_model_service_client().aclose()
+    get_image_preprocessor().shutdown()
+
+
 app = FastAPI(
     title=settings.app_name,
     version=settings.app_version,
+    lifespan=lifespan,
 )
 
+app.add_middleware(RequestScopeMiddleware)
 app.add_middleware(
     CORSMiddleware,
     allow_origins=[
@@ -32,6 +59,7 @@ app.include_router(auth_router)
 app.include_router(admin_router)
 app.include_router(consultation_router)
 app.include_router(websocket_router)
+app.include_router(notification_router)
 
 @app.get("/healthcheck")
 async def health_check():
@@ -39,10 +67,18 @@ async def health_check():
     return {"status": "ok"}
 
 
-if __name__ == "__main__":
+def run():
+    """Serve the app with the configured WebSocket settings. Both local runs and the Docker image start here."""
     uvicorn.run(
         "main:app",
-        host="0.0.0.0",
-        port=8000,
-        reload=True,
+        host=settings.server_host,
+        port=settings.server_port,
+        reload=settings.server_reload,
+        ws_ping_interval=settings.websocket_ping_interval,
+        ws_ping_timeout=settings.websocket_ping_timeout,
+        ws_per_message_deflate=settings.websocket_per_message_deflate,
     )
+
+
+if __name__ == "__main__":
+    run()
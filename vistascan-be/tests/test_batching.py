@@ -0,0 +1,119 @@
+"""
+Micro-batching model client against a mocked model service.
+
+    cd vistascan-be
+    python -m pytest tests
+"""
+import asyncio
+import io
+import re
+import sys
+from pathlib import Path
+from typing import List, Tuple
+
+import httpx
+
+SRC_DIR = Path(__file__).resolve().parent.parent / "src"
+sys.path.insert(0, str(SRC_DIR))
+
+from infrastructure.model.batching import BatchingModelClient
+from infrastructure.model.model_service import ModelServiceClient
+from infrastructure.model.resilience import CircuitBreaker, ResilientCaller, RetryPolicy
+
+
+class MockModelService:
+    """Answers the single and batch endpoints, reporting each image by its filename and recording every call."""
+
+    def __init__(self, batch_endpoint: bool = True, failing: Tuple[str, ...] = ()):
+        self.calls: List[Tuple[str, List[str]]] = []
+        self._batch_endpoint = batch_endpoint
+        self._failing = failing
+
+    async def __call__(self, request: httpx.Request) -> httpx.Response:
+        filenames = re.findall(r'filename="([^"]+)"', (await request.aread()).decode(errors="replace"))
+        self.calls.append((request.url.path, filenames))
+
+        if request.url.path == "/generate-report":
+            return httpx.Response(200, json=self._result(filenames[0]))
+        if request.url.path == "/generate-report/batch" and self._batch_endpoint:
+            return httpx.Response(200, json={"results": [self._result(filename) for filename in filenames]})
+        return httpx.Response(404, json={"detail": "Not Found"})
+
+    def _result(self, filename: str):
+        if filename in self._failing:
+            return {"report": "", "success": False, "message": f"cannot read {filename}"}
+        return {"report": f"report for {filename}", "success": True, "message": ""}
+
+
+def _client(service: MockModelService, max_batch_size: int = 8, max_wait: float = 0.02) -> BatchingModelClient:
+    model_client = ModelServiceClient(
+        base_url="http://model",
+        caller=ResilientCaller(CircuitBreaker(), RetryPolicy(max_retries=0)),
+        transport=httpx.MockTransport(service),
+    )
+    return BatchingModelClient(model_client, max_batch_size=max_batch_size, max_wait=max_wait)
+
+
+async def _generate(client: BatchingModelClient, *filenames: str):
+    return await asyncio.gather(*(client.generate_report(io.BytesIO(b"image"), filename) for filename in filenames))
+
+
+def test_full_batches_are_sent_at_max_batch_size():
+    service = MockModelService()
+    client = _client(service, max_batch_size=2, max_wait=0.05)
+
+    results = asyncio.run(_generate(client, "a.png", "b.png", "c.png", "d.png", "e.png"))
+
+    assert [result.report for result in results] == [f"report for {name}.png" for name in "abcde"]
+    assert service.calls == [
+        ("/generate-report/batch", ["a.png", "b.png"]),
+        ("/generate-report/batch", ["c.png", "d.png"]),
+        ("/generate-report", ["e.png"]),
+    ]
+
+
+def test_partial_batch_is_flushed_after_max_wait():
+    service = MockModelService()
+    client = _client(service, max_batch_size=8, max_wait=0.05)
+
+    async def scenario():
+        first = asyncio.ensure_future(_generate(client, "a.png", "b.png"))
+        await asyncio.sleep(0.01)
+        sent_early = list(service.calls)
+        late = await _generate(client, "c.png")
+        return sent_early, await first, late
+
+    sent_early, first, late = asyncio.run(scenario())
+
+    assert sent_early == []
+    assert service.calls == [("/generate-report/batch", ["a.png", "b.png", "c.png"])]
+    assert [result.report for result in first + late] == ["report for a.png", "report for b.png", "report for c.png"]
+
+
+def test_per_item_errors_fail_only_their_own_request():
+    service = MockModelService(failing=("b.png",))
+    client = _client(service)
+
+    results = asyncio.run(_generate(client, "a.png", "b.png", "c.png"))
+
+    assert [result.success for result in results] == [True, False, True]
+    assert results[1].message == "cannot read b.png"
+    assert len(service.calls) == 1
+
+
+def test_missing_batch_endpoint_falls_back_to_single_requests():
+    service = MockModelService(batch_endpoint=False)
+    client = _client(service)
+
+    async def scenario():
+        first = await _generate(client, "a.png", "b.png")
+        later = await _generate(client, "c.png", "d.png")
+        return first + later
+
+    results = asyncio.run(scenario())
+
+    assert [result.report for result in results] == [f"report for {name}.png" for name in "abcd"]
+    assert service.calls[0] == ("/generate-report/batch", ["a.png", "b.png"])
+    assert sorted(service.calls[1:3]) == [("/generate-report", ["a.png"]), ("/generate-report", ["b.png"])]
+    # Once the batch endpoint is known to be missing, requests go out one by one without trying it again.
+    assert sorted(service.calls[3:]) == [("/generate-report", ["c.png"]), ("/generate-report", ["d.png"])]
@@ -0,0 +1,126 @@
+"""
+Conditional GETs on consultations: ETags, If-None-Match and 304 responses.
+
+    cd vistascan-be
+    python -m pytest tests
+"""
+import asyncio
+import os
+import sys
+from datetime import date, datetime
+from pathlib import Path
+from typing import List
+from uuid import uuid4
+
+import httpx
+from fastapi import FastAPI
+
+SRC_DIR = Path(__file__).resolve().parent.parent / "src"
+sys.path.insert(0, str(SRC_DIR))
+os.environ.setdefault("JWT_SECRET", "test-secret")
+
+from api.rest.dependencies import get_consultation_service, get_current_user
+from api.rest.routes import consultation as consultation_routes
+from application.services.consultation_service import ConsultationService
+from domain.entities.consultation import Consultation
+from domain.entities.study import ImagingStudy
+from domain.entities.user import Gender, User, UserRole
+from infrastructure.jobs.worker_pool import AsyncWorkerPool
+from infrastructure.persistence.memory.consultation_repository import InMemoryConsultationRepository
+from infrastructure.persistence.memory.draft_report_job_repository import InMemoryDraftReportJobRepository
+from infrastructure.persistence.memory.user_repository import InMemoryUserRepository
+
+
+class FakeStorage:
+    def get_download_url(self, file_path: str) -> str:
+        return f"http://storage/{file_path}"
+
+
+def _patient() -> User:
+    return User(username="patient", email="patient@example.com", password="secret", full_name="Patient",
+                birthdate=date(1990, 1, 1), gender=list(Gender)[0], role=UserRole.PATIENT)
+
+
+def _consultation(patient: User) -> Consultation:
+    return Consultation(patient_id=patient.id, imaging_study=ImagingStudy(
+        file_path="studies/chest.png", file_name="chest.png", content_type="image/png", size=1,
+        upload_date=datetime.now()))
+
+
+def _setup(count: int = 2):
+    users = InMemoryUserRepository()
+    consultations = InMemoryConsultationRepository()
+    patient = _patient()
+    users.save(patient)
+    saved: List[Consultation] = [consultations.save(_consultation(patient)) for _ in range(count)]
+
+    service = ConsultationService(consultations, users, FakeStorage(), None, None,
+                                  InMemoryDraftReportJobRepository(), AsyncWorkerPool(1, 1))
+    app = FastAPI()
+    app.include_router(consultation_routes.router)
+    app.dependency_overrides[get_current_user] = lambda: patient
+    app.dependency_overrides[get_consultation_service] = lambda: service
+    return app, consultations, patient, saved
+
+
+async def _get(app: FastAPI, url: str, **headers) -> httpx.Response:
+    async with httpx.AsyncClient(transport=httpx.ASGITransport(app=app), base_url="http://test") as client:
+        return await client.get(url, headers=headers)
+
+
+def test_matching_if_none_match_returns_304_without_a_body():
+    app, _, _, (consultation, _) = _setup()
+
+    async def scenario():
+        first = await _get(app, f"/consultations/{consultation.id}")
+        etag = first.headers["etag"]
+        exact = await _get(app, f"/consultations/{consultation.id}", **{"If-None-Match": etag})
+        listed = await _get(app, f"/consultations/{consultation.id}", **{"If-None-Match": f'"stale", W/{etag}'})
+        return first, exact, listed
+
+    first, exact, listed = asyncio.run(scenario())
+
+    assert first.status_code == 200
+    assert first.json()["id"] == str(consultation.id)
+    for response in (exact, listed):
+        assert response.status_code == 304
+        assert response.content == b""
+        assert response.headers["etag"] == first.headers["etag"]
+
+
+def test_changed_version_returns_200_with_a_new_etag():
+    app, consultations, _, (consultation, _) = _setup()
+
+    async def scenario():
+        before = await _get(app, f"/consultations/{consultation.id}")
+        consultation.assign_to_expert(uuid4())
+        consultations.save(consultation)
+        after = await _get(app, f"/consultations/{consultation.id}", **{"If-None-Match": before.headers["etag"]})
+        return before, after
+
+    before, after = asyncio.run(scenario())
+
+    assert after.status_code == 200
+    assert after.headers["etag"] != before.headers["etag"]
+    assert after.json()["expert_id"] is not None
+
+
+def test_list_etag_changes_when_one_item_version_changes():
+    app, consultations, patient, (_, second) = _setup()
+    url = f"/consultations?user_id={patient.id}"
+
+    async def scenario():
+        before = await _get(app, url)
+        unchanged = await _get(app, url, **{"If-None-Match": before.headers["etag"]})
+        second.assign_to_expert(uuid4())
+        consultations.save(second)
+        after = await _get(app, url, **{"If-None-Match": before.headers["etag"]})
+        return before, unchanged, after
+
+    before, unchanged, after = asyncio.run(scenario())
+
+    assert before.status_code == 200
+    assert len(before.json()) == 2
+    assert unchanged.status_code == 304
+    assert after.status_code == 200
+    assert after.headers["etag"] != before.headers["etag"]
@@ -0,0 +1,128 @@
+"""
+Model service endpoint pool: balancing, ejection and readmission.
+
+    cd vistascan-be
+    python -m pytest tests
+"""
+import asyncio
+import sys
+from collections import Counter
+from pathlib import Path
+
+import httpx
+
+SRC_DIR = Path(__file__).resolve().parent.parent / "src"
+sys.path.insert(0, str(SRC_DIR))
+
+from infrastructure.model.endpoints import BalancingStrategy, EndpointPool
+from infrastructure.model.model_service import ModelServiceClient
+
+URLS = ["http://model-a", "http://model-b", "http://model-c"]
+
+
+def _endpoint(pool: EndpointPool, url: str):
+    return next(endpoint for endpoint in pool.endpoints if endpoint.url == url)
+
+
+def test_least_outstanding_picks_the_least_loaded_endpoint():
+    pool = EndpointPool(URLS)
+    for url, load in (("http://model-a", 2), ("http://model-b", 0), ("http://model-c", 1)):
+        for _ in range(load):
+            pool.acquire(_endpoint(pool, url))
+
+    assert pool.pick().url == "http://model-b"
+    assert pool.pick(exclude={"http://model-b"}).url == "http://model-c"
+
+
+def test_idle_endpoints_share_the_load():
+    pool = EndpointPool(URLS)
+    picks = Counter(pool.pick().url for _ in range(300))
+    assert set(picks) == set(URLS)
+
+
+def test_release_updates_the_latency_average_but_not_on_failure():
+    pool = EndpointPool(URLS[:1], ewma_alpha=0.5)
+    endpoint = pool.endpoints[0]
+
+    for latency in (1.0, 2.0, None):
+        pool.acquire(endpoint)
+        pool.release(endpoint, latency)
+
+    assert endpoint.ewma_latency == 1.5
+    assert endpoint.outstanding == 0
+    assert endpoint.requests_total == 3
+    assert endpoint.failures_total == 1
+
+
+def test_ewma_weighs_load_by_latency():
+    pool = EndpointPool(URLS[:2], BalancingStrategy.EWMA)
+    fast, slow = pool.endpoints
+    for endpoint, latency in ((fast, 0.1), (slow, 1.0)):
+        pool.acquire(endpoint)
+        pool.release(endpoint, latency)
+
+    assert pool.pick() is fast
+    # Ten requests at 0.1s weigh as much as one at 1.0s, so the fast node takes about ten times the load.
+    for _ in range(8):
+        pool.acquire(fast)
+    assert pool.pick() is fast
+    for _ in range(2):
+        pool.acquire(fast)
+    assert pool.pick() is slow
+
+
+def test_ewma_sends_traffic_to_unmeasured_endpoints():
+    pool = EndpointPool(URLS[:2], BalancingStrategy.EWMA)
+    measured, new = pool.endpoints
+    pool.acquire(measured)
+    pool.release(measured, 0.5)
+    pool.acquire(measured)
+
+    assert pool.pick() is new
+
+
+def test_unhealthy_endpoints_are_ejected_and_readmitted():
+    pool = EndpointPool(URLS[:2])
+    a, b = pool.endpoints
+    pool.acquire(b)
+
+    pool.mark_health(a, False)
+    assert all(pool.pick() is b for _ in range(20))
+    assert a.ejections_total == 1
+
+    pool.mark_health(a, False)
+    assert a.ejections_total == 1
+
+    pool.mark_health(a, True)
+    assert pool.pick() is a
+
+
+def test_all_endpoints_down_still_picks_one():
+    pool = EndpointPool(URLS[:2])
+    for endpoint in pool.endpoints:
+        pool.mark_health(endpoint, False)
+
+    assert not pool.has_healthy()
+    assert pool.pick() in pool.endpoints
+
+
+def test_health_checks_eject_and_readmit_without_touching_load_or_latency():
+    down = {"http://model-b"}
+
+    async def handler(request: httpx.Request) -> httpx.Response:
+        return httpx.Response(503 if f"{request.url.scheme}://{request.url.host}" in down else 200)
+
+    client = ModelServiceClient(base_url=URLS[0], endpoints=URLS[:2], transport=httpx.MockTransport(handler))
+    a, b = client._endpoints.endpoints
+    a.ewma_latency = b.ewma_latency = 2.0
+
+    async def scenario():
+        first = await client.health_check()
+        down.clear()
+        second = await client.health_check()
+        await client.aclose()
+        return first, second
+
+    assert asyncio.run(scenario()) == (True, True)
+    assert b.healthy and b.ejections_total == 1
+    assert [(e.ewma_latency, e.outstanding, e.requests_total, e.failures_total) for e in (a, b)] == [(2.0, 0, 0, 0)] * 2
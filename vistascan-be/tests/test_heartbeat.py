@@ -0,0 +1,95 @@
+"""
+Connection manager heartbeat: which sessions are reaped, and which only receive pings.
+
+    cd vistascan-be
+    python -m pytest tests
+"""
+import asyncio
+import json
+import os
+import sys
+from pathlib import Path
+
+SRC_DIR = Path(__file__).resolve().parent.parent / "src"
+sys.path.insert(0, str(SRC_DIR))
+os.environ.setdefault("JWT_SECRET", "test-secret")
+
+from domain.entities.user import UserRole
+from infrastructure.events.websocket_manager import WebSocketConnectionManager
+
+
+class SilentWebSocket:
+    """A client that never sends a frame; its protocol-level pongs are uvicorn's business, not the app's."""
+
+    def __init__(self):
+        self.sent = []
+        self.closed = None
+
+    async def accept(self):
+        pass
+
+    async def send_text(self, data: str):
+        self.sent.append(json.loads(data))
+
+    async def send_bytes(self, data: bytes):
+        self.sent.append(data)
+
+    async def close(self, code: int = 1000, reason: str = ""):
+        self.closed = code
+
+
+def _manager():
+    return WebSocketConnectionManager(ping_interval=0.01, ping_timeout=0.01)
+
+
+def test_idle_websocket_that_never_answers_pings_is_kept():
+    manager = _manager()
+    websocket = SilentWebSocket()
+
+    async def scenario():
+        await manager.start()
+        await manager.connect(websocket, "user-1", UserRole.PATIENT)
+        await asyncio.sleep(0.1)
+        await manager.stop()
+
+    asyncio.run(scenario())
+    assert websocket.closed is None
+    assert manager.metrics()["live_connections"] == 1
+    assert manager.metrics()["reaped_total"] == 0
+    assert [message["type"] for message in websocket.sent].count("ping") >= 2
+
+
+def test_event_stream_whose_writes_stall_is_reaped():
+    manager = _manager()
+
+    async def scenario():
+        await manager.start()
+        manager.connect_stream("user-1", UserRole.PATIENT)
+        await asyncio.sleep(0.1)
+        await manager.stop()
+
+    asyncio.run(scenario())
+    assert manager.metrics()["live_connections"] == 0
+    assert manager.metrics()["reaped_total"] == 1
+
+
+def test_event_stream_that_keeps_writing_is_kept():
+    manager = _manager()
+
+    async def scenario():
+        await manager.start()
+        session = manager.connect_stream("user-1", UserRole.PATIENT)
+
+        async def reader():
+            async for _ in session.stream():
+                manager.touch(session.id)
+
+        reading = asyncio.create_task(reader())
+        await asyncio.sleep(0.1)
+        await manager.stop()
+        reading.cancel()
+        await asyncio.gather(reading, return_exceptions=True)
+
+    asyncio.run(scenario())
+    assert manager.metrics()["live_connections"] == 1
+    assert manager.metrics()["reaped_total"] == 0
@@ -0,0 +1,123 @@
+"""
+Notification inbox writer: batching, flushing and role fan-out.
+
+    cd vistascan-be
+    python -m pytest tests
+"""
+import asyncio
+import sys
+from datetime import date
+from pathlib import Path
+from typing import List
+from uuid import uuid4
+
+SRC_DIR = Path(__file__).resolve().parent.parent / "src"
+sys.path.insert(0, str(SRC_DIR))
+
+from domain.entities.event import InboxNotification
+from domain.entities.user import Gender, User, UserRole
+from infrastructure.events.inbox import NotificationInboxWriter
+from infrastructure.persistence.memory.notification_repository import InMemoryNotificationRepository
+from infrastructure.persistence.memory.user_repository import InMemoryUserRepository
+
+
+class RecordingNotificationRepository(InMemoryNotificationRepository):
+    def __init__(self, failures: int = 0):
+        super().__init__()
+        self.batches: List[int] = []
+        self._failures = failures
+
+    def save_many(self, notifications: List[InboxNotification]) -> int:
+        if self._failures:
+            self._failures -= 1
+            raise ConnectionError("database unavailable")
+        self.batches.append(len(notifications))
+        return super().save_many(notifications)
+
+
+class CountingUserRepository(InMemoryUserRepository):
+    def __init__(self):
+        super().__init__()
+        self.role_lookups: List[UserRole] = []
+
+    def find_by_role(self, role: UserRole) -> List[User]:
+        self.role_lookups.append(role)
+        return super().find_by_role(role)
+
+
+def _user(role: UserRole) -> User:
+    name = uuid4().hex[:8]
+    return User(username=name, email=f"{name}@example.com", password="hash", full_name=name,
+                birthdate=date(1990, 1, 1), gender=Gender.FEMALE, role=role)
+
+
+def _event(seq: int):
+    return {"seq": seq, "type": "consultation_created"}
+
+
+def test_enqueue_buffers_until_flush_and_flush_writes_batches():
+    repository = RecordingNotificationRepository()
+    inbox = NotificationInboxWriter(repository, batch_size=2)
+    user_id = uuid4()
+
+    async def scenario():
+        for seq in range(1, 6):
+            inbox.enqueue([str(user_id)], _event(seq))
+        assert repository.batches == []
+        assert inbox._batch_ready.is_set()
+
+        while await inbox.flush() and inbox._buffer:
+            pass
+
+    asyncio.run(scenario())
+    assert repository.batches == [2, 2, 1]
+    assert [n.seq for n in repository.find_by_user_id(user_id, None, 10)] == [5, 4, 3, 2, 1]
+
+
+def test_failed_flush_keeps_the_batch_for_the_next_one():
+    repository = RecordingNotificationRepository(failures=1)
+    inbox = NotificationInboxWriter(repository, batch_size=10)
+    user_id = uuid4()
+
+    async def scenario():
+        inbox.enqueue([str(user_id)], _event(1))
+        assert await inbox.flush() is False
+        assert await inbox.flush() is True
+
+    asyncio.run(scenario())
+    assert [n.seq for n in repository.find_by_user_id(user_id, None, 10)] == [1]
+
+
+def test_role_events_fan_out_at_flush_with_one_lookup_per_role():
+    repository = RecordingNotificationRepository()
+    users = CountingUserRepository()
+    experts = [users.save(_user(UserRole.EXPERT)) for _ in range(3)]
+    patient = users.save(_user(UserRole.PATIENT))
+    inbox = NotificationInboxWriter(repository, user_repository=users)
+
+    async def scenario():
+        inbox.enqueue([str(patient.id)], _event(1), roles=[UserRole.EXPERT])
+        inbox.enqueue([], _event(2), roles=[UserRole.EXPERT])
+        assert users.role_lookups == []
+        await inbox.flush()
+
+    asyncio.run(scenario())
+    assert users.role_lookups == [UserRole.EXPERT]
+    assert repository.batches == [7]
+    assert [n.seq for n in repository.find_by_user_id(patient.id, None, 10)] == [1]
+    for expert in experts:
+        assert [n.seq for n in repository.find_by_user_id(expert.id, None, 10)] == [2, 1]
+
+
+def test_stop_flushes_what_is_left():
+    repository = RecordingNotificationRepository()
+    inbox = NotificationInboxWriter(repository, flush_interval=60, batch_size=100)
+    user_id = uuid4()
+
+    async def scenario():
+        await inbox.start()
+        inbox.enqueue([str(user_id)], _event(1))
+        await inbox.stop()
+
+    asyncio.run(scenario())
+    assert [n.seq for n in repository.find_by_user_id(user_id, None, 10)] == [1]
@@ -0,0 +1,61 @@
+"""
+Replay buffer: what a reconnecting client is sent, and when it has to resync instead.
+
+    cd vistascan-be
+    python -m pytest tests
+"""
+import sys
+from pathlib import Path
+
+SRC_DIR = Path(__file__).resolve().parent.parent / "src"
+sys.path.insert(0, str(SRC_DIR))
+
+from infrastructure.events.replay import ReplayBuffer
+
+
+def _record(buffer: ReplayBuffer, seqs, channel: str = "user:a"):
+    for seq in seqs:
+        buffer.record(seq, [channel], {"seq": seq})
+
+
+def _seqs(events):
+    return [event["seq"] for event in events]
+
+
+def test_replay_returns_events_after_last_seq_in_order():
+    buffer = ReplayBuffer(capacity=10, max_user_channels=10)
+    _record(buffer, [1, 2, 3])
+    _record(buffer, [4, 5], channel="role:EXPERT")
+
+    assert _seqs(buffer.replay(["user:a", "role:EXPERT"], 2)) == [3, 4, 5]
+    assert _seqs(buffer.replay(["user:a"], 2)) == [3]
+    assert buffer.replay(["user:a"], 5) == []
+
+
+def test_replay_below_a_channel_floor_asks_for_a_resync():
+    buffer = ReplayBuffer(capacity=3, max_user_channels=10)
+    _record(buffer, [1, 2, 3, 4, 5])
+
+    assert buffer.replay(["user:a"], 1) is None
+    assert _seqs(buffer.replay(["user:a"], 2)) == [3, 4, 5]
+
+
+def test_replay_outside_the_recorded_range_asks_for_a_resync():
+    buffer = ReplayBuffer(capacity=10, max_user_channels=10)
+    assert buffer.replay(["user:a"], 0) is None
+
+    _record(buffer, [5, 6])
+    assert buffer.replay(["user:a"], 3) is None
+    assert buffer.replay(["user:a"], 7) is None
+    assert _seqs(buffer.replay(["user:a"], 4)) == [5, 6]
+
+
+def test_out_of_order_events_are_kept_sorted_by_seq():
+    buffer = ReplayBuffer(capacity=3, max_user_channels=10)
+    _record(buffer, [1, 3, 2])
+    assert _seqs(buffer.replay(["user:a"], 0)) == [1, 2, 3]
+
+    # Eviction drops the lowest seq rather than the earliest arrival, so the floor stays exact.
+    _record(buffer, [5, 4])
+    assert buffer.replay(["user:a"], 1) is None
+    assert _seqs(buffer.replay(["user:a"], 2)) == [3, 4, 5]
@@ -0,0 +1,171 @@
+"""
+Request-scoped repository batching.
+
+    cd vistascan-be
+    python -m pytest tests
+"""
+import asyncio
+import copy
+import sys
+from datetime import date, datetime
+from pathlib import Path
+from typing import List, Optional
+from uuid import UUID, uuid4
+
+SRC_DIR = Path(__file__).resolve().parent.parent / "src"
+sys.path.insert(0, str(SRC_DIR))
+
+from domain.entities.consultation import Consultation, ConsultationStatus
+from domain.entities.study import ImagingStudy
+from domain.entities.user import Gender, User, UserRole
+from infrastructure.persistence.loader import request_scope
+from infrastructure.persistence.memory.consultation_repository import InMemoryConsultationRepository
+from infrastructure.persistence.memory.user_repository import InMemoryUserRepository
+from infrastructure.persistence.request_scoped import RequestScopedConsultationRepository, \
+    RequestScopedUserRepository
+
+
+class CountingUserRepository(InMemoryUserRepository):
+    def __init__(self):
+        super().__init__()
+        self.find_by_ids_calls: List[List[UUID]] = []
+
+    def find_by_ids(self, user_ids: List[UUID]) -> List[User]:
+        self.find_by_ids_calls.append(list(user_ids))
+        return super().find_by_ids(user_ids)
+
+
+class StoredConsultationRepository(InMemoryConsultationRepository):
+    """Hands out copies, as a database does, so a caller's changes only exist once they are saved."""
+
+    def __init__(self, fail_saves: bool = False):
+        super().__init__()
+        self.fail_saves = fail_saves
+        self.find_by_ids_calls = 0
+
+    def save(self, consultation: Consultation) -> Optional[Consultation]:
+        if self.fail_saves:
+            return None
+        return copy.deepcopy(super().save(copy.deepcopy(consultation)))
+
+    def find_by_ids(self, consultation_ids: List[UUID]) -> List[Consultation]:
+        self.find_by_ids_calls += 1
+        return copy.deepcopy(super().find_by_ids(consultation_ids))
+
+
+def _user(username: str, role: UserRole) -> User:
+    return User(username=username, email=f"{username}@example.com", password="hash", full_name=username.title(),
+                birthdate=date(1990, 1, 1), gender=Gender.FEMALE, role=role)
+
+
+def _repositories():
+    backing = CountingUserRepository()
+    patient = backing.save(_user("patient", UserRole.PATIENT))
+    expert = backing.save(_user("expert", UserRole.EXPERT))
+    return backing, RequestScopedUserRepository(backing), patient, expert
+
+
+def test_lookups_in_one_tick_share_one_query():
+    backing, users, patient, expert = _repositories()
+
+    async def lookups():
+        with request_scope():
+            return await asyncio.gather(users.load(patient.id), users.load(expert.id))
+
+    assert asyncio.run(lookups()) == [patient, expert]
+    assert backing.find_by_ids_calls == [[patient.id, expert.id]]
+
+
+def test_later_lookups_are_served_from_the_request():
+    backing, users, patient, expert = _repositories()
+
+    async def lookups():
+        with request_scope():
+            await users.load(expert.id)
+            return await users.load_many([patient.id, expert.id])
+
+    assert asyncio.run(lookups()) == [patient, expert]
+    assert backing.find_by_ids_calls == [[expert.id], [patient.id]]
+
+
+def test_lookups_outside_a_request_go_straight_to_the_repository():
+    backing, users, patient, expert = _repositories()
+
+    assert asyncio.run(users.load_many([patient.id, expert.id])) == [patient, expert]
+    assert backing.find_by_ids_calls == [[patient.id, expert.id]]
+
+
+def _stored_consultation(backing: StoredConsultationRepository) -> Consultation:
+    study = ImagingStudy(file_path="studies/a.dcm", file_name="a.dcm", content_type="application/dicom", size=1,
+                         upload_date=datetime.now())
+    return backing.save(Consultation(patient_id=uuid4(), imaging_study=study, created_at=datetime.now()))
+
+
+def test_saving_drops_the_request_copy_so_later_lookups_read_what_was_stored():
+    backing = StoredConsultationRepository()
+    consultations = RequestScopedConsultationRepository(backing)
+    consultation = _stored_consultation(backing)
+    expert_id = uuid4()
+
+    async def scenario():
+        with request_scope():
+            loaded = await consultations.load(consultation.id)
+            loaded.assign_to_expert(expert_id)
+            consultations.save(loaded)
+            return loaded, consultations.find_by_id(consultation.id)
+
+    loaded, reread = asyncio.run(scenario())
+    assert reread is not loaded
+    assert reread.expert_id == expert_id and reread.version == loaded.version + 1
+    assert backing.find_by_ids_calls == 2
+
+
+def test_failed_save_does_not_leave_the_changed_copy_behind():
+    backing = StoredConsultationRepository()
+    consultations = RequestScopedConsultationRepository(backing)
+    consultation = _stored_consultation(backing)
+
+    async def scenario():
+        with request_scope():
+            loaded = await consultations.load(consultation.id)
+            loaded.assign_to_expert(uuid4())
+            backing.fail_saves = True
+            assert consultations.save(loaded) is None
+            return consultations.find_by_id(consultation.id)
+
+    reread = asyncio.run(scenario())
+    assert reread.expert_id is None
+    assert reread.status == ConsultationStatus.PENDING
+
+
+def test_deleted_entities_are_not_served_from_the_request():
+    backing, users, patient, _ = _repositories()
+    consultation_backing = StoredConsultationRepository()
+    consultations = RequestScopedConsultationRepository(consultation_backing)
+    consultation = _stored_consultation(consultation_backing)
+
+    async def scenario():
+        with request_scope():
+            await asyncio.gather(users.load(patient.id), consultations.load(consultation.id))
+            users.delete_by_id(patient.id)
+            consultations.delete_by_id(consultation.id)
+            return await users.load(patient.id), await consultations.load(consultation.id)
+
+    assert asyncio.run(scenario()) == (None, None)
+
+
+def test_user_updates_are_read_back_from_the_repository():
+    backing, users, patient, _ = _repositories()
+
+    async def scenario():
+        with request_scope():
+            loaded = await users.load(patient.id)
+            renamed = copy.deepcopy(loaded)
+            renamed.full_name = "Renamed"
+            users.update(renamed)
+            return loaded, await users.load(patient.id)
+
+    loaded, reread = asyncio.run(scenario())
+    assert loaded.full_name == "Patient"
+    assert reread.full_name == "Renamed"
+    assert len(backing.find_by_ids_calls) == 2
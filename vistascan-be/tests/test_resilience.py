@@ -0,0 +1,237 @@
+"""
+Circuit breaker, retries, deadline and hedging of model service calls.
+
+    cd vistascan-be
+    python -m pytest tests
+"""
+import asyncio
+import gc
+import random
+import sys
+import time
+from pathlib import Path
+
+import httpx
+import pytest
+
+SRC_DIR = Path(__file__).resolve().parent.parent / "src"
+sys.path.insert(0, str(SRC_DIR))
+
+from infrastructure.model.resilience import CircuitBreaker, CircuitState, LatencyTracker, ResilientCaller, RetryPolicy
+
+REQUEST = httpx.Request("POST", "http://model/generate-report")
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 1000.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+class FixedBackoff(RetryPolicy):
+    def __init__(self, max_retries: int = 2, delay: float = 0):
+        super().__init__(max_retries=max_retries)
+        self._delay = delay
+
+    def backoff(self, retry: int) -> float:
+        return self._delay
+
+
+class ScriptedAttempts:
+    """Plays back one outcome per attempt: a status code, or an exception to raise."""
+
+    def __init__(self, *outcomes):
+        self._outcomes = list(outcomes)
+        self.calls = 0
+
+    async def __call__(self) -> httpx.Response:
+        outcome = self._outcomes[min(self.calls, len(self._outcomes) - 1)]
+        self.calls += 1
+        if isinstance(outcome, Exception):
+            raise outcome
+        return httpx.Response(outcome, request=REQUEST)
+
+
+def _breaker(clock: FakeClock, **kwargs) -> CircuitBreaker:
+    options = {"failure_rate": 0.5, "window": 4, "min_calls": 4, "open_seconds": 30} | kwargs
+    return CircuitBreaker(clock=clock, **options)
+
+
+def test_breaker_needs_min_calls_before_opening():
+    breaker = _breaker(FakeClock())
+    for _ in range(3):
+        breaker.record_failure()
+    assert breaker.state == CircuitState.CLOSED
+
+    breaker.record_failure()
+    assert breaker.state == CircuitState.OPEN
+
+
+def test_breaker_opens_at_the_failure_rate_of_the_sliding_window():
+    breaker = _breaker(FakeClock())
+    for outcome in (True, True, True, False):
+        breaker.record_response(200 if outcome else 500)
+    assert breaker.state == CircuitState.CLOSED
+
+    # The oldest success slides out: the window is now two successes and two failures, a rate of 0.5.
+    breaker.record_response(503)
+    assert breaker.state == CircuitState.OPEN
+
+
+def test_old_failures_slide_out_of_the_window():
+    breaker = _breaker(FakeClock(), failure_rate=0.75)
+    for status in (500, 500, 200, 200, 200, 500):
+        breaker.record_response(status)
+    assert breaker.state == CircuitState.CLOSED
+
+
+def test_client_errors_do_not_count_against_the_breaker():
+    breaker = _breaker(FakeClock())
+    for _ in range(10):
+        breaker.record_response(404)
+    assert breaker.state == CircuitState.CLOSED
+
+
+def test_open_breaker_lets_one_trial_through_after_open_seconds():
+    clock = FakeClock()
+    breaker = _breaker(clock)
+    for _ in range(4):
+        breaker.record_failure()
+
+    clock.now += 29
+    assert not breaker.allow_request()
+    assert breaker.short_circuited_total == 1
+
+    clock.now += 1
+    assert breaker.state == CircuitState.HALF_OPEN
+    assert breaker.allow_request()
+    assert not breaker.allow_request()
+
+    breaker.record_success()
+    assert breaker.state == CircuitState.CLOSED
+    assert breaker.allow_request()
+
+
+def test_failed_trial_reopens_for_another_full_period():
+    clock = FakeClock()
+    breaker = _breaker(clock)
+    for _ in range(4):
+        breaker.record_failure()
+
+    clock.now += 30
+    assert breaker.allow_request()
+    breaker.record_failure()
+    assert breaker.state == CircuitState.OPEN
+    assert breaker.opened_total == 2
+
+    clock.now += 29
+    assert breaker.state == CircuitState.OPEN
+    clock.now += 1
+    assert breaker.state == CircuitState.HALF_OPEN
+
+
+def test_abandoned_trial_lets_another_one_through():
+    clock = FakeClock()
+    breaker = _breaker(clock)
+    for _ in range(4):
+        breaker.record_failure()
+    clock.now += 30
+
+    assert breaker.allow_request()
+    breaker.abandon_trial()
+    assert breaker.allow_request()
+
+
+def test_backoff_is_full_jitter_capped_at_max_delay():
+    random.seed(7)
+    policy = RetryPolicy(base_delay=0.2, max_delay=1.0)
+
+    for retry, cap in enumerate((0.2, 0.4, 0.8, 1.0, 1.0)):
+        delays = [policy.backoff(retry) for _ in range(200)]
+        assert all(0 <= delay <= cap for delay in delays)
+        assert max(delays) - min(delays) > cap / 2
+
+
+def test_connect_errors_are_retried():
+    attempts = ScriptedAttempts(httpx.ConnectError("refused"), httpx.ConnectTimeout("slow connect"), 200)
+    caller = ResilientCaller(_breaker(FakeClock()), FixedBackoff())
+
+    response = asyncio.run(caller.call(attempts))
+
+    assert response.status_code == 200
+    assert attempts.calls == 3
+    assert caller.stats()["retries_total"] == 2
+
+
+def test_errors_after_sending_are_not_retried_unless_idempotent():
+    caller = ResilientCaller(_breaker(FakeClock()), FixedBackoff())
+
+    attempts = ScriptedAttempts(httpx.ReadTimeout("slow model"), 200)
+    with pytest.raises(httpx.ReadTimeout):
+        asyncio.run(caller.call(attempts))
+    assert attempts.calls == 1
+
+    attempts = ScriptedAttempts(httpx.ReadTimeout("slow model"), 200)
+    assert asyncio.run(caller.call(attempts, idempotent=True)).status_code == 200
+    assert attempts.calls == 2
+
+
+def test_gateway_statuses_are_retried_only_when_idempotent():
+    caller = ResilientCaller(_breaker(FakeClock(), min_calls=100), FixedBackoff(max_retries=2))
+
+    attempts = ScriptedAttempts(503, 200)
+    assert asyncio.run(caller.call(attempts)).status_code == 503
+    assert attempts.calls == 1
+
+    attempts = ScriptedAttempts(503, 502, 200)
+    assert asyncio.run(caller.call(attempts, idempotent=True)).status_code == 200
+    assert attempts.calls == 3
+
+    attempts = ScriptedAttempts(503)
+    assert asyncio.run(caller.call(attempts, idempotent=True)).status_code == 503
+    assert attempts.calls == 3
+
+
+def test_deadline_covers_retries_and_backoff():
+    breaker = _breaker(FakeClock(), min_calls=100)
+    caller = ResilientCaller(breaker, FixedBackoff(max_retries=5, delay=10), deadline=0.05)
+    attempts = ScriptedAttempts(httpx.ConnectError("refused"))
+
+    started = time.monotonic()
+    with pytest.raises(httpx.TimeoutException):
+        asyncio.run(caller.call(attempts))
+
+    assert time.monotonic() - started < 1
+    assert attempts.calls == 1
+
+
+def test_losing_hedge_is_awaited():
+    latency = LatencyTracker(min_samples=1)
+    latency.record(0.01)
+    caller = ResilientCaller(_breaker(FakeClock()), FixedBackoff(), hedging=True, latency=latency)
+    started = []
+
+    async def attempt() -> httpx.Response:
+        started.append(len(started))
+        if len(started) == 1:
+            try:
+                await asyncio.sleep(10)
+            except asyncio.CancelledError:
+                raise RuntimeError("connection torn down mid-request")
+        return httpx.Response(200, request=REQUEST)
+
+    unretrieved = []
+
+    async def scenario():
+        asyncio.get_running_loop().set_exception_handler(lambda loop, context: unretrieved.append(context))
+        response = await caller.call(attempt)
+        gc.collect()
+        return response
+
+    assert asyncio.run(scenario()).status_code == 200
+    gc.collect()
+    assert started == [0, 1]
+    assert caller.stats()["hedge_wins_total"] == 1
+    assert unretrieved == []
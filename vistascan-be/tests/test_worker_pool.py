@@ -0,0 +1,179 @@
+"""
+Worker pool slots and cancellation, and how draft jobs fare when they are cancelled.
+
+    cd vistascan-be
+    python -m pytest tests
+"""
+import asyncio
+import os
+import sys
+from datetime import datetime
+from pathlib import Path
+from uuid import uuid4
+
+SRC_DIR = Path(__file__).resolve().parent.parent / "src"
+sys.path.insert(0, str(SRC_DIR))
+os.environ.setdefault("JWT_SECRET", "test-secret")
+
+from domain.entities.consultation import Consultation
+from domain.entities.job import DraftReportJob, DraftReportJobStatus
+from domain.entities.study import ImagingStudy
+from application.services.consultation_service import ConsultationService
+from infrastructure.jobs.worker_pool import AsyncWorkerPool
+from infrastructure.persistence.memory.consultation_repository import InMemoryConsultationRepository
+from infrastructure.persistence.memory.draft_report_job_repository import InMemoryDraftReportJobRepository
+from infrastructure.persistence.memory.user_repository import InMemoryUserRepository
+
+
+async def _hang():
+    await asyncio.Event().wait()
+
+
+async def _until(condition, timeout: float = 1.0):
+    async with asyncio.timeout(timeout):
+        while not condition():
+            await asyncio.sleep(0)
+
+
+def test_inline_slots_and_queued_jobs_share_the_concurrency_limit():
+    async def scenario():
+        pool = AsyncWorkerPool(concurrency=1, max_queue_size=10)
+        await pool.start()
+        ran = asyncio.Event()
+
+        async def job():
+            ran.set()
+
+        async with pool.slot():
+            assert pool.is_busy()
+            pool.submit(job)
+            await asyncio.sleep(0.01)
+            assert not ran.is_set()
+
+        await asyncio.wait_for(ran.wait(), timeout=1)
+        await pool.stop()
+        return pool.stats()
+
+    stats = asyncio.run(scenario())
+    assert stats["completed_total"] == 1
+    assert stats["inline_running"] == 0
+
+
+def test_cancelled_inline_work_gives_its_slot_back():
+    async def scenario():
+        pool = AsyncWorkerPool(concurrency=1, max_queue_size=10)
+        await pool.start()
+
+        async def inline():
+            async with pool.slot():
+                await _hang()
+
+        holder = asyncio.create_task(inline())
+        await _until(lambda: pool.stats()["inline_running"] == 1)
+        holder.cancel()
+        await asyncio.gather(holder, return_exceptions=True)
+
+        assert not pool.is_busy()
+        async with asyncio.timeout(1):
+            async with pool.slot():
+                pass
+        await pool.stop()
+
+    asyncio.run(scenario())
+
+
+def test_cancel_running_frees_the_worker_and_its_slot():
+    async def scenario():
+        pool = AsyncWorkerPool(concurrency=1, max_queue_size=10)
+        await pool.start()
+        pool.submit(_hang)
+        await _until(lambda: pool.stats()["running"] == 1)
+
+        assert pool.cancel_running() == 1
+        await _until(lambda: pool.stats()["running"] == 0)
+
+        ran = asyncio.Event()
+
+        async def job():
+            ran.set()
+
+        pool.submit(job)
+        await asyncio.wait_for(ran.wait(), timeout=1)
+        await pool.stop()
+        return pool.stats()
+
+    stats = asyncio.run(scenario())
+    assert stats["cancelled_total"] == 1
+    assert stats["completed_total"] == 1
+    assert stats["running"] == 0
+
+
+def _service(job_queue: AsyncWorkerPool, pregeneration_queue: AsyncWorkerPool = None):
+    consultations = InMemoryConsultationRepository()
+    jobs = InMemoryDraftReportJobRepository()
+    service = ConsultationService(
+        consultation_repository=consultations,
+        user_repository=InMemoryUserRepository(),
+        file_storage_service=None,
+        websocket_manager=None,
+        model_client=None,
+        draft_report_job_repository=jobs,
+        draft_report_queue=job_queue,
+        draft_pregeneration_queue=pregeneration_queue,
+    )
+    return service, consultations, jobs
+
+
+def _assigned_consultation(consultations: InMemoryConsultationRepository, expert_id) -> Consultation:
+    study = ImagingStudy(file_path="studies/a.dcm", file_name="a.dcm", content_type="application/dicom", size=1,
+                         upload_date=datetime.now())
+    consultation = Consultation(patient_id=uuid4(), imaging_study=study, created_at=datetime.now())
+    consultation.assign_to_expert(expert_id)
+    return consultations.save(consultation)
+
+
+def test_draft_job_cancelled_mid_generation_is_failed_not_left_running():
+    async def scenario():
+        pool = AsyncWorkerPool(concurrency=1, max_queue_size=10)
+        service, _, jobs = _service(pool)
+
+        async def generate(consultation_id, user_id):
+            await _hang()
+
+        service.generate_draft_report = generate
+        job = jobs.save(DraftReportJob(consultation_id=uuid4(), requested_by=uuid4()))
+
+        await pool.start()
+        pool.submit(lambda: service._run_draft_report_job(job.id))
+        await _until(lambda: jobs.find_by_id(job.id).status == DraftReportJobStatus.RUNNING)
+        await pool.stop()
+        return jobs.find_by_id(job.id), pool.stats()
+
+    job, stats = asyncio.run(scenario())
+    assert job.status == DraftReportJobStatus.FAILED
+    assert job.finished_at is not None
+    assert stats["running"] == 0
+
+
+def test_queuing_an_expert_draft_cancels_running_pregeneration():
+    async def scenario():
+        job_queue = AsyncWorkerPool(concurrency=1, max_queue_size=10)
+        pregeneration_queue = AsyncWorkerPool(concurrency=1, max_queue_size=10)
+        service, consultations, jobs = _service(job_queue, pregeneration_queue)
+        expert_id = uuid4()
+        consultation = _assigned_consultation(consultations, expert_id)
+
+        await pregeneration_queue.start()
+        pregeneration_queue.submit(_hang)
+        await _until(lambda: pregeneration_queue.stats()["running"] == 1)
+
+        queued = await service.submit_draft_report(consultation.id, expert_id)
+        await _until(lambda: pregeneration_queue.stats()["running"] == 0)
+        await pregeneration_queue.stop()
+        return queued, pregeneration_queue.stats(), job_queue.stats()
+
+    queued, pregeneration_stats, job_stats = asyncio.run(scenario())
+    assert queued.status == DraftReportJobStatus.QUEUED
+    assert job_stats["queued"] == 1
+    assert pregeneration_stats["cancelled_total"] == 1
+    assert not pregeneration_stats["running"]
@@ -1,5 +1,11 @@
 import {apiSlice} from "./apiSlice.ts";
-import {AssignConsultationRequestDto, ConsultationDto, SubmitReportRequestDto} from "../types/dtos/ConsultationDto.ts";
+import {
+    AssignConsultationRequestDto,
+    ConsultationDto,
+    DraftReportJobArgs,
+    DraftReportJobDto,
+    SubmitReportRequestDto
+} from "../types/dtos/ConsultationDto.ts";
 
 export const consultationApi = apiSlice.injectEndpoints({
     endpoints: (builder) => ({
@@ -63,15 +69,14 @@ export const consultationApi = apiSlice.injectEndpoints({
                 'allConsultationsCache'
             ],
         }),
-        generateDraftReport: builder.mutation<{success: boolean, content: string, message: string}, string>({
+        generateDraftReport: builder.mutation<DraftReportJobDto, string>({
             query: (consultationId) => ({
                 url: `/consultations/${consultationId}/generate-report`,
                 method: 'POST',
             }),
-            invalidatesTags: (_result, _error, consultationId) => [
-                { type: 'consultationsCache', id: consultationId },
-                'consultationsCache'
-            ],
+        }),
+        getDraftReportJob: builder.query<DraftReportJobDto, DraftReportJobArgs>({
+            query: ({ consultation_id, job_id }) => `/consultations/${consultation_id}/generate-report/${job_id}`,
         }),
         getImageDownloadUrl: builder.query<{ download_url: string }, string>({
             query: (consultationId) => `consultations/${consultationId}/download`,
@@ -87,5 +92,6 @@ export const {
     useAssignConsultationMutation,
     useSubmitReportMutation,
     useGenerateDraftReportMutation,
+    useGetDraftReportJobQuery,
     useGetImageDownloadUrlQuery
 } = consultationApi;
\ No newline at end of file
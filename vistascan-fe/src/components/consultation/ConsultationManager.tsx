@@ -1,4 +1,5 @@
-import React, {useState} from 'react';
+import React, {useEffect, useRef, useState} from 'react';
+import {skipToken} from '@reduxjs/toolkit/query/react';
 import {
     Modal,
     Form,
@@ -15,13 +16,15 @@ import {
     SyncOutlined,
     DownloadOutlined,
 } from '@ant-design/icons';
-import {ConsultationDto} from '../../types/dtos/ConsultationDto';
+import {ConsultationDto, DraftReportJobArgs, DraftReportJobStatus} from '../../types/dtos/ConsultationDto';
 import {
     useAssignConsultationMutation,
     useSubmitReportMutation,
     useGenerateDraftReportMutation,
+    useGetDraftReportJobQuery,
 } from '../../api/consultationApi';
 import {useConsultationDetail} from '../../hooks/useConsultationDetail';
+import {DraftReportStreamUnavailable, streamDraftReport} from '../../services/draftReportStream';
 import {LocalStorageKeys} from '../../types/enums/LocalStorageKeys';
 import ConsultationList from './ConsultationList';
 import {UserRole} from "../../types/dtos/UserDto.ts";
@@ -30,6 +33,10 @@ import '../../styles/consultation-manager.css';
 const {Title, Text} = Typography;
 const {TextArea} = Input;
 
+// Fallback for when the draft_report_ready push is missed, e.g. while the WebSocket reconnects.
+const DRAFT_JOB_POLL_INTERVAL = 5000;
+const DRAFT_REPORT_PREFIX = 'AI-Generated Report:\n\n';
+
 interface ConsultationManagerProps {
     consultations: ConsultationDto[];
     isLoading?: boolean;
@@ -55,8 +62,38 @@ const ConsultationManager: React.FC<ConsultationManagerProps> = (props: Consulta
     const [selectedConsultationId, setSelectedConsultationId] = useState<string | undefined>(undefined);
     const [reportModalVisible, setReportModalVisible] = useState<boolean>(false);
     const [isGeneratingReport, setIsGeneratingReport] = useState<boolean>(false);
+    const [draftJob, setDraftJob] = useState<DraftReportJobArgs | undefined>(undefined);
+    const draftStream = useRef<AbortController | null>(null);
     const [form] = Form.useForm();
 
+    useEffect(() => () => draftStream.current?.abort(), []);
+
+    const {data: draftJobResult} = useGetDraftReportJobQuery(draftJob ?? skipToken, {
+        pollingInterval: draftJob ? DRAFT_JOB_POLL_INTERVAL : 0,
+    });
+
+    useEffect(() => {
+        if (!draftJob || !draftJobResult || draftJobResult.id !== draftJob.job_id) {
+            return;
+        }
+
+        if (draftJobResult.status === DraftReportJobStatus.SUCCEEDED && draftJobResult.report) {
+            if (draftJob.consultation_id === selectedConsultationId) {
+                form.setFieldsValue({
+                    report: draftJobResult.report
+                });
+            }
+            message.success('Draft report generated successfully! You can review and edit it before submitting.');
+        } else if (draftJobResult.status === DraftReportJobStatus.FAILED) {
+            message.error('Failed to generate draft report. Please try again.');
+        } else {
+            return;
+        }
+
+        setDraftJob(undefined);
+        setIsGeneratingReport(false);
+    }, [draftJob, draftJobResult, selectedConsultationId, form]);
+
     const {
         consultation: selectedConsultation,
         downloadUrl,
@@ -117,21 +154,37 @@ const ConsultationManager: React.FC<ConsultationManagerProps> = (props: Consulta
 
         setIsGeneratingReport(true);
 
+        const controller = new AbortController();
+        draftStream.current = controller;
         try {
-            const result = await generateDraftReport(selectedConsultationId).unwrap();
-
-            if (result.success && result.content) {
-                form.setFieldsValue({
-                    report: result.content
-                });
-
-                message.success('Draft report generated successfully! You can review and edit it before submitting.');
-            } else {
+            let draft = '';
+            const report = await streamDraftReport(selectedConsultationId, (text) => {
+                draft += text;
+                form.setFieldsValue({report: DRAFT_REPORT_PREFIX + draft});
+            }, controller.signal);
+            form.setFieldsValue({report});
+            message.success('Draft report generated successfully! You can review and edit it before submitting.');
+            setIsGeneratingReport(false);
+            return;
+        } catch (error) {
+            if (controller.signal.aborted) {
+                setIsGeneratingReport(false);
+                return;
+            }
+            if (!(error instanceof DraftReportStreamUnavailable)) {
                 message.error('Failed to generate draft report. Please try again.');
+                setIsGeneratingReport(false);
+                return;
             }
+        } finally {
+            draftStream.current = null;
+        }
+
+        try {
+            const job = await generateDraftReport(selectedConsultationId).unwrap();
+            setDraftJob({consultation_id: job.consultation_id, job_id: job.id});
         } catch (error) {
             message.error('Failed to generate draft report. Please try again.');
-        } finally {
             setIsGeneratingReport(false);
         }
     };
@@ -154,6 +207,7 @@ const ConsultationManager: React.FC<ConsultationManagerProps> = (props: Consulta
                 title="Review Study"
                 open={reportModalVisible}
                 onCancel={() => {
+                    draftStream.current?.abort();
                     setReportModalVisible(false);
                     form.resetFields();
                 }}
@@ -170,6 +224,7 @@ const ConsultationManager: React.FC<ConsultationManagerProps> = (props: Consulta
                     <Button
                         key="cancel"
                         onClick={() => {
+                            draftStream.current?.abort();
                             setReportModalVisible(false);
                             form.resetFields();
                         }}
@@ -0,0 +1,59 @@
+import {AppConfig} from "../types/constants/AppConfig.ts";
+import {LocalStorageKeys} from "../types/enums/LocalStorageKeys.ts";
+import {DraftReportStreamEvent} from "../types/dtos/ConsultationDto.ts";
+
+export class DraftReportStreamUnavailable extends Error {}
+
+/**
+ * Generates a draft report over the streaming endpoint, calling onToken with each piece of text as the model
+ * produces it, and resolves with the complete draft. EventSource cannot POST or set headers, so the
+ * event stream is read from a fetch body. Rejects with DraftReportStreamUnavailable when the server does not
+ * offer streaming, so callers can fall back to a draft report job.
+ */
+export const streamDraftReport = async (
+    consultationId: string,
+    onToken: (text: string) => void,
+    signal?: AbortSignal,
+): Promise<string> => {
+    const token = localStorage.getItem(LocalStorageKeys.USER_TOKEN);
+    const response = await fetch(`${AppConfig.serverUrl}/consultations/${consultationId}/generate-report/stream`, {
+        method: 'POST',
+        credentials: 'include',
+        headers: token ? {Authorization: `Bearer ${token}`} : {},
+        signal,
+    });
+
+    if (!response.ok || !response.body) {
+        throw new DraftReportStreamUnavailable(`Draft report stream failed with status ${response.status}`);
+    }
+
+    const reader = response.body.pipeThrough(new TextDecoderStream()).getReader();
+    let buffer = '';
+    while (true) {
+        const {value, done} = await reader.read();
+        if (done) {
+            break;
+        }
+
+        buffer += value;
+        const records = buffer.split('\n\n');
+        buffer = records.pop() ?? '';
+        for (const record of records) {
+            const data = record.split('\n').find(line => line.startsWith('data:'));
+            if (!data) {
+                continue;
+            }
+
+            const event = JSON.parse(data.slice(5)) as DraftReportStreamEvent;
+            if (event.type === 'token') {
+                onToken(event.text);
+            } else if (event.type === 'done') {
+                return event.report;
+            } else {
+                throw new Error(event.message);
+            }
+        }
+    }
+
+    throw new Error('Draft report stream ended before the report was complete');
+};
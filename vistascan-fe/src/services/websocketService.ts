@@ -5,9 +5,14 @@ import { adminApi } from '../api/adminApi';
 import { LocalStorageKeys } from '../types/enums/LocalStorageKeys';
 import { UserRole } from '../types/dtos/UserDto';
 import {AppConfig} from "../types/constants/AppConfig.ts";
+import { ConsultationDto, DraftReportJobDto } from '../types/dtos/ConsultationDto';
+
+const PROTOCOL_VERSION = 2;
+
+export type ConsultationSummary = Omit<ConsultationDto, 'download_url'>;
 
 export interface NotificationEvent {
-  event_type: 'consultation_created' | 'consultation_assigned' | 'consultation_status_changed' | 'consultation_completed' | 'consultation_deleted';
+  event_type: 'consultation_created' | 'consultation_assigned' | 'consultation_status_changed' | 'consultation_completed' | 'consultation_deleted' | 'draft_report_ready';
   consultation_id: string;
   patient_id: string;
   expert_id?: string;
@@ -15,6 +20,15 @@ export interface NotificationEvent {
   new_status?: string;
   timestamp: string;
   message: string;
+  seq?: number;
+  consultation?: ConsultationSummary;
+  job?: DraftReportJobDto;
+}
+
+interface ControlMessage {
+  type: 'connected' | 'resync_required' | 'subscriptions' | 'ping';
+  seq?: number;
+  topics?: string[];
 }
 
 class WebSocketService {
@@ -26,6 +40,7 @@ class WebSocketService {
   private heartbeatInterval: ReturnType<typeof setTimeout> | null = null;
   private userRole: UserRole | null = null;
   private userId: string | null = null;
+  private lastSeq: number | null = null;
 
   constructor() {
     this.updateUserInfo();
@@ -54,7 +69,11 @@ class WebSocketService {
       return;
     }
 
-    const wsUrl = `${AppConfig.wsUrl}/${token}`;
+    const params = new URLSearchParams({ version: String(PROTOCOL_VERSION) });
+    if (this.lastSeq !== null) {
+      params.set('last_seq', String(this.lastSeq));
+    }
+    const wsUrl = `${AppConfig.wsUrl}/${token}?${params.toString()}`;
 
     try {
       this.ws = new WebSocket(wsUrl);
@@ -97,6 +116,7 @@ class WebSocketService {
   disconnect(): void {
     console.log('Manually disconnecting WebSocket');
     this.isManualClose = true;
+    this.lastSeq = null;
     this.clearHeartbeat();
 
     if (this.ws) {
@@ -107,24 +127,135 @@ class WebSocketService {
 
   private handleMessage(data: string): void {
     try {
-      if (data === 'pong' || data.includes('Connected to notifications')) {
+      if (data === 'pong') {
+        return;
+      }
+
+      const message = JSON.parse(data);
+      if ('type' in message) {
+        this.handleControlMessage(message as ControlMessage);
         return;
       }
 
-      const event: NotificationEvent = JSON.parse(data);
+      const event = message as NotificationEvent;
       console.log('Received notification:', event);
+      if (event.seq !== undefined) {
+        this.lastSeq = Math.max(this.lastSeq ?? 0, event.seq);
+      }
       this.processNotificationEvent(event);
     } catch (error) {
       console.error('Error parsing WebSocket message:', error, 'Data:', data);
     }
   }
 
+  private handleControlMessage(message: ControlMessage): void {
+    switch (message.type) {
+      case 'ping':
+        if (this.ws?.readyState === WebSocket.OPEN) {
+          this.ws.send('pong');
+        }
+        break;
+
+      case 'connected':
+        if (this.lastSeq === null && message.seq !== undefined) {
+          this.lastSeq = message.seq;
+        }
+        break;
+
+      case 'resync_required':
+        console.log('Missed too many events while disconnected, refreshing all data');
+        this.lastSeq = message.seq ?? null;
+        store.dispatch(consultationApi.util.invalidateTags([
+          'consultationsCache',
+          'allConsultationsCache',
+          'usersCache'
+        ]));
+        break;
+    }
+  }
+
   private processNotificationEvent(event: NotificationEvent): void {
-    this.invalidateRelevantQueries(event);
+    if (event.event_type === 'draft_report_ready') {
+      // Resolves the job the report editor is waiting on without another poll.
+      if (event.job) {
+        store.dispatch(consultationApi.util.upsertQueryData(
+          'getDraftReportJob',
+          { consultation_id: event.job.consultation_id, job_id: event.job.id },
+          event.job
+        ));
+      }
+      return;
+    }
+
+    if (!this.applyConsultationDelta(event)) {
+      this.invalidateRelevantQueries(event);
+    }
 
     this.showNotification(event);
   }
 
+  private applyConsultationDelta(event: NotificationEvent): boolean {
+    const dispatch = store.dispatch;
+    const state = store.getState();
+    const consultationId = event.consultation_id;
+    const summary = event.consultation;
+
+    if (event.event_type === 'consultation_deleted') {
+      const removeFromList = (draft: ConsultationDto[]) => {
+        const index = draft.findIndex(({ id }) => id === consultationId);
+        if (index >= 0) {
+          draft.splice(index, 1);
+        }
+      };
+
+      for (const userId of consultationApi.util.selectCachedArgsForQuery(state, 'getConsultationsByUserId')) {
+        dispatch(consultationApi.util.updateQueryData('getConsultationsByUserId', userId, removeFromList));
+      }
+      for (const status of consultationApi.util.selectCachedArgsForQuery(state, 'getConsultationsByStatus')) {
+        dispatch(consultationApi.util.updateQueryData('getConsultationsByStatus', status, removeFromList));
+      }
+      dispatch(adminApi.util.updateQueryData('getAllConsultations', undefined, removeFromList));
+      dispatch(adminApi.util.invalidateTags(['usersCache']));
+      return true;
+    }
+
+    if (!summary) {
+      return false;
+    }
+
+    const upsert = (draft: ConsultationDto[]) => {
+      const existing = draft.find(({ id }) => id === consultationId);
+      if (existing) {
+        Object.assign(existing, summary);
+      } else {
+        draft.push({ ...summary });
+      }
+    };
+    const remove = (draft: ConsultationDto[]) => {
+      const index = draft.findIndex(({ id }) => id === consultationId);
+      if (index >= 0) {
+        draft.splice(index, 1);
+      }
+    };
+
+    dispatch(consultationApi.util.updateQueryData('getConsultationById', consultationId, (draft) => {
+      Object.assign(draft, summary);
+    }));
+
+    for (const userId of consultationApi.util.selectCachedArgsForQuery(state, 'getConsultationsByUserId')) {
+      const belongsToUser = summary.patient_id === userId || summary.expert_id === userId;
+      dispatch(consultationApi.util.updateQueryData('getConsultationsByUserId', userId, belongsToUser ? upsert : remove));
+    }
+    for (const status of consultationApi.util.selectCachedArgsForQuery(state, 'getConsultationsByStatus')) {
+      const hasStatus = summary.status === status;
+      dispatch(consultationApi.util.updateQueryData('getConsultationsByStatus', status, hasStatus ? upsert : remove));
+    }
+    dispatch(adminApi.util.updateQueryData('getAllConsultations', undefined, upsert));
+
+    console.log('Cache patched for event:', event.event_type);
+    return true;
+  }
+
   private invalidateRelevantQueries(event: NotificationEvent): void {
     const dispatch = store.dispatch;
 
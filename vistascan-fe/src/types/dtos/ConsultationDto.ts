@@ -4,12 +4,21 @@ export enum ConsultationStatus {
     COMPLETED = 'COMPLETED',
 }
 
+export interface StudyMetadata {
+    modality?: string;
+    body_part?: string;
+    rows?: number;
+    columns?: number;
+    study_date?: string;
+}
+
 export interface ImagingStudy {
     file_name: string;
     content_type: string;
     size: number;
     upload_date: string;
     file_path?: string;
+    metadata?: StudyMetadata;
 }
 
 export interface Report {
@@ -40,4 +49,32 @@ export interface SubmitReportRequestDto {
     consultation_id: string;
     content: string;
     expert_id: string;
-}
\ No newline at end of file
+}
+
+export enum DraftReportJobStatus {
+    QUEUED = 'QUEUED',
+    RUNNING = 'RUNNING',
+    SUCCEEDED = 'SUCCEEDED',
+    FAILED = 'FAILED',
+}
+
+export interface DraftReportJobDto {
+    id: string;
+    consultation_id: string;
+    status: DraftReportJobStatus;
+    report?: string;
+    message: string;
+    created_at: string;
+    started_at?: string;
+    finished_at?: string;
+}
+
+export interface DraftReportJobArgs {
+    consultation_id: string;
+    job_id: string;
+}
+
+export type DraftReportStreamEvent =
+    | { type: 'token'; text: string }
+    | { type: 'done'; report: string }
+    | { type: 'error'; message: string };